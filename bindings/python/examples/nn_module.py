@@ -6,58 +6,171 @@ This script demonstrates:
 2. Loading and hashing the model parameters using MrkleTree.
 
 Usage:
-    python toy_demo.py --generate   # Create toy.bt
-    python toy_demo.py --hash       # Load and compute Merkle root
+    python toy_demo.py --generate            # Create toy.bt
+    python toy_demo.py --hash                # Load and compute Merkle root
+    python toy_demo.py --hash --cast fp16    # Hash at reduced precision
 """
 
+from __future__ import annotations
+
 import time
 import argparse
-import torch
-import numpy as np
-from bintensors.numpy import save_file, load_file
+from typing import TYPE_CHECKING, Optional, Union
 from mrkle import MrkleTree
 
+if TYPE_CHECKING:
+    import numpy as np
+    import torch
+
+# torch, numpy and bintensors are imported where they are used, so hashing
+# an existing file never loads torch.
+
 
-class ToyModel(torch.nn.Module):
-    """A simple feedforward model used for demonstration."""
+def build_toy_model(in_feature: int, out_feature: int) -> torch.nn.Module:
+    """Build the simple feedforward model used for demonstration."""
+    import torch
 
-    def __init__(self, in_feature: int, out_feature: int):
-        super().__init__()
-        self.ln = torch.nn.Linear(in_feature, out_feature)
-        self.output = torch.nn.Linear(out_feature, 1)
+    class ToyModel(torch.nn.Module):
+        def __init__(self, in_feature: int, out_feature: int):
+            super().__init__()
+            self.ln = torch.nn.Linear(in_feature, out_feature)
+            self.output = torch.nn.Linear(out_feature, 1)
 
-    def forward(self, x: torch.Tensor):
-        x = self.ln(x)
-        logits = self.output(torch.tanh(x))
-        return logits, torch.sigmoid(x)
+        def forward(self, x: torch.Tensor):
+            x = self.ln(x)
+            logits = self.output(torch.tanh(x))
+            return logits, torch.sigmoid(x)
+
+    return ToyModel(in_feature, out_feature)
+
+
+def staged_to_host(tensors: dict[str, torch.Tensor]) -> dict[str, torch.Tensor]:
+    """
+    Copy device tensors to host memory through two pinned staging buffers.
+
+    Each copy is queued with ``non_blocking=True`` on a side stream into one
+    buffer while the previous tensor is moved out of the other, so transfers
+    overlap with host-side work and only two tensors' worth of memory is ever
+    pinned. CPU tensors pass through as-is.
+    """
+    import torch
+
+    device = [t for t in tensors.values() if t.is_cuda]
+    if not device:
+        return tensors
+
+    nbytes = max(t.numel() * t.element_size() for t in device)
+    staging = [
+        torch.empty(nbytes, dtype=torch.uint8, pin_memory=True) for _ in range(2)
+    ]
+    copied = [torch.cuda.Event(), torch.cuda.Event()]
+    stream = torch.cuda.Stream()
+    # The parameters may still be written by work queued on the current stream.
+    stream.wait_stream(torch.cuda.current_stream())
+
+    def staged_view(slot: int, t: torch.Tensor) -> torch.Tensor:
+        size = t.numel() * t.element_size()
+        return staging[slot][:size].view(t.dtype).view(t.shape)
+
+    staged: dict[str, torch.Tensor] = {}
+    pending: Optional[tuple[str, torch.Tensor, int]] = None
+
+    def drain() -> None:
+        # Wait for the pending copy and move it out of its staging buffer.
+        k, t, slot = pending
+        copied[slot].synchronize()
+        staged[k] = staged_view(slot, t).clone()
+
+    for k, t in tensors.items():
+        if not t.is_cuda:
+            staged[k] = t
+            continue
+
+        slot = 0 if pending is None else 1 - pending[2]
+        with torch.cuda.stream(stream):
+            t = t.contiguous()
+            # `t` can be memory allocated on another stream; mark it as used
+            # here so it is not handed out again before the copy has read it.
+            t.record_stream(stream)
+            staged_view(slot, t).copy_(t, non_blocking=True)
+            copied[slot].record(stream)
+
+        # The previous tensor is moved out while this copy is in flight.
+        if pending is not None:
+            drain()
+        pending = (k, t, slot)
+
+    if pending is not None:
+        drain()
+    return {k: staged[k] for k in tensors}
 
 
 def namespaced_state_dict(model: torch.nn.Module) -> dict[str, np.ndarray]:
     """
     Convert model parameters to a namespaced NumPy dict.
     Example key: "toymodel.ln.weight"
+
+    The returned arrays are views over the tensors' existing (contiguous)
+    CPU storage, so no parameter is copied before it reaches the hasher.
+    Parameters on a GPU are first staged through pinned host memory.
+    """
+    prefix = model.__class__.__name__.lower()
+    state = staged_to_host({k: v.detach() for k, v in model.state_dict().items()})
+    return {f"{prefix}.{k}": v.contiguous().numpy() for k, v in state.items()}
+
+
+def cast_state_dict(
+    state_dict: dict[str, np.ndarray], cast: str
+) -> dict[str, Union[np.ndarray, bytes]]:
+    """
+    Reduce the precision of floating point parameters before hashing.
+
+    The resulting root only identifies the model up to the chosen precision,
+    which is enough for change detection and deduplication while hashing
+    half ("fp16") or a quarter ("int8") of the bytes.
+
+    For "int8", each tensor is quantized with a per-tensor absmax scale and
+    the leaf is ``scale_f32 || quantized_bytes``.
     """
-    state_dict = model.state_dict()
-    return {
-        f"{model.__class__.__name__.lower()}.{k}": v.cpu().numpy()
-        for k, v in state_dict.items()
-    }
+    import numpy as np
+
+    if cast not in ("fp16", "int8"):
+        raise ValueError(f"unsupported cast {cast!r}, expected 'fp16' or 'int8'")
+
+    result: dict[str, Union[np.ndarray, bytes]] = {}
+    for k, v in state_dict.items():
+        if not np.issubdtype(v.dtype, np.floating):
+            result[k] = v
+        elif cast == "fp16":
+            result[k] = v.astype(np.float16)
+        else:
+            absmax = np.float32(np.abs(v).max()) if v.size else np.float32(0)
+            scale = absmax / np.float32(127) if absmax else np.float32(1)
+            quantized = np.clip(np.rint(v / scale), -127, 127).astype(np.int8)
+            result[k] = scale.tobytes() + quantized.tobytes()
+    return result
 
 
 def generate_toy_bt(path: str = "toy.bt"):
     """Generate a binary tensor file for the ToyModel."""
-    model = ToyModel(10, 10)
+    from bintensors.numpy import save_file
+
+    model = build_toy_model(10, 10)
     state = namespaced_state_dict(model)
     save_file(state, path)
     print(f"✅ Generated {path} successfully.")
 
 
-def hash_toy_bt(path: str = "toy.bt"):
+def hash_toy_bt(path: str = "toy.bt", cast: Optional[str] = None):
     """Load toy.bt and compute the Merkle root."""
+    from bintensors.numpy import load_file
+
     print(f"🔍 Loading {path}...")
     start = time.perf_counter()
     state_dict = load_file(path)
-    tree = MrkleTree.from_dict(state_dict, name="sha224", format="flatten")
+    if cast is not None:
+        state_dict = cast_state_dict(state_dict, cast)
+    tree = MrkleTree.from_dict(state_dict, name="blake3", format="flatten")
     elapsed = time.perf_counter() - start
     print(f"⏱ Execution time (load + hash): {elapsed:.5f} seconds")
 
@@ -77,11 +190,17 @@ if __name__ == "__main__":
     parser.add_argument(
         "--hash", action="store_true", help="Compute Merkle hash from toy.bt"
     )
+    parser.add_argument(
+        "--cast",
+        choices=("fp16", "int8"),
+        default=None,
+        help="Reduce parameter precision before hashing",
+    )
     args = parser.parse_args()
 
     if args.generate:
         generate_toy_bt()
     elif args.hash:
-        hash_toy_bt()
+        hash_toy_bt(cast=args.cast)
     else:
         parser.print_help()
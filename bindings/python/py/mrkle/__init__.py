@@ -6,15 +6,13 @@ and generic support for any hashable data type.
 """
 
 from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Final
+
 from ._mrkle_rs import __version__
 
 from . import crypto
-from . import tree
-from . import node
-
-from .node import MrkleNode
-from .tree import MrkleTree, MrkleProof
-from .iter import MrkleTreeIter
 
 from .errors import (
     MerkleError,
@@ -24,6 +22,38 @@ from .errors import (
     ProofError,
 )
 
+if TYPE_CHECKING:
+    from . import tree
+    from . import node
+
+    from .node import MrkleNode
+    from .tree import MrkleTree, MrkleProof
+    from .iter import MrkleTreeIter
+
+# The tree, node and iterator modules are imported on first access (PEP 562),
+# so code that only hashes through ``mrkle.crypto`` never loads them.
+_LAZY_MODULES: Final = frozenset({"tree", "node", "iter"})
+_LAZY_ATTRS: Final = {
+    "MrkleNode": ".node",
+    "MrkleTree": ".tree",
+    "MrkleProof": ".tree",
+    "MrkleTreeIter": ".iter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if (module := _LAZY_ATTRS.get(name)) is not None:
+        value = getattr(importlib.import_module(module, __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_MODULES, *_LAZY_ATTRS})
+
 
 __all__ = [
     "__version__",
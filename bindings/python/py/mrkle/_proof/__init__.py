@@ -1,3 +1,5 @@
+import sys
+
 from mrkle._mrkle_rs import proof
 
 from collections.abc import Mapping
@@ -16,6 +18,7 @@ __all__ = [
     "MrkleProofKeccak512",
     "MrkleProofBlake2b",
     "MrkleProofBlake2s",
+    "MrkleProofBlake3",
     "PROOF_MAP",
     "Proof_T",
 ]
@@ -36,11 +39,14 @@ MrkleProofKeccak512 = proof.MrkleProofKeccak512
 MrkleProofBlake2b = proof.MrkleProofBlake2b
 MrkleProofBlake2s = proof.MrkleProofBlake2s
 
+MrkleProofBlake3 = proof.MrkleProofBlake3
+
 
 Proof_T = type[
     Union[
         MrkleProofBlake2s,
         MrkleProofBlake2b,
+        MrkleProofBlake3,
         MrkleProofKeccak224,
         MrkleProofKeccak256,
         MrkleProofKeccak384,
@@ -53,20 +59,27 @@ Proof_T = type[
     ]
 ]
 
-PROOF_MAP: Final[Mapping[str, Proof_T]] = MappingProxyType(
-    {
-        "blake2s": MrkleProofBlake2s,
-        "blake2b": MrkleProofBlake2b,
-        "blake2s256": MrkleProofBlake2s,
-        "blake2b512": MrkleProofBlake2b,
-        "keccak224": MrkleProofKeccak224,
-        "keccak256": MrkleProofKeccak256,
-        "keccak384": MrkleProofKeccak384,
-        "keccak512": MrkleProofKeccak512,
-        "sha1": MrkleProofSha1,
-        "sha224": MrkleProofSha224,
-        "sha256": MrkleProofSha256,
-        "sha384": MrkleProofSha384,
-        "sha512": MrkleProofSha512,
-    }
-)
+# The raw dict backs internal lookups; the proxy is the public view.
+_PROOF_MAP_RAW: Final[dict[str, Proof_T]] = {
+    sys.intern("blake2s"): MrkleProofBlake2s,
+    sys.intern("blake2b"): MrkleProofBlake2b,
+    sys.intern("blake2s256"): MrkleProofBlake2s,
+    sys.intern("blake2b512"): MrkleProofBlake2b,
+    sys.intern("blake3"): MrkleProofBlake3,
+    sys.intern("keccak224"): MrkleProofKeccak224,
+    sys.intern("keccak256"): MrkleProofKeccak256,
+    sys.intern("keccak384"): MrkleProofKeccak384,
+    sys.intern("keccak512"): MrkleProofKeccak512,
+    sys.intern("sha1"): MrkleProofSha1,
+    sys.intern("sha224"): MrkleProofSha224,
+    sys.intern("sha256"): MrkleProofSha256,
+    sys.intern("sha384"): MrkleProofSha384,
+    sys.intern("sha512"): MrkleProofSha512,
+}
+
+PROOF_MAP: Final[Mapping[str, Proof_T]] = MappingProxyType(_PROOF_MAP_RAW)
+
+# Digest name of every backend proof type.
+_PROOF_DTYPE_NAMES: Final[dict[type, str]] = {
+    cls: cls.dtype().name() for cls in _PROOF_MAP_RAW.values()
+}
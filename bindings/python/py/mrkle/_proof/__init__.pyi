@@ -19,6 +19,7 @@ __all__ = [
     "MrkleProofKeccak512",
     "MrkleProofBlake2b",
     "MrkleProofBlake2s",
+    "MrkleProofBlake3",
     "PROOF_MAP",
     "Proof_T",
 ]
@@ -32,6 +33,18 @@ class BaseMrkleProof:
     def generate(
         cls, tree: MrkleTree, leaves: Union[Sequence[int], slice]
     ) -> "Proof_T": ...
+    @classmethod
+    def generate_range(
+        cls, tree: MrkleTree, start: int, stop: int, step: int
+    ) -> "Proof_T": ...
+    @classmethod
+    def generate_multi(
+        cls, tree: MrkleTree, leaves: Sequence[int]
+    ) -> list["Proof_T"]: ...
+    @classmethod
+    def generate_many(
+        cls, tree: MrkleTree, leaf_sets: Sequence[Sequence[int]]
+    ) -> list["Proof_T"]: ...
     @staticmethod
     def dtype() -> Digest: ...
     def verify(
@@ -40,6 +53,19 @@ class BaseMrkleProof:
             Sequence[str], Sequence[bytes], Sequence[MrkleNode], str, bytes, MrkleNode
         ],
     ) -> bool: ...
+    def verify_batch(
+        self,
+        candidates: Sequence[
+            Union[
+                Sequence[str],
+                Sequence[bytes],
+                Sequence[MrkleNode],
+                str,
+                bytes,
+                MrkleNode,
+            ]
+        ],
+    ) -> list[bool]: ...
     def __len__(self) -> int: ...
     @override
     def __repr__(self) -> str: ...
@@ -65,10 +91,12 @@ class MrkleProofKeccak384(BaseMrkleProof): ...
 class MrkleProofKeccak512(BaseMrkleProof): ...
 class MrkleProofBlake2b(BaseMrkleProof): ...
 class MrkleProofBlake2s(BaseMrkleProof): ...
+class MrkleProofBlake3(BaseMrkleProof): ...
 
 Proof_T: TypeAlias = Union[
     MrkleProofBlake2s,
     MrkleProofBlake2b,
+    MrkleProofBlake3,
     MrkleProofKeccak224,
     MrkleProofKeccak256,
     MrkleProofKeccak384,
@@ -81,3 +109,5 @@ Proof_T: TypeAlias = Union[
 ]
 
 PROOF_MAP: Final[Mapping[str, Proof_T]]
+_PROOF_MAP_RAW: Final[dict[str, Proof_T]]
+_PROOF_DTYPE_NAMES: Final[dict[type, str]]
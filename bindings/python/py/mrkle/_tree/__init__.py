@@ -1,6 +1,7 @@
 """Merkle tree implementations for various hash algorithms."""
 
 from __future__ import annotations
+import sys
 from types import MappingProxyType
 from typing import Final, Union
 
@@ -11,6 +12,7 @@ from mrkle._mrkle_rs import tree
 __all__ = [
     "MrkleTreeBlake2s",
     "MrkleTreeBlake2b",
+    "MrkleTreeBlake3",
     "MrkleTreeKeccak224",
     "MrkleTreeKeccak256",
     "MrkleTreeKeccak384",
@@ -22,6 +24,7 @@ __all__ = [
     "MrkleTreeSha512",
     "MrkleTreeIterBlake2s",
     "MrkleTreeIterBlake2b",
+    "MrkleTreeIterBlake3",
     "MrkleTreeIterKeccak224",
     "MrkleTreeIterKeccak256",
     "MrkleTreeIterKeccak384",
@@ -41,6 +44,7 @@ __all__ = [
 
 MrkleTreeBlake2s = tree.MrkleTreeBlake2s
 MrkleTreeBlake2b = tree.MrkleTreeBlake2b
+MrkleTreeBlake3 = tree.MrkleTreeBlake3
 MrkleTreeKeccak224 = tree.MrkleTreeKeccak224
 MrkleTreeKeccak256 = tree.MrkleTreeKeccak256
 MrkleTreeKeccak384 = tree.MrkleTreeKeccak384
@@ -53,6 +57,7 @@ MrkleTreeSha512 = tree.MrkleTreeSha512
 
 MrkleNodeBlake2s = tree.MrkleNodeBlake2s
 MrkleNodeBlake2b = tree.MrkleNodeBlake2b
+MrkleNodeBlake3 = tree.MrkleNodeBlake3
 MrkleNodeKeccak224 = tree.MrkleNodeKeccak224
 MrkleNodeKeccak256 = tree.MrkleNodeKeccak256
 MrkleNodeKeccak384 = tree.MrkleNodeKeccak384
@@ -66,6 +71,7 @@ MrkleNodeSha512 = tree.MrkleNodeSha512
 # Re-export all iterator types
 MrkleTreeIterBlake2s = tree.MrkleTreeIterBlake2s
 MrkleTreeIterBlake2b = tree.MrkleTreeIterBlake2b
+MrkleTreeIterBlake3 = tree.MrkleTreeIterBlake3
 MrkleTreeIterKeccak224 = tree.MrkleTreeIterKeccak224
 MrkleTreeIterKeccak256 = tree.MrkleTreeIterKeccak256
 MrkleTreeIterKeccak384 = tree.MrkleTreeIterKeccak384
@@ -80,6 +86,7 @@ Node_T = type[
     Union[
         MrkleNodeBlake2s,
         MrkleNodeBlake2b,
+        MrkleNodeBlake3,
         MrkleNodeKeccak224,
         MrkleNodeKeccak256,
         MrkleNodeKeccak384,
@@ -96,6 +103,7 @@ Tree_T = type[
     Union[
         MrkleTreeBlake2s,
         MrkleTreeBlake2b,
+        MrkleTreeBlake3,
         MrkleTreeKeccak224,
         MrkleTreeKeccak256,
         MrkleTreeKeccak384,
@@ -112,6 +120,7 @@ Iterable_T = type[
     Union[
         MrkleTreeIterBlake2s,
         MrkleTreeIterBlake2b,
+        MrkleTreeIterBlake3,
         MrkleTreeIterKeccak224,
         MrkleTreeIterKeccak256,
         MrkleTreeIterKeccak384,
@@ -125,39 +134,51 @@ Iterable_T = type[
 ]
 
 
-TREE_MAP: Final[Mapping[str, Tree_T]] = MappingProxyType(
-    {
-        "blake2s": MrkleTreeBlake2s,
-        "blake2b": MrkleTreeBlake2b,
-        "blake2s256": MrkleTreeBlake2s,
-        "blake2b512": MrkleTreeBlake2b,
-        "keccak224": MrkleTreeKeccak224,
-        "keccak256": MrkleTreeKeccak256,
-        "keccak384": MrkleTreeKeccak384,
-        "keccak512": MrkleTreeKeccak512,
-        "sha1": MrkleTreeSha1,
-        "sha224": MrkleTreeSha224,
-        "sha256": MrkleTreeSha256,
-        "sha384": MrkleTreeSha384,
-        "sha512": MrkleTreeSha512,
-    }
-)
-
-
-NODE_MAP: Final[Mapping[str, Node_T]] = MappingProxyType(
-    {
-        "blake2s": MrkleNodeBlake2s,
-        "blake2b": MrkleNodeBlake2b,
-        "blake2s256": MrkleNodeBlake2s,
-        "blake2b512": MrkleNodeBlake2b,
-        "keccak224": MrkleNodeKeccak224,
-        "keccak256": MrkleNodeKeccak256,
-        "keccak384": MrkleNodeKeccak384,
-        "keccak512": MrkleNodeKeccak512,
-        "sha1": MrkleNodeSha1,
-        "sha224": MrkleNodeSha224,
-        "sha256": MrkleNodeSha256,
-        "sha384": MrkleNodeSha384,
-        "sha512": MrkleNodeSha512,
-    }
-)
+# The raw dicts back internal lookups; the proxies are the public views.
+_TREE_MAP_RAW: Final[dict[str, Tree_T]] = {
+    sys.intern("blake2s"): MrkleTreeBlake2s,
+    sys.intern("blake2b"): MrkleTreeBlake2b,
+    sys.intern("blake2s256"): MrkleTreeBlake2s,
+    sys.intern("blake2b512"): MrkleTreeBlake2b,
+    sys.intern("blake3"): MrkleTreeBlake3,
+    sys.intern("keccak224"): MrkleTreeKeccak224,
+    sys.intern("keccak256"): MrkleTreeKeccak256,
+    sys.intern("keccak384"): MrkleTreeKeccak384,
+    sys.intern("keccak512"): MrkleTreeKeccak512,
+    sys.intern("sha1"): MrkleTreeSha1,
+    sys.intern("sha224"): MrkleTreeSha224,
+    sys.intern("sha256"): MrkleTreeSha256,
+    sys.intern("sha384"): MrkleTreeSha384,
+    sys.intern("sha512"): MrkleTreeSha512,
+}
+
+TREE_MAP: Final[Mapping[str, Tree_T]] = MappingProxyType(_TREE_MAP_RAW)
+
+
+_NODE_MAP_RAW: Final[dict[str, Node_T]] = {
+    sys.intern("blake2s"): MrkleNodeBlake2s,
+    sys.intern("blake2b"): MrkleNodeBlake2b,
+    sys.intern("blake2s256"): MrkleNodeBlake2s,
+    sys.intern("blake2b512"): MrkleNodeBlake2b,
+    sys.intern("blake3"): MrkleNodeBlake3,
+    sys.intern("keccak224"): MrkleNodeKeccak224,
+    sys.intern("keccak256"): MrkleNodeKeccak256,
+    sys.intern("keccak384"): MrkleNodeKeccak384,
+    sys.intern("keccak512"): MrkleNodeKeccak512,
+    sys.intern("sha1"): MrkleNodeSha1,
+    sys.intern("sha224"): MrkleNodeSha224,
+    sys.intern("sha256"): MrkleNodeSha256,
+    sys.intern("sha384"): MrkleNodeSha384,
+    sys.intern("sha512"): MrkleNodeSha512,
+}
+
+NODE_MAP: Final[Mapping[str, Node_T]] = MappingProxyType(_NODE_MAP_RAW)
+
+
+# Digest name of every backend tree and node type.
+_DTYPE_NAMES: Final[dict[type, str]] = {
+    cls: cls.dtype().name() for cls in (*TREE_MAP.values(), *NODE_MAP.values())
+}
+
+# Reads the digest name out of a JSON payload without decoding its tree.
+_json_hash_type = tree.json_hash_type
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import Any, Final, Iterator, Protocol, Union, Literal, Optional
 from typing_extensions import TypeAlias, override
 
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 
 from mrkle.typing import BufferLike as Buffer, File
 from mrkle.crypto.typing import Digest
@@ -16,9 +16,18 @@ class _MrkleTreeBase(Protocol):
     def root(self) -> bytes:
         """Return the root hash as a hex string."""
         ...
+    def root_or_none(self) -> Optional[bytes]:
+        """Return the root hash, or None if the tree is empty."""
+        ...
     def is_empty(self) -> bool:
         """Check if the tree is empty."""
         ...
+    def as_arrays(self) -> tuple[bytes, list[int]]:
+        """Return packed node digests and parent indices in storage order."""
+        ...
+    def leaf_digests(self) -> bytes:
+        """Return packed leaf digests in leaf order."""
+        ...
     def capacity(self) -> int:
         """Return the capacity of the tree."""
         ...
@@ -33,6 +42,11 @@ class _MrkleTreeBase(Protocol):
     def to_string(self) -> str:
         """Return a string representation of the tree structure."""
         ...
+    def write_string(
+        self, write: Callable[[str], Any], chunk_size: int = 65536
+    ) -> None:
+        """Pass the string representation to `write` in chunks."""
+        ...
     def dumps(
         self,
         fp: Optional[File] = None,
@@ -45,7 +59,43 @@ class _MrkleTreeBase(Protocol):
     @staticmethod
     def load(fp: File, format: Literal["json"]) -> "Tree_T": ...
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Tree_T": ...
+    def from_dict(
+        cls, data: dict[str, Any], workers: Optional[int] = None
+    ) -> "Tree_T": ...
+    @classmethod
+    def from_flat_dict(
+        cls, data: dict[str, Any], sep: str = ".", workers: Optional[int] = None
+    ) -> "Tree_T": ...
+    @classmethod
+    def from_packed(
+        cls,
+        data: Union[bytes, bytearray],
+        offsets: bytes,
+        workers: Optional[int] = None,
+    ) -> "Tree_T": ...
+    @classmethod
+    def from_rows(
+        cls,
+        data: Union[bytes, bytearray],
+        width: int,
+        workers: Optional[int] = None,
+    ) -> "Tree_T": ...
+    @classmethod
+    def from_digests(
+        cls,
+        digests: Union[bytes, bytearray, Iterable[Buffer]],
+        workers: Optional[int] = None,
+    ) -> "Tree_T": ...
+    def replace_leaves(
+        self,
+        changes: list[tuple[int, Union[Buffer, str]]],
+        workers: Optional[int] = None,
+    ) -> "Tree_T": ...
+    def rebuild_from_leaves(
+        self,
+        leaves: list[Union[Buffer, str]],
+        workers: Optional[int] = None,
+    ) -> "Tree_T": ...
     @override
     def __eq__(self, other: object) -> bool: ...
     @override
@@ -56,11 +106,15 @@ class MrkleTreeBlake2s(_MrkleTreeBase):
     """Merkle tree using Blake2s hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeBlake2s]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeBlake2s: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -71,17 +125,24 @@ class MrkleTreeIterBlake2s(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterBlake2s: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # Blake2b
 class MrkleTreeBlake2b(_MrkleTreeBase):
     """Merkle tree using Blake2b hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeBlake2b]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeBlake2b: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -92,17 +153,52 @@ class MrkleTreeIterBlake2b(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterBlake2b: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
+
+# Blake3
+class MrkleTreeBlake3(_MrkleTreeBase):
+    """Merkle tree using Blake3 hash algorithm."""
+
+    def leaves(self) -> list[MrkleNodeBlake3]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
+    @staticmethod
+    def dtype() -> Digest: ...
+    @classmethod
+    def from_leaves(
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
+    ) -> MrkleTreeBlake3: ...
+    def __iter__(self) -> Iterable_T: ...
+
+class MrkleTreeIterBlake3(Iterator[Node_T]):
+    """Iterator for Blake3 Merkle tree."""
+
+    @override
+    def __iter__(self) -> MrkleTreeIterBlake3: ...
+    @override
+    def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # Keccak224
 class MrkleTreeKeccak224(_MrkleTreeBase):
     """Merkle tree using Keccak224 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeKeccak224]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeKeccak224: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -113,17 +209,24 @@ class MrkleTreeIterKeccak224(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterKeccak224: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # Keccak256
 class MrkleTreeKeccak256(_MrkleTreeBase):
     """Merkle tree using Keccak256 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeKeccak256]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeKeccak256: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -134,17 +237,24 @@ class MrkleTreeIterKeccak256(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterKeccak256: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # Keccak384
 class MrkleTreeKeccak384(_MrkleTreeBase):
     """Merkle tree using Keccak384 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeKeccak384]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeKeccak384: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -155,17 +265,24 @@ class MrkleTreeIterKeccak384(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterKeccak384: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # Keccak512
 class MrkleTreeKeccak512(_MrkleTreeBase):
     """Merkle tree using Keccak512 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeKeccak512]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeKeccak512: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -176,17 +293,24 @@ class MrkleTreeIterKeccak512(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterKeccak512: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # SHA1
 class MrkleTreeSha1(_MrkleTreeBase):
     """Merkle tree using SHA1 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeSha1]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeSha1: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -197,17 +321,24 @@ class MrkleTreeIterSha1(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterSha1: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # SHA224
 class MrkleTreeSha224(_MrkleTreeBase):
     """Merkle tree using SHA224 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeSha224]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeSha224: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -218,17 +349,24 @@ class MrkleTreeIterSha224(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterSha224: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # SHA256
 class MrkleTreeSha256(_MrkleTreeBase):
     """Merkle tree using SHA256 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeSha256]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeSha256: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -239,17 +377,24 @@ class MrkleTreeIterSha256(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterSha256: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # SHA384
 class MrkleTreeSha384(_MrkleTreeBase):
     """Merkle tree using SHA384 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeSha384]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeSha384: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -260,17 +405,24 @@ class MrkleTreeIterSha384(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterSha384: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 # SHA512
 class MrkleTreeSha512(_MrkleTreeBase):
     """Merkle tree using SHA512 hash algorithm."""
 
     def leaves(self) -> list[MrkleNodeSha512]: ...
+    def leaf_indices(self) -> list[int]: ...
+    def leaves_wrapped(self) -> list[Any]: ...
     @staticmethod
     def dtype() -> Digest: ...
     @classmethod
     def from_leaves(
-        cls, leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]]
+        cls,
+        leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
+        workers: Optional[int] = None,
     ) -> MrkleTreeSha512: ...
     def __iter__(self) -> Iterable_T: ...
 
@@ -281,16 +433,20 @@ class MrkleTreeIterSha512(Iterator[Node_T]):
     def __iter__(self) -> MrkleTreeIterSha512: ...
     @override
     def __next__(self) -> Node_T: ...
+    def drain(self, chunk: int = 4096) -> list[Node_T]: ...
+    def drain_wrapped(self, chunk: int = 4096) -> list[Any]: ...
+    def digests(self) -> bytes: ...
 
 class MrkleNodeBlake2s:
     """Merkle tree node using Blake2s hash algorithm."""
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -311,10 +467,36 @@ class MrkleNodeBlake2b:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
+    @staticmethod
+    def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
+    @staticmethod
+    def dtype() -> Digest: ...
+    def value(self) -> Optional[bytes]: ...
+    def is_leaf(self) -> bool: ...
+    @override
+    def __repr__(self) -> str: ...
+    @override
+    def __str__(self) -> str: ...
+    @override
+    def __eq__(self, other: object) -> bool: ...
+    @override
+    def __hash__(self) -> int: ...
+
+class MrkleNodeBlake3:
+    """Merkle tree node using Blake3 hash algorithm."""
+
+    def digest(self) -> bytes: ...
+    def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
+    def parent(self) -> Optional[int]: ...
+    def children(self) -> Sequence[int]: ...
+    @staticmethod
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake3: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -335,10 +517,11 @@ class MrkleNodeKeccak224:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -359,10 +542,11 @@ class MrkleNodeKeccak256:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -383,10 +567,11 @@ class MrkleNodeKeccak384:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -407,10 +592,11 @@ class MrkleNodeKeccak512:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -431,10 +617,11 @@ class MrkleNodeSha1:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -455,10 +642,11 @@ class MrkleNodeSha224:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -479,10 +667,11 @@ class MrkleNodeSha256:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -503,10 +692,11 @@ class MrkleNodeSha384:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -527,10 +717,11 @@ class MrkleNodeSha512:
 
     def digest(self) -> bytes: ...
     def hexdigest(self) -> str: ...
+    def short_hex(self, n: int) -> str: ...
     def parent(self) -> Optional[int]: ...
     def children(self) -> Sequence[int]: ...
     @staticmethod
-    def leaf(payload: bytes) -> MrkleNodeBlake2s: ...
+    def leaf(payload: Union[Buffer, str]) -> MrkleNodeBlake2s: ...
     @staticmethod
     def leaf_with_digest(payload: bytes, hash: bytes) -> Node_T: ...
     @staticmethod
@@ -549,6 +740,7 @@ class MrkleNodeSha512:
 Node_T: TypeAlias = Union[
     MrkleNodeBlake2s,
     MrkleNodeBlake2b,
+    MrkleNodeBlake3,
     MrkleNodeKeccak224,
     MrkleNodeKeccak256,
     MrkleNodeKeccak384,
@@ -563,6 +755,7 @@ Node_T: TypeAlias = Union[
 Tree_T: TypeAlias = Union[
     MrkleTreeBlake2s,
     MrkleTreeBlake2b,
+    MrkleTreeBlake3,
     MrkleTreeKeccak224,
     MrkleTreeKeccak256,
     MrkleTreeKeccak384,
@@ -577,6 +770,7 @@ Tree_T: TypeAlias = Union[
 Iterable_T: TypeAlias = Union[
     MrkleTreeIterBlake2s,
     MrkleTreeIterBlake2b,
+    MrkleTreeIterBlake3,
     MrkleTreeIterKeccak224,
     MrkleTreeIterKeccak256,
     MrkleTreeIterKeccak384,
@@ -590,3 +784,10 @@ Iterable_T: TypeAlias = Union[
 
 TREE_MAP: Final[dict[str, Tree_T]]
 NODE_MAP: Final[dict[str, Node_T]]
+_TREE_MAP_RAW: Final[dict[str, Tree_T]]
+_NODE_MAP_RAW: Final[dict[str, Node_T]]
+_DTYPE_NAMES: Final[dict[type, str]]
+
+def _json_hash_type(data: Union[str, bytes]) -> Optional[str]:
+    """Return the `hash_type` of a JSON-serialized tree without decoding it."""
+    ...
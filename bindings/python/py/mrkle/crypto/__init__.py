@@ -3,18 +3,20 @@ Cryptographic digest definitions and utility functions for
 Merkle trees, nodes and proofs.
 
 This module provides common cryptographic
-hash algorithms (SHA, SHA3/Keccak, BLAKE2) and helper
+hash algorithms (SHA, SHA3/Keccak, BLAKE2, BLAKE3) and helper
 functions to create digest objects by name.
 """
 
 from __future__ import annotations
 
+import sys
 from types import MappingProxyType
-from collections.abc import Mapping, Set
+from collections.abc import Mapping, Sequence, Set
 from typing import Optional, Final
 
 from mrkle._mrkle_rs import crypto
 from mrkle.crypto.typing import Digest
+from mrkle.typing import BufferLike as Buffer
 
 Digest_T = type[Digest]
 
@@ -31,6 +33,7 @@ __all__ = [
     "Keccak512",
     "Blake2s",
     "Blake2b",
+    "Blake3",
     "sha1",
     "sha224",
     "sha256",
@@ -42,6 +45,8 @@ __all__ = [
     "keccak512",
     "blake2b",
     "blake2s",
+    "blake3",
+    "sha256_batch",
     "Digest",
     "Digest_T",
 ]
@@ -66,115 +71,54 @@ Keccak512 = crypto.keccak512
 Blake2s = crypto.blake2s256
 Blake2b = crypto.blake2b512
 
-# READ-ONLY ACCESS
-_algorithms_map: Final[Mapping[str, Digest_T]] = MappingProxyType(
+# BLAKE3
+Blake3 = crypto.blake3
+
+# Built from the backend's registry so names can not drift from the Rust
+# classes. The raw dict backs internal lookups; the proxy is the public view.
+_ALGORITHMS_RAW: Final[dict[str, Digest_T]] = {
+    sys.intern(name): getattr(crypto, name) for name in crypto.registered_algorithms()
+}
+_ALGORITHMS_RAW.update(
     {
-        "blake2s": Blake2s,
-        "blake2b": Blake2b,
-        "blake2b512": Blake2b,
-        "blake2s256": Blake2s,
-        "keccak224": Keccak224,
-        "keccak256": Keccak256,
-        "keccak384": Keccak384,
-        "keccak512": Keccak512,
-        "sha1": Sha1,
-        "sha224": Sha224,
-        "sha256": Sha256,
-        "sha384": Sha384,
-        "sha512": Sha512,
+        sys.intern(alias): _ALGORITHMS_RAW[name]
+        for alias, name in crypto.algorithm_aliases().items()
     }
 )
 
+# READ-ONLY ACCESS
+_algorithms_map: Final[Mapping[str, Digest_T]] = MappingProxyType(_ALGORITHMS_RAW)
 
-def sha1(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-1 hash object."""
-    digest: Digest = _algorithms_map["sha1"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def sha224(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-224 hash object."""
-    digest = _algorithms_map["sha224"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def sha256(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-256 hash object."""
-    digest = _algorithms_map["sha256"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def sha384(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-384 hash object."""
-    digest = _algorithms_map["sha384"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def sha512(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-512 hash object."""
-    digest = _algorithms_map["sha512"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def keccak224(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-224 hash object."""
-    digest = _algorithms_map["keccak224"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def keccak256(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-256 hash object."""
-    digest = _algorithms_map["keccak256"]()
-    if data is not None:
-        digest.update(data)
-    return digest
-
-
-def keccak384(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-384 hash object."""
-    digest = _algorithms_map["keccak384"]()
-    if data is not None:
-        digest.update(data)
-    return digest
+_ALGS: Final[frozenset[str]] = frozenset(_ALGORITHMS_RAW)
 
 
-def keccak512(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-512 hash object."""
-    digest = _algorithms_map["keccak512"]()
-    if data is not None:
-        digest.update(data)
-    return digest
+sha1 = Sha1
+sha224 = Sha224
+sha256 = Sha256
+sha384 = Sha384
+sha512 = Sha512
+keccak224 = Keccak224
+keccak256 = Keccak256
+keccak384 = Keccak384
+keccak512 = Keccak512
+blake2b = Blake2b
+blake2s = Blake2s
+blake3 = Blake3
 
 
-def blake2b(data: Optional[bytes] = None) -> Digest:
-    """Create a BLAKE2b hash object."""
-    digest = _algorithms_map["blake2b"]()
-    if data is not None:
-        digest.update(data)
-    return digest
+def sha256_batch(buffers: Sequence[Buffer]) -> list[bytes]:
+    """Compute the SHA-256 digest of many independent buffers in one call.
 
+    Args:
+        buffers (Sequence[Buffer]): The buffers to hash.
 
-def blake2s(data: Optional[bytes] = None) -> Digest:
-    """Create a BLAKE2s hash object."""
-    digest = _algorithms_map["blake2s"]()
-    if data is not None:
-        digest.update(data)
-    return digest
+    Returns:
+        list[bytes]: One digest per buffer, in input order.
+    """
+    return Sha256.digest_batch(buffers)
 
 
-def new(name: str, *, data: Optional[bytes] = None) -> Digest:
+def new(name: str, data: Optional[bytes] = None) -> Digest:
     """Create a new digest object by algorithm name.
 
     Args:
@@ -187,28 +131,26 @@ def new(name: str, *, data: Optional[bytes] = None) -> Digest:
     Raises:
         ValueError: If the algorithm name is not supported.
     """
-    if digest := _algorithms_map.get(name.lower()):
-        d = digest()
-        if data is not None:
-            d.update(data)
-        return d
-    else:
-        raise ValueError(f"{name} is not a supported digest.")
+    # A fresh hasher every time: digests carry update() state, so they can
+    # not be cached and shared between callers.
+    if digest := _ALGORITHMS_RAW.get(name) or _ALGORITHMS_RAW.get(name.lower()):
+        return digest(data)
+    raise ValueError(f"{name} is not a supported digest.")
 
 
 def algorithms_guaranteed() -> Set[str]:
     """Return the set of digest algorithm names guaranteed to be available.
 
     Returns:
-        Set[str]: A set of algorithm names as strings.
+        Set[str]: An immutable set of algorithm names as strings.
     """
-    return set(_algorithms_map.keys())
+    return _ALGS
 
 
 def algorithms_available() -> Set[str]:
     """Return the set of digest algorithms currently available.
 
     Returns:
-        Set[str]: A set of available algorithm names as strings.
+        Set[str]: An immutable set of available algorithm names as strings.
     """
-    return algorithms_guaranteed()
+    return _ALGS
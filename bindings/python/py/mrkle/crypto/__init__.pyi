@@ -3,7 +3,7 @@ Type stubs for cryptographic digest definitions and utility functions for
 Merkle trees, nodes and proofs.
 
 This module provides common cryptographic
-hash algorithms (SHA, SHA3/Keccak, BLAKE2) and helper
+hash algorithms (SHA, SHA3/Keccak, BLAKE2, BLAKE3) and helper
 functions to create digest objects by name.
 """
 
@@ -11,24 +11,29 @@ from __future__ import annotations
 
 from typing import Optional
 from typing_extensions import override
-from collections.abc import Set
+from collections.abc import Sequence, Set
 
 from mrkle.crypto.typing import Digest
+from mrkle.typing import BufferLike as Buffer
 
 # SHA-1
 class Sha1:
     """SHA-1 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Sha1: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Sha1: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -47,16 +52,20 @@ class Sha1:
 class Sha224:
     """SHA-224 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Sha224: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Sha224: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -75,16 +84,20 @@ class Sha224:
 class Sha256:
     """SHA-256 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Sha256: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Sha256: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -103,16 +116,20 @@ class Sha256:
 class Sha384:
     """SHA-384 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Sha384: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Sha384: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -131,16 +148,20 @@ class Sha384:
 class Sha512:
     """SHA-512 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Sha512: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Sha512: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -159,16 +180,20 @@ class Sha512:
 class Keccak224:
     """Keccak-224 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Keccak224: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Keccak224: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -187,16 +212,20 @@ class Keccak224:
 class Keccak256:
     """Keccak-256 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Keccak256: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Keccak256: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -215,16 +244,20 @@ class Keccak256:
 class Keccak384:
     """Keccak-384 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Keccak384: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Keccak384: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -243,16 +276,20 @@ class Keccak384:
 class Keccak512:
     """Keccak-512 digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Keccak512: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Keccak512: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -271,16 +308,20 @@ class Keccak512:
 class Blake2s:
     """BLAKE2s digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Blake2s: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Blake2s: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -299,16 +340,20 @@ class Blake2s:
 class Blake2b:
     """BLAKE2b digest class."""
 
-    def __init__(self) -> None: ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
     @staticmethod
     def new_with_prefix(data: bytes) -> Blake2b: ...
     def update(self, data: bytes) -> None: ...
     def finalize(self) -> bytes: ...
     def finalize_reset(self) -> bytes: ...
     def reset(self) -> None: ...
+    def copy(self) -> Blake2b: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
     @staticmethod
     def digest(data: bytes) -> bytes: ...
     @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
     def output_size() -> int: ...
     @staticmethod
     def name() -> str: ...
@@ -323,51 +368,56 @@ class Blake2b:
     @override
     def __hash__(self) -> int: ...
 
-def sha1(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-1 hash object."""
-    ...
-
-def sha224(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-224 hash object."""
-    ...
-
-def sha256(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-256 hash object."""
-    ...
-
-def sha384(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-384 hash object."""
-    ...
-
-def sha512(data: Optional[bytes] = None) -> Digest:
-    """Create a SHA-512 hash object."""
-    ...
-
-def keccak224(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-224 hash object."""
-    ...
-
-def keccak256(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-256 hash object."""
-    ...
-
-def keccak384(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-384 hash object."""
-    ...
+# Blake3
+class Blake3:
+    """BLAKE3 digest class."""
 
-def keccak512(data: Optional[bytes] = None) -> Digest:
-    """Create a Keccak-512 hash object."""
-    ...
-
-def blake2b(data: Optional[bytes] = None) -> Digest:
-    """Create a BLAKE2b hash object."""
-    ...
+    def __init__(self, data: Optional[bytes] = None) -> None: ...
+    @staticmethod
+    def new_with_prefix(data: bytes) -> Blake3: ...
+    def update(self, data: bytes) -> None: ...
+    def finalize(self) -> bytes: ...
+    def finalize_reset(self) -> bytes: ...
+    def reset(self) -> None: ...
+    def copy(self) -> Blake3: ...
+    def finalize_batch(self, buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
+    def digest(data: bytes) -> bytes: ...
+    @staticmethod
+    def digest_batch(buffers: Sequence[Buffer]) -> list[bytes]: ...
+    @staticmethod
+    def output_size() -> int: ...
+    @staticmethod
+    def name() -> str: ...
+    @override
+    def __repr__(self) -> str: ...
+    @override
+    def __str__(self) -> str: ...
+    @override
+    def __format__(self, spec: str) -> str: ...
+    @override
+    def __eq__(self, other: object) -> bool: ...
+    @override
+    def __hash__(self) -> int: ...
 
-def blake2s(data: Optional[bytes] = None) -> Digest:
-    """Create a BLAKE2s hash object."""
+sha1 = Sha1
+sha224 = Sha224
+sha256 = Sha256
+sha384 = Sha384
+sha512 = Sha512
+keccak224 = Keccak224
+keccak256 = Keccak256
+keccak384 = Keccak384
+keccak512 = Keccak512
+blake2b = Blake2b
+blake2s = Blake2s
+blake3 = Blake3
+
+def sha256_batch(buffers: Sequence[Buffer]) -> list[bytes]:
+    """Compute the SHA-256 digest of many independent buffers in one call."""
     ...
 
-def new(name: str, *, data: Optional[bytes] = None) -> Digest:
+def new(name: str, data: Optional[bytes] = None) -> Digest:
     """Create a new digest object by algorithm name.
 
     Args:
@@ -386,7 +436,7 @@ def algorithms_guaranteed() -> Set[str]:
     """Return the set of digest algorithm names guaranteed to be available.
 
     Returns:
-        Set[str]: A set of algorithm names as strings.
+        Set[str]: An immutable set of algorithm names as strings.
     """
     ...
 
@@ -394,6 +444,6 @@ def algorithms_available() -> Set[str]:
     """Return the set of digest algorithms currently available.
 
     Returns:
-        Set[str]: A set of available algorithm names as strings.
+        Set[str]: An immutable set of available algorithm names as strings.
     """
     ...
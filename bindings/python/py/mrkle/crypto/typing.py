@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
 
@@ -15,6 +16,12 @@ class Digest(Protocol):
     def reset(self) -> None:
         ...
 
+    def copy(self) -> "Digest":
+        ...
+
+    def finalize_batch(self, buffers: Sequence[bytes]) -> list[bytes]:
+        ...
+
     @staticmethod
     def new_with_prefix(data: bytes) -> "Digest":
         ...
@@ -27,6 +34,10 @@ class Digest(Protocol):
     def digest(data: bytes) -> bytes:
         ...
 
+    @staticmethod
+    def digest_batch(buffers: Sequence[bytes]) -> list[bytes]:
+        ...
+
     @staticmethod
     def name() -> str:
         ...
@@ -1,16 +1,20 @@
 from __future__ import annotations
+from collections import deque
 from collections.abc import Iterator
-from typing import final
+from typing import Final, final
 
 from mrkle.crypto import new
-from typing_extensions import override
+from mrkle.typing import override
 
-from mrkle._tree import Tree_T, Iterable_T
+from mrkle._tree import Tree_T, Iterable_T, _DTYPE_NAMES
 
 from mrkle.node import MrkleNode
 
 from mrkle.crypto.typing import Digest
 
+_DRAIN_FIRST: Final[int] = 64
+_DRAIN_CHUNK: Final[int] = 4096
+
 
 @final
 class MrkleTreeIter(Iterator[MrkleNode]):
@@ -28,15 +32,23 @@ class MrkleTreeIter(Iterator[MrkleNode]):
         MrkleNode(id=5b6d, leaf=False, dtype=Sha256())
         MrkleNode(id=5b41, leaf=True, dtype=Sha256())
         MrkleNode(id=d98c, leaf=True, dtype=Sha256())
+
+    Note:
+        Yielding nodes one at a time builds a ``MrkleNode`` per node; use
+        ``digests()`` when only the digest bytes are needed.
     """
 
     _inner: Iterable_T
     _dtype_name: str
-    __slots__ = ("_inner", "_dtype_name")
+    _buffer: deque[MrkleNode]
+    _batch: int
+    __slots__ = ("_inner", "_dtype_name", "_buffer", "_batch")
 
     def __init__(self, tree: Tree_T) -> None:
-        self._dtype_name = tree.dtype().name()
+        self._dtype_name = _DTYPE_NAMES[type(tree)]
         self._inner = tree.__iter__()
+        self._buffer = deque()
+        self._batch = _DRAIN_FIRST
 
     @classmethod
     def from_tree(cls, _tree: Tree_T) -> "MrkleTreeIter":
@@ -56,8 +68,10 @@ class MrkleTreeIter(Iterator[MrkleNode]):
             <sha256 mrkle.tree.MrkleNode object at 0x...>
         """
         obj = object.__new__(cls)
-        object.__setattr__(obj, "_inner", _tree.__iter__())
-        object.__setattr__(obj, "_dtype_name", _tree.dtype().name())
+        obj._inner = _tree.__iter__()
+        obj._dtype_name = _DTYPE_NAMES[type(_tree)]
+        obj._buffer = deque()
+        obj._batch = _DRAIN_FIRST
         return obj
 
     def dtype(self) -> Digest:
@@ -72,20 +86,39 @@ class MrkleTreeIter(Iterator[MrkleNode]):
     def __iter__(self) -> "MrkleTreeIter":
         return self
 
+    def digests(self) -> bytes:
+        """Consume the iterator, returning only the remaining node digests.
+
+        The digests are packed back to back in breadth-first order. This is
+        much faster than ``__next__``, which builds a ``MrkleNode`` per node.
+
+        Returns:
+            bytes: The concatenated digests of every node not yet yielded.
+        """
+        buffer = self._buffer
+        if not buffer:
+            return self._inner.digests()
+        buffered = b"".join([node.digest() for node in buffer])
+        buffer.clear()
+        return buffered + self._inner.digests()
+
     @override
     def __next__(
         self,
     ) -> "MrkleNode":
-        if node := next(self._inner):
-            return MrkleNode(node)
-        else:
-            raise StopIteration
+        buffer = self._buffer
+        if not buffer:
+            batch = self._batch
+            buffer.extend(self._inner.drain_wrapped(batch))
+            if not buffer:
+                raise StopIteration
+            if batch < _DRAIN_CHUNK:
+                self._batch = batch * 2
+        return buffer.popleft()
 
     @override
     def __repr__(self) -> str:
-        return (
-            f"<{self._dtype_name} mrkle.iter.MrkleTreeIter object at {hex(id(self))}>"
-        )
+        return f"<{self._dtype_name} mrkle.iter.MrkleTreeIter object at {id(self):#x}>"
 
     @override
     def __str__(self) -> str:
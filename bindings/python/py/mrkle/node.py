@@ -2,20 +2,63 @@ from __future__ import annotations
 
 from array import array
 from collections.abc import Sequence
-from typing_extensions import override
 
 from mrkle.crypto import new
 from mrkle.crypto.typing import Digest
 
-from mrkle.typing import BufferLike as Buffer
+from mrkle.typing import BufferLike as Buffer, override
 
-from mrkle._tree import Node_T, NODE_MAP
+from mrkle._tree import Node_T, _NODE_MAP_RAW, _DTYPE_NAMES
 
-from typing import Any, Union, Optional, final
+from typing import Any, Final, Union, Optional, final
 
 
 __all__ = ["MrkleNode"]
 
+# Leaf data types the backend converts itself.
+_PASSTHROUGH_TYPES: Final = (str, bytes, bytearray, memoryview, array)
+
+
+def _make_leaf(
+    data: Union[Buffer, str],
+    *,
+    name: Optional[str] = None,
+    _node_map=_NODE_MAP_RAW,
+    _passthrough=_PASSTHROUGH_TYPES,
+    _bytes=bytes,
+    _new=object.__new__,
+) -> "MrkleNode":
+    """Create a leaf node from input data.
+
+    Args:
+        data: The input data buffer or string to hash for the leaf node.
+        name: The digest algorithm name (default: "sha1").
+
+    Returns:
+        MrkleNode: A new leaf node containing the hashed value.
+
+    Raises:
+        ValueError: Raised when the digest algorithm is not supported.
+        UnicodeEncodeError: Raised when string is not utf-8 supported.
+    """
+    if name is None:
+        name = "sha1"
+
+    if type(data) is _bytes or isinstance(data, _passthrough):
+        buffer = data
+    else:
+        try:
+            buffer = _bytes(data)
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"Cannot convert {type(data).__name__} to bytes. ") from e
+
+    if inner := _node_map.get(name) or _node_map.get(name.lower()):
+        obj = _new(MrkleNode)
+        _set_inner(obj, inner.leaf(buffer))
+        return obj
+    else:
+        raise ValueError(f"{name} is not digested that a supported with in MrkleNode.")
+
 
 @final
 class MrkleNode:
@@ -39,15 +82,11 @@ class MrkleNode:
     """
 
     _inner: Node_T
-    _dtype_name: str
-    __slots__ = (
-        "_inner",
-        "_dtype_name",
-    )
+    _hash: int
+    __slots__ = ("_inner", "_hash")
 
     def __init__(self, node: Node_T, *args, **kwargs) -> None:
         self._inner = node
-        self._dtype_name = node.dtype().name()
 
     @classmethod
     def construct_from_node(cls, node: Node_T, **kwargs: dict[str, Any]) -> MrkleNode:
@@ -61,11 +100,14 @@ class MrkleNode:
 
         """
         obj = object.__new__(cls)
-        object.__setattr__(obj, "_inner", node)
-        object.__setattr__(obj, "_dtype_name", node.dtype().name())
+        _set_inner(obj, node)
 
         return obj
 
+    @property
+    def _dtype_name(self) -> str:
+        return _DTYPE_NAMES[type(self._inner)]
+
     def parent(self) -> Optional[int]:
         """Return parent index within the tree."""
         return self._inner.parent()
@@ -86,52 +128,7 @@ class MrkleNode:
         """Return hexidecimal digested bytes from the crypto digest."""
         return self._inner.hexdigest()
 
-    @classmethod
-    def leaf(
-        cls, data: Union[Buffer, str], *, name: Optional[str] = None
-    ) -> "MrkleNode":
-        """Create a leaf node from input data.
-
-        Args:
-            data: The input data buffer or string to hash for the leaf node.
-            name: The digest algorithm name (default: "sha1").
-
-        Returns:
-            MrkleNode: A new leaf node containing the hashed value.
-
-        Raises:
-            ValueError: Raised when the digest algorithm is not supported.
-            UnicodeEncodeError: Raised when string is not utf-8 supported.
-        """
-        if name is None:
-            name = "sha1"
-
-        if isinstance(data, str):
-            buffer = data.encode("utf-8")
-        elif isinstance(data, (bytes, bytearray)):
-            buffer = bytes(data)
-        elif isinstance(data, memoryview):
-            buffer = data.tobytes()
-        elif isinstance(data, array):
-            buffer = data.tobytes()
-        else:
-            try:
-                buffer = bytes(data)
-            except (TypeError, ValueError) as e:
-                raise TypeError(
-                    f"Cannot convert {type(data).__name__} to bytes. "
-                ) from e
-
-        digest: Digest = new(name, data=buffer)
-        value = digest.finalize_reset()
-
-        if inner := NODE_MAP.get(name.lower()):
-            node: Node_T = inner.leaf_with_digest(buffer, value)
-            return cls.construct_from_node(node)
-        else:
-            raise ValueError(
-                f"{name} is not digested that a supported with in MrkleNode."
-            )
+    leaf = staticmethod(_make_leaf)
 
     def is_leaf(self) -> bool:
         """Check whether this node is a leaf node.
@@ -152,7 +149,7 @@ class MrkleNode:
         Raises:
             AttributeError: Always, since MrkleNode objects are immutable.
         """
-        if name in {"_inner", "_dtype_name"}:
+        if name == "_inner":
             if getattr(self, name, None) is None:
                 object.__setattr__(self, name, value)
                 return
@@ -176,7 +173,7 @@ class MrkleNode:
         Returns:
             str: Representation including the digest type and object id.
         """
-        return f"<{self._dtype_name} mrkle.tree.MrkleNode object at {hex(id(self))}>"
+        return f"<{self._dtype_name} mrkle.tree.MrkleNode object at {id(self):#x}>"
 
     @override
     def __str__(self) -> str:
@@ -185,11 +182,8 @@ class MrkleNode:
         Returns:
             str: Basic repersentation of MrkleNode.
         """
-        id: str = self._inner.hexdigest()
-        return (
-            f"MrkleNode(id={id[0 : min(len(id), 4)]}, "
-            f"leaf={self.is_leaf()}, dtype={self._dtype_name})"
-        )
+        id: str = self._inner.short_hex(2)
+        return f"MrkleNode(id={id}, leaf={self.is_leaf()}, dtype={self._dtype_name})"
 
     @override
     def __eq__(self, other: object) -> bool:
@@ -201,13 +195,28 @@ class MrkleNode:
         Returns:
             bool: True if `other` is a MrkleNode with the same underlying node.
         """
+        if self is other:
+            return True
         if not isinstance(other, MrkleNode):
             return NotImplemented
-        if type(self._inner) is not type(other._inner):
-            return False
-        return self._inner == other._inner
+
+        inner, other_inner = self._inner, other._inner
+        return type(inner) is type(other_inner) and inner == other_inner
 
     @override
     def __hash__(self) -> int:
         """Compute the hash of the node for use in sets or dict keys."""
-        return hash(self.digest())
+        # __setattr__ refuses every write, so the hash is cached through the
+        # slot descriptor.
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash(self._inner)
+            _set_hash(self, value)
+            return value
+
+
+# construct_from_node writes the slot of a fresh object through its member
+# descriptor, bypassing the immutability guard in __setattr__.
+_set_inner = MrkleNode.__dict__["_inner"].__set__
+_set_hash = MrkleNode.__dict__["_hash"].__set__
@@ -1,36 +1,117 @@
 from __future__ import annotations
 
-import json
+import io
+import sys
 
-from collections.abc import Iterator, Iterable, Sequence
+from array import array
+from collections.abc import Iterator, Iterable, Mapping, Sequence
 
 from typing import (
     Any,
+    Final,
     Literal,
     Union,
     Optional,
     final,
     overload,
 )
-from typing_extensions import override
 
 from mrkle.crypto import new
 from mrkle.crypto.typing import Digest
 
-from mrkle.utils import unflatten
-from mrkle.typing import BufferLike as Buffer, File
+from mrkle.typing import BufferLike as Buffer, File, override
 
 from mrkle.iter import MrkleTreeIter
 from mrkle.node import MrkleNode
 
 from mrkle.errors import TreeError
 
-from mrkle._proof import Proof_T, PROOF_MAP
-from mrkle._tree import Node_T, Tree_T, TREE_MAP
+from mrkle._proof import Proof_T, _PROOF_MAP_RAW, _PROOF_DTYPE_NAMES
+from mrkle._tree import Tree_T, _TREE_MAP_RAW, _DTYPE_NAMES, _json_hash_type
 
 
 __all__ = ["MrkleTree", "MrkleProof"]
 
+# Backend tree classes accepted by MrkleTree.__init__.
+_TREE_TYPES: Final = frozenset(_TREE_MAP_RAW.values())
+
+# The proof backend matching each tree backend.
+_PROOF_FOR_TREE: Final = {
+    tree: _PROOF_MAP_RAW[name]
+    for name, tree in _TREE_MAP_RAW.items()
+    if name in _PROOF_MAP_RAW
+}
+
+# Buffer formats of native 64-bit integers, which from_packed hands to the
+# backend as raw bytes. NumPy int64 arrays report "l" on most platforms.
+_OFFSET_FORMATS: Final = frozenset(("q", "Q", "l", "L"))
+
+# Serialization formats the backend decodes; it only speaks JSON for now.
+_SERIAL_FORMATS: Final = frozenset(("json",))
+
+
+def _check_format(format: str) -> None:
+    if format not in _SERIAL_FORMATS:
+        raise ValueError(f"{format!r} is not a supported serialization format.")
+
+
+@final
+class _LeafView(Sequence[MrkleNode]):
+    """Read-only sequence of a tree's leaf nodes.
+
+    Only the leaf positions are fetched up front; each ``MrkleNode`` is
+    built from the backend when it is accessed.
+    """
+
+    _inner: Tree_T
+    _indices: list[int]
+    __slots__ = ("_inner", "_indices")
+
+    def __init__(self, tree: Tree_T) -> None:
+        self._inner = tree
+        self._indices = tree.leaf_indices()
+
+    @overload
+    def __getitem__(self, key: int) -> MrkleNode:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> list[MrkleNode]:
+        ...
+
+    @override
+    def __getitem__(self, key: Union[int, slice]) -> Union[list[MrkleNode], MrkleNode]:
+        return self._inner[self._indices[key]]
+
+    @override
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @override
+    def __iter__(self) -> Iterator[MrkleNode]:
+        return iter(self._inner.leaves_wrapped())
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        # Leaves of trees with different digests never match.
+        if type(other) is _LeafView and type(self._inner) is not type(other._inner):
+            return False
+        if type(other) is not list:
+            other = list(other)
+        return self._inner.leaves_wrapped() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @override
+    def __repr__(self) -> str:
+        return f"<mrkle.tree leaf view of {len(self)} nodes>"
+
 
 @final
 class MrkleTree:
@@ -43,6 +124,7 @@ class MrkleTree:
 
     Attributes:
         _inner (Tree_T): The underlying Rust-based Merkle tree instance.
+        _hash (int): The hash of the tree, stored on first use.
 
     Examples:
         >>> from mrkle.tree import MrkleTree
@@ -54,7 +136,9 @@ class MrkleTree:
     """
 
     _inner: Tree_T
-    __slots__ = "_inner"
+    _hash: int
+    _root: Optional[bytes]
+    __slots__ = ("_inner", "_hash", "_root")
 
     def __init__(self, tree: Tree_T) -> None:
         """Initialize a MrkleTree instance.
@@ -62,7 +146,11 @@ class MrkleTree:
         Args:
             tree (Tree_T): The underlying Rust-based tree instance.
 
+        Raises:
+            TypeError: If ``tree`` is not a backend tree.
         """
+        if type(tree) not in _TREE_TYPES:
+            raise TypeError(f"Expected a backend tree, got {type(tree).__name__}.")
         self._inner = tree
 
     def root(self) -> Optional[bytes]:
@@ -84,9 +172,10 @@ class MrkleTree:
             True
         """
         try:
-            return self._inner.root()
-        except TreeError:
-            return None
+            return self._root
+        except AttributeError:
+            self._root = root = self._inner.root_or_none()
+            return root
 
     def try_root(self) -> bytes:
         """Return the root hash as bytes.
@@ -103,14 +192,20 @@ class MrkleTree:
             >>> isinstance(root, bytes)
             True
         """
+        # Only an empty tree reaches the backend, which raises the TreeError.
+        if (root := self.root()) is not None:
+            return root
         return self._inner.root()
 
-    def leaves(self) -> list["MrkleNode"]:
-        """Return a list of all leaf nodes in the tree.
+    def leaves(self) -> Sequence["MrkleNode"]:
+        """Return a read-only sequence of all leaf nodes in the tree.
+
+        Nodes are wrapped lazily as they are accessed, so only the leaves
+        that are actually read are copied out of the backend.
 
         Returns:
-            list[MrkleNode]: A list containing all leaf nodes with the
-                same digest type as the tree.
+            Sequence[MrkleNode]: All leaf nodes with the same digest type
+                as the tree, in tree order.
 
         Examples:
             >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
@@ -120,21 +215,56 @@ class MrkleTree:
             >>> all(leaf.is_leaf() for leaf in leaves)
             True
         """
-        return list(
-            map(
-                self._construct_mrkle_node,
-                self._inner.leaves(),
-            )
-        )
+        return _LeafView(self._inner)
 
-    @staticmethod
-    def _construct_mrkle_node(inner: Node_T) -> "MrkleNode":
-        return MrkleNode.construct_from_node(inner)
+    def leaf_digests(self) -> bytes:
+        """Return every leaf digest as one contiguous buffer.
+
+        Row ``i`` of the buffer is the digest of leaf ``i`` in tree order, so
+        it holds ``len(tree.leaves()) * tree.dtype().output_size()`` bytes.
+        The digests are copied out in a single backend call, without a
+        ``MrkleNode`` per leaf.
+
+        Returns:
+            bytes: The packed leaf digests.
+
+        Examples:
+            >>> import numpy as np
+            >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"], name="sha256")
+            >>> digests = tree.leaf_digests()
+            >>> np.frombuffer(digests, dtype=np.uint8).reshape(-1, 32).shape
+            (3, 32)
+        """
+        return self._inner.leaf_digests()
 
     def is_empty(self) -> bool:
         """Return if the MrkleTree is empty."""
         return self._inner.is_empty()
 
+    def as_arrays(self) -> tuple[bytes, array[int]]:
+        """Return every node digest and parent index as contiguous buffers.
+
+        Row ``i`` of the digest buffer is the digest of node ``i``, so the
+        buffer holds ``len(tree) * tree.dtype().output_size()`` bytes. This
+        avoids building a ``MrkleNode`` per node when only digests are needed.
+
+        Returns:
+            tuple[bytes, array[int]]: The packed digests and a signed 64-bit
+                array of parent indices, where ``-1`` marks a node without a
+                parent.
+
+        Examples:
+            >>> import numpy as np
+            >>> tree = MrkleTree.from_leaves([b"a", b"b"], name="sha256")
+            >>> digests, parents = tree.as_arrays()
+            >>> np.frombuffer(digests, dtype=np.uint8).reshape(len(tree), -1).shape
+            (3, 32)
+            >>> list(parents)
+            [2, 2, -1]
+        """
+        digests, parents = self._inner.as_arrays()
+        return digests, array("q", parents)
+
     def dtype(self) -> Digest:
         """Return the digest type used by this tree.
 
@@ -149,6 +279,10 @@ class MrkleTree:
         """
         return self._inner.dtype()
 
+    @property
+    def _dtype_name(self) -> str:
+        return _DTYPE_NAMES[type(self._inner)]
+
     def capacity(self) -> int:
         """Return the allocation capacity of the internal tree structure.
 
@@ -165,6 +299,8 @@ class MrkleTree:
         cls,
         leaves: Union[Sequence[Union[Buffer, str]], Iterator[Union[Buffer, str]]],
         name: Optional[str] = None,
+        *,
+        workers: Optional[int] = None,
     ) -> "MrkleTree":
         """Construct a Merkle tree from a list of leaf data.
 
@@ -178,6 +314,9 @@ class MrkleTree:
                 Strings will be UTF-8 encoded to bytes.
             name (Optional[str], optional): The digest algorithm name
                 (e.g., "sha1", "sha256", "blake2b"). Defaults to "sha1".
+            workers (Optional[int], optional): Number of threads used to hash
+                the leaves and internal nodes. Hashing runs with the GIL
+                released. Defaults to the global thread pool.
 
         Returns:
             MrkleTree: A new Merkle tree instance containing the provided
@@ -200,16 +339,259 @@ class MrkleTree:
         """
         if name is None:
             name = "sha1"
-        digest = new(name)
-        name = digest.name()
 
-        if inner := TREE_MAP.get(name):
-            return cls._construct_tree_backend(inner.from_leaves(leaves))
+        # Leaves are converted and hashed by the backend in a single call, so
+        # the digest name is resolved directly against the backend map.
+        if inner := _TREE_MAP_RAW.get(name) or _TREE_MAP_RAW.get(name.lower()):
+            return cls._construct_tree_backend(
+                inner.from_leaves(leaves, workers=workers)
+            )
+        else:
+            raise ValueError(
+                f"{name} is not a digest algorithm supported by MrkleTree."
+            )
+
+    @classmethod
+    def from_packed(
+        cls,
+        data: Buffer,
+        offsets: Optional[Sequence[int]] = None,
+        name: Optional[str] = None,
+        *,
+        width: Optional[int] = None,
+        workers: Optional[int] = None,
+    ) -> "MrkleTree":
+        """Construct a Merkle tree from leaves packed into one buffer.
+
+        Leaf ``i`` is ``data[offsets[i]:offsets[i + 1]]``, so ``offsets`` has
+        one more entry than there are leaves. Leaves of one fixed size take
+        ``width`` instead, or no boundaries at all when ``data`` is a 2-D
+        buffer (such as a NumPy ``(n, 32)`` array) whose rows are the leaves.
+        No Python object is created per leaf, which suits large batches that
+        are already contiguous in memory.
+
+        Args:
+            data (Buffer): The concatenated leaf data.
+            offsets (Optional[Sequence[int]]): Non-decreasing leaf boundaries
+                into ``data``, from ``0`` to ``len(data)``. An ``array("q")``,
+                ``array("Q")`` or contiguous NumPy ``int64`` array is passed
+                through without converting element by element.
+            name (Optional[str], optional): The digest algorithm name.
+                Defaults to "sha1".
+            width (Optional[int], optional): The size in bytes of every
+                leaf, in place of ``offsets``.
+            workers (Optional[int], optional): Number of threads used to hash
+                the tree. Defaults to the global thread pool.
+
+        Returns:
+            MrkleTree: The same tree ``from_leaves`` builds from the slices.
+
+        Raises:
+            ValueError: If the digest algorithm name is not supported, an
+                offset is negative, out of order or past the end of ``data``,
+                the offsets do not cover all of ``data``, or ``data`` is not
+                a whole number of ``width``-byte rows.
+
+        Examples:
+            >>> from array import array
+            >>> tree = MrkleTree.from_packed(b"abc", array("Q", [0, 1, 2, 3]))
+            >>> tree == MrkleTree.from_leaves([b"a", b"b", b"c"])
+            True
+            >>> MrkleTree.from_packed(b"abcd", width=2) == MrkleTree.from_leaves(
+            ...     [b"ab", b"cd"]
+            ... )
+            True
+        """
+        if name is None:
+            name = "sha1"
+
+        if offsets is None and width is None:
+            view = memoryview(data)
+            if view.ndim != 2:
+                raise ValueError("offsets or width is required unless data is 2-D")
+            width = view.shape[1] * view.itemsize
+        elif offsets is not None and width is not None:
+            raise ValueError("offsets and width can not be given together")
+
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes(data)
+
+        if offsets is None:
+            packed = None
+        else:
+            try:
+                view = memoryview(offsets)
+            except TypeError:
+                view = None
+            if (
+                view is not None
+                and view.ndim == 1
+                and view.itemsize == 8
+                and view.format in _OFFSET_FORMATS
+            ):
+                bounds = view
+            else:
+                try:
+                    bounds = array("Q", offsets)
+                except OverflowError:
+                    raise ValueError("offsets must not be negative") from None
+
+            # Bytes before the first or after the last boundary would belong
+            # to no leaf. Negative signed offsets in between come through as
+            # huge unsigned ones and are rejected by the backend's bounds check.
+            first, last = (bounds[0], bounds[-1]) if len(bounds) else (0, 0)
+            if first != 0 or last != len(data):
+                raise ValueError("offsets must start at 0 and end at len(data)")
+            packed = bounds.tobytes()
+
+        if inner := _TREE_MAP_RAW.get(name) or _TREE_MAP_RAW.get(name.lower()):
+            if packed is None:
+                tree = inner.from_rows(data, width, workers=workers)
+            else:
+                tree = inner.from_packed(data, packed, workers=workers)
+            return cls._construct_tree_backend(tree)
+        else:
+            raise ValueError(
+                f"{name} is not a digest algorithm supported by MrkleTree."
+            )
+
+    @classmethod
+    def from_leaf_digests(
+        cls,
+        digests: Union[Buffer, Iterable[Buffer]],
+        name: Optional[str] = None,
+        *,
+        workers: Optional[int] = None,
+    ) -> "MrkleTree":
+        """Construct a Merkle tree over leaf digests computed elsewhere.
+
+        The digests become the leaf hashes as they are, so only the internal
+        nodes are hashed. This is the inverse of ``leaf_digests``: a tree
+        built from ``tree.leaf_digests()`` equals ``tree``. Each leaf's value
+        is its digest, and proofs verify against the digests as usual.
+
+        Args:
+            digests (Union[Buffer, Iterable[Buffer]]): The leaf digests,
+                either packed back to back in one buffer (such as ``bytes``,
+                an ``array("B")`` or a NumPy ``(n, 32)`` array), or one
+                buffer per leaf.
+            name (Optional[str], optional): The digest algorithm the digests
+                were computed with. Defaults to "sha1".
+            workers (Optional[int], optional): Number of threads used to hash
+                the internal nodes. Defaults to the global thread pool.
+
+        Returns:
+            MrkleTree: A tree whose leaves hold the given digests.
+
+        Raises:
+            ValueError: If the digest algorithm name is not supported, or a
+                digest is not the algorithm's output size.
+
+        Examples:
+            >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"], name="sha256")
+            >>> MrkleTree.from_leaf_digests(tree.leaf_digests(), "sha256") == tree
+            True
+        """
+        if name is None:
+            name = "sha1"
+
+        if inner := _TREE_MAP_RAW.get(name) or _TREE_MAP_RAW.get(name.lower()):
+            # bytes and bytearray are read by the backend in place. Any other
+            # buffer would be iterated item by item, so its packed digests
+            # are copied out whole instead.
+            if not isinstance(digests, (bytes, bytearray)):
+                try:
+                    view = memoryview(digests)
+                except TypeError:
+                    pass
+                else:
+                    digests = view.tobytes()
+            return cls._construct_tree_backend(
+                inner.from_digests(digests, workers=workers)
+            )
         else:
             raise ValueError(
                 f"{name} is not a digest algorithm supported by MrkleTree."
             )
 
+    def replace_leaves(
+        self,
+        changes: Mapping[int, Union[Buffer, str]],
+        *,
+        workers: Optional[int] = None,
+    ) -> "MrkleTree":
+        """Return a new tree with some leaves replaced.
+
+        Only the new leaves and the internal nodes above them are hashed;
+        every other digest is copied from this tree, so a few changes to a
+        large tree cost a few root paths rather than a full rebuild.
+
+        Args:
+            changes (Mapping[int, Union[Buffer, str]]): New data keyed by leaf
+                position, in the order of ``leaves()``.
+            workers (Optional[int], optional): Number of threads used to hash
+                the tree. Defaults to the global thread pool.
+
+        Returns:
+            MrkleTree: A tree of the same shape holding the updated leaf
+                data. This tree is left unchanged.
+
+        Raises:
+            IndexError: If a position is not a leaf position of this tree.
+
+        Examples:
+            >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+            >>> tree.replace_leaves({1: b"x"}) == MrkleTree.from_leaves(
+            ...     [b"a", b"x", b"c"]
+            ... )
+            True
+        """
+        return self._construct_tree_backend(
+            self._inner.replace_leaves(list(changes.items()), workers=workers)
+        )
+
+    @classmethod
+    def update(
+        cls,
+        old: "MrkleTree",
+        leaves: Sequence[Union[Buffer, str]],
+        *,
+        workers: Optional[int] = None,
+    ) -> "MrkleTree":
+        """Rebuild ``old`` with a complete new list of leaf data.
+
+        Each leaf is compared with the one at the same position in ``old``.
+        Unchanged leaves keep their digest, as does every internal node with
+        no changed leaf below it, so only the changed root paths are hashed.
+
+        Args:
+            old (MrkleTree): The tree to rebuild. It is left unchanged.
+            leaves (Sequence[Union[Buffer, str]]): New data for every leaf,
+                in the order of ``old.leaves()``.
+            workers (Optional[int], optional): Number of threads used to hash
+                the tree. Defaults to the global thread pool.
+
+        Returns:
+            MrkleTree: A tree of the same shape as ``old`` holding ``leaves``.
+
+        Raises:
+            TypeError: If ``old`` is not a MrkleTree.
+            ValueError: If ``leaves`` does not have one entry per leaf of ``old``.
+
+        Examples:
+            >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+            >>> MrkleTree.update(tree, [b"a", b"x", b"c"]) == MrkleTree.from_leaves(
+            ...     [b"a", b"x", b"c"]
+            ... )
+            True
+        """
+        if not isinstance(old, MrkleTree):
+            raise TypeError(f"Expected MrkleTree, got {type(old).__name__}.")
+
+        return cls._construct_tree_backend(
+            old._inner.rebuild_from_leaves(list(leaves), workers=workers)
+        )
+
     def branch(self, node: Union["MrkleNode", int]) -> "MrkleBranch":
         """Return a branch iterator from a leaf node to the root.
 
@@ -270,6 +652,33 @@ class MrkleTree:
 
     proof = generate_proof
 
+    def generate_multiproof(
+        self, leaves: Union[Sequence[int], Sequence[MrkleNode]]
+    ) -> list["MrkleProof"]:
+        """Generate an independent Merkle proof for each of the given leaves.
+
+        Args:
+            leaves (Union[Sequence[int], Sequence[MrkleNode]]): The leaves to
+                prove, one proof each.
+
+        Returns:
+            list[MrkleProof]: One single-leaf proof per entry of ``leaves``,
+                in the same order.
+
+        Raises:
+            ValueError: If there are no proved leaves.
+            TreeError: If the tree has no root.
+            IndexError: If a node index is out of bounds.
+            ProofError: If a generated path is invalid.
+
+        Examples:
+            >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+            >>> proofs = tree.generate_multiproof([0, 1])
+            >>> len(proofs)
+            2
+        """
+        return MrkleProof.generate_multiproof(self, leaves)
+
     def to_string(self) -> str:
         """pretty print of MrkleTree.
 
@@ -289,6 +698,30 @@ class MrkleTree:
 
     to_str = to_string
 
+    def print_to(self, file: Optional[io.TextIOBase] = None) -> None:
+        """Write the pretty print of MrkleTree to a text stream.
+
+        Equivalent to ``print(tree.to_string(), file=file)``, but the text
+        is written in chunks as it is formatted, so the whole of it is
+        never held as one string.
+
+        Args:
+            file (Optional[io.TextIOBase]): Stream to write to. Defaults to
+                ``sys.stdout``.
+
+        Examples:
+            >>> import io
+            >>> tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+            >>> buffer = io.StringIO()
+            >>> tree.print_to(buffer)
+            >>> buffer.getvalue() == tree.to_string() + "\n"
+            True
+        """
+        if file is None:
+            file = sys.stdout
+        self._inner.write_string(file.write)
+        file.write("\n")
+
     @classmethod
     def loads(
         cls,
@@ -302,14 +735,15 @@ class MrkleTree:
         Args:
             data: Serialized tree data (str or bytes).
             name: Optional digest algorithm name. If None, will auto-detect from data.
-            format: Serialization format - "json" or "cbor". Defaults to "json".
+            format: Serialization format; only "json" is supported. Defaults to "json".
 
         Returns:
             MrkleTree: Deserialized tree instance.
 
         Raises:
             ValueError: Raised when the specified digest algorithm is not
-                recognized in the default registry.
+                recognized in the default registry, or the format is not
+                supported.
             SerdeError: Raised when deserialization fails.
 
         Examples:
@@ -325,11 +759,12 @@ class MrkleTree:
             >>> # Specify algorithm explicitly
             >>> restored = MrkleTree.loads(data, name="sha256", format="json")
         """
+        _check_format(format)
         if name is None:
             return cls._find_loads(data)
         else:
-            if tree := TREE_MAP.get(name):
-                return MrkleTree(tree.loads(data, format=format))
+            if tree := _TREE_MAP_RAW.get(name) or _TREE_MAP_RAW.get(name.lower()):
+                return cls._construct_tree_backend(tree.loads(data))
             else:
                 raise ValueError(
                     f"{name} is not a digest algorithm supported by MrkleTree."
@@ -348,14 +783,15 @@ class MrkleTree:
         Args:
             fp: File-like object to read from (text or binary mode).
             name: Optional digest algorithm name. If None, will auto-detect from data.
-            format: Serialization format - "json" or "cbor". Defaults to "json".
+            format: Serialization format; only "json" is supported. Defaults to "json".
 
         Returns:
             MrkleTree: Deserialized tree instance.
 
         Raises:
             ValueError: Raised when the specified digest algorithm is not
-                recognized in the default registry.
+                recognized in the default registry, or the format is not
+                supported.
             SerdeError: Raised when deserialization fails.
             IOError: Raised when file reading fails.
 
@@ -376,11 +812,12 @@ class MrkleTree:
             >>> with open('tree.sha256.json', 'r') as f:
             ...     restored = MrkleTree.load(f, name="sha256")
         """
+        _check_format(format)
         if name is None:
             return cls._find_load(fp, format=format)
         else:
-            if tree := TREE_MAP.get(name):
-                return MrkleTree(tree.load(fp, format=format))
+            if tree := _TREE_MAP_RAW.get(name) or _TREE_MAP_RAW.get(name.lower()):
+                return cls._construct_tree_backend(tree.load(fp))
             else:
                 raise ValueError(
                     f"{name} is not a digest algorithm supported by MrkleTree."
@@ -404,23 +841,17 @@ class MrkleTree:
             SerdeError: If deserialization fails.
         """
 
-        metadata = json.loads(data if isinstance(data, str) else data.decode("utf-8"))
-
-        if hash_type := metadata.get("hash_type"):
-            if isinstance(hash_type, str):
-                if tree := TREE_MAP.get(hash_type):
-                    # NOTE: when implement binary update format Literal.
-                    return MrkleTree(tree.loads(data, format=format))
-                else:
-                    raise ValueError(
-                        (
-                            f"Hash type '{hash_type}' from data is not supported "
-                            "by MrkleTree."
-                        )
-                    )
+        if hash_type := _json_hash_type(data):
+            if tree := _TREE_MAP_RAW.get(hash_type):
+                # NOTE: when implement binary update format Literal.
+                return cls._construct_tree_backend(tree.loads(data))
             else:
-                return NotImplemented
-
+                raise ValueError(
+                    (
+                        f"Hash type '{hash_type}' from data is not supported "
+                        "by MrkleTree."
+                    )
+                )
         else:
             raise ValueError("Serialized data does not contain 'hash_type' field")
 
@@ -488,6 +919,7 @@ class MrkleTree:
         *,
         format: Literal["flatten", "nested"] = "nested",
         sep: str = ".",
+        workers: Optional[int] = None,
     ) -> "MrkleTree":
         """Construct a MrkleTree from a tree-like dict.
 
@@ -496,10 +928,13 @@ class MrkleTree:
 
         Args:
             data: Dictionary containing the tree data.
-            name: Name of the digest algorithm (defaults to "sha1").
+            name: Name of the digest algorithm (defaults to "sha1"). "blake3" is
+                recommended for large leaves such as flattened model state dicts.
             format: Format of the input dictionary - "flatten" for dot-separated keys
                 or "nested" for recursive dictionaries (default: "nested").
             sep: Separator character used for flattened keys (default: ".").
+            workers: Number of threads used to hash the leaves and internal
+                nodes (default: the global thread pool).
 
         Returns:
             MrkleTree: A new tree instance built from the given dictionary data.
@@ -527,23 +962,20 @@ class MrkleTree:
         """
         if name is None:
             name = "sha1"
-        digest = new(name)
-        name = digest.name()
-        # NOTE: need to test between rust impl
-        # and python impl to see if there is
-        # some speed improvments in speed
-        # handling it \w in rust runtime.
-        if format == "flatten":
-            data = unflatten(data, sep=sep)
-        if inner := TREE_MAP.get(name):
-            return cls._construct_tree_backend(inner.from_dict(data=data))
+
+        if inner := _TREE_MAP_RAW.get(name) or _TREE_MAP_RAW.get(name.lower()):
+            if format == "flatten":
+                tree = inner.from_flat_dict(data, sep=sep, workers=workers)
+            else:
+                tree = inner.from_dict(data=data, workers=workers)
+            return cls._construct_tree_backend(tree)
         else:
             raise ValueError(
                 f"{name} is not a digest algorithm supported by MrkleTree."
             )
 
     @classmethod
-    def _construct_tree_backend(cls, tree: Tree_T) -> "MrkleTree":
+    def _construct_tree_backend(cls, tree: Tree_T, _new=object.__new__) -> "MrkleTree":
         """Internal method to create a MrkleTree instance bypassing __init__.
 
         This method is used internally to construct tree instances with
@@ -551,14 +983,13 @@ class MrkleTree:
 
         Args:
             tree (Tree_T): The underlying Rust-based tree instance.
-            dtype (Digest): The digest algorithm instance.
 
         Returns:
             MrkleTree: A new tree instance wrapping the given components.
 
         """
-        obj = object.__new__(cls)
-        object.__setattr__(obj, "_inner", tree)
+        obj = _new(cls)
+        _set_tree_inner(obj, tree)
         return obj
 
     @overload
@@ -641,13 +1072,15 @@ class MrkleTree:
             >>> tree1 == tree3
             False
         """
+        if self is other:
+            return True
         if not isinstance(other, MrkleTree):
             return NotImplemented
 
-        if self.dtype() != other.dtype():
-            return False
-
-        return self._inner == other._inner
+        # Equal roots alone are not enough: without domain separation a leaf
+        # can carry the bytes of an internal node.
+        inner, other_inner = self._inner, other._inner
+        return type(inner) is type(other_inner) and inner == other_inner
 
     @override
     def __hash__(self) -> int:
@@ -656,7 +1089,11 @@ class MrkleTree:
         Returns:
             int: The hash value of the tree.
         """
-        return hash((type(self._inner), self.root()))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = value = hash(self._inner)
+            return value
 
     @override
     def __repr__(self) -> str:
@@ -670,10 +1107,7 @@ class MrkleTree:
             >>> repr(tree)
             '<sha256 mrkle.tree.MrkleTree object at 0x...>'
         """
-        return (
-            f"<{self._inner.dtype().name()} mrkle.tree.MrkleTree "
-            f"object at {hex(id(self))}>"
-        )
+        return f"<{self._dtype_name} mrkle.tree.MrkleTree object at {id(self):#x}>"
 
     @override
     def __str__(self) -> str:
@@ -686,12 +1120,13 @@ class MrkleTree:
         Examples:
             >>> tree = MrkleTree.from_leaves([b"a", b"b"])
             >>> str(tree)
-            'MrkleTree(expected=ce7a, length=3, dtype=sha1)'
+            'MrkleTree(root=ce7a, length=3, dtype=sha1)'
         """
-        root = self.root()
-        expected = root[:4].hex() if root else None
-        length = len(self) if root else 0
-        dtype = self.dtype().name()
+        if (root := self.root()) is None:
+            expected, length = None, 0
+        else:
+            expected, length = root[:2].hex(), len(self._inner)
+        dtype = self._dtype_name
 
         return f"MrkleTree(root={expected}, length={length}, dtype={dtype})"
 
@@ -708,6 +1143,11 @@ class MrkleTree:
         return super().__format__(format_spec)
 
 
+# Backend results are already known to be trees, so _construct_tree_backend
+# writes the slot through its member descriptor instead of __init__.
+_set_tree_inner = MrkleTree.__dict__["_inner"].__set__
+
+
 @final
 class MrkleProof:
     """A generic Merkle proof.
@@ -729,9 +1169,9 @@ class MrkleProof:
     """
 
     _inner: Proof_T
-    _dtype_name: str
+    _expected: bytes
 
-    __slots__ = ("_inner", "_dtype_name")
+    __slots__ = ("_inner", "_expected")
 
     def __init__(self, proof: Proof_T) -> None:
         """Initialize a MrkleProof instance.
@@ -740,15 +1180,22 @@ class MrkleProof:
             proof: The underlying Rust-based proof instance.
         """
         self._inner = proof
-        self._dtype_name = proof.dtype().name()
+
+    @property
+    def _dtype_name(self) -> str:
+        return _PROOF_DTYPE_NAMES[type(self._inner)]
 
     def expected(self) -> bytes:
         """Returns the expected hash of the proof."""
-        return self._inner.expected()
+        try:
+            return self._expected
+        except AttributeError:
+            self._expected = value = self._inner.expected()
+            return value
 
     def expected_hexdigest(self) -> str:
         """Returns the expected hexadecimal hash of the proof."""
-        return self._inner.expected_hexdigest()
+        return self.expected().hex()
 
     @classmethod
     def generate(
@@ -768,25 +1215,79 @@ class MrkleProof:
 
         """
 
-        name = tree.dtype().name()
-
-        if proof := PROOF_MAP.get(name):
-            if isinstance(leaves, int):
-                leaves = [leaves]
-            elif isinstance(leaves, MrkleNode):
-                leaves = [_find_index_from_node(tree, leaves)]
-            elif isinstance(leaves, Sequence):
-                leaves = list(
-                    map(
-                        lambda node: _find_index_from_node(tree, node)
-                        if isinstance(node, MrkleNode)
-                        else node,
-                        leaves,
-                    )
+        if proof := _PROOF_FOR_TREE.get(type(tree._inner)):
+            if isinstance(leaves, range):
+                return cls(
+                    proof.generate_range(tree, leaves.start, leaves.stop, leaves.step)
                 )
+            return cls(proof.generate(tree, _proof_leaf_indices(tree, leaves)))
+        else:
+            name = tree._dtype_name
+            raise ValueError(
+                f"{name!r} is not a digest algorithm supported by MrkleTree."
+            )
 
-            return cls(proof.generate(tree, leaves))
+    @classmethod
+    def generate_multiproof(
+        cls,
+        tree: "MrkleTree",
+        leaves: Union[Sequence[int], Sequence[MrkleNode]],
+    ) -> list["MrkleProof"]:
+        """Generate one single-leaf MrkleProof per leaf in a single backend call.
+
+        Equivalent to ``[MrkleProof.generate(tree, leaf) for leaf in leaves]``,
+        but the tree is walked in one call and the levels shared by several
+        leaves are gathered once.
+
+        Examples:
+            >>> from mrkle.tree import MrkleTree, MrkleProof
+            >>> tree = MrkleTree.from_leaves(["a", "b", "c"])
+            >>> proofs = MrkleProof.generate_multiproof(tree, [0, 1])
+            >>> proofs[1].verify(tree[1])
+            True
+
+        """
+
+        if proof := _PROOF_FOR_TREE.get(type(tree._inner)):
+            if isinstance(leaves, Sequence):
+                leaves = _replace_nodes(tree, leaves)
+
+            return [cls(inner) for inner in proof.generate_multi(tree, leaves)]
         else:
+            name = tree._dtype_name
+            raise ValueError(
+                f"{name!r} is not a digest algorithm supported by MrkleTree."
+            )
+
+    @classmethod
+    def generate_many(
+        cls,
+        tree: "MrkleTree",
+        leaf_sets: Sequence[
+            Union[int, Sequence[int], Sequence[MrkleNode], "MrkleNode"]
+        ],
+    ) -> list["MrkleProof"]:
+        """Generate one MrkleProof per leaf set in a single backend call.
+
+        Each entry of ``leaf_sets`` takes any form accepted by ``generate``.
+        This is equivalent to ``[MrkleProof.generate(tree, leaves) for leaves
+        in leaf_sets]``, but the tree is walked in one call and the levels
+        shared by several leaves, in any of the sets, are gathered once.
+
+        Examples:
+            >>> from mrkle.tree import MrkleTree, MrkleProof
+            >>> tree = MrkleTree.from_leaves(["a", "b", "c", "d"])
+            >>> proofs = MrkleProof.generate_many(tree, [[0, 1], 3])
+            >>> proofs[0].verify([tree[0], tree[1]])
+            True
+
+        """
+
+        if proof := _PROOF_FOR_TREE.get(type(tree._inner)):
+            leaf_sets = [_proof_leaf_indices(tree, leaves) for leaves in leaf_sets]
+            return [cls(inner) for inner in proof.generate_many(tree, leaf_sets)]
+        else:
+            name = tree._dtype_name
             raise ValueError(
                 f"{name!r} is not a digest algorithm supported by MrkleTree."
             )
@@ -826,6 +1327,40 @@ class MrkleProof:
         """
         return self._inner.verify(leaves=leaves)
 
+    def verify_batch(
+        self,
+        candidates: Sequence[
+            Union[
+                Sequence[str],
+                Sequence[bytes],
+                Sequence[MrkleNode],
+                str,
+                bytes,
+                MrkleNode,
+            ]
+        ],
+    ) -> list[bool]:
+        """Verify many candidate leaf sets against this proof in one call.
+
+        Each candidate takes any form accepted by ``verify``. All of them are
+        checked by the backend back to back, without a Python round trip per
+        candidate.
+
+        Returns:
+            list[bool]: Whether each candidate reconstructs the expected
+                root, in input order.
+
+        Examples:
+            >>> from mrkle.tree import MrkleTree
+            >>>
+            >>> tree = MrkleTree.from_leaves([b"a", b"b"], name="sha256")
+            >>> proof = tree.generate_proof(0)
+            >>> proof.verify_batch([tree[0].digest(), tree[1].digest()])
+            [True, False]
+
+        """
+        return self._inner.verify_batch(candidates)
+
     def dtype(self) -> Digest:
         """Return the digest type used by this tree.
 
@@ -851,7 +1386,7 @@ class MrkleProof:
             >>> repr(proof)
             '<sha256 mrkle.tree.MrkleProof object at 0x...>'
         """
-        return f"<{self._dtype_name} mrkle.tree.MrkleProof object at {hex(id(self))}>"
+        return f"<{self._dtype_name} mrkle.tree.MrkleProof object at {id(self):#x}>"
 
     @override
     def __str__(self) -> str:
@@ -867,8 +1402,8 @@ class MrkleProof:
             >>> str(proof)
             'MrkleProof(expected=ce7a, dtype=sha1)'
         """
-        root = self._inner.expected_hexdigest()
-        expected = root[:4] if root else None
+        root = self.expected()
+        expected = root[:2].hex() if root else None
 
         return f"MrkleProof(expected={expected}, dtype={self._dtype_name})"
 
@@ -932,14 +1467,39 @@ class MrkleBranch(Iterable[MrkleNode]):
 
     @override
     def __repr__(self) -> str:
-        return f"<mrkle.iter.MrkleBranch object at {hex(id(self))}>"
+        return f"<mrkle.iter.MrkleBranch object at {id(self):#x}>"
 
     @override
     def __str__(self) -> str:
-        node_type = self._tree.dtype().name()
+        node_type = self._tree._dtype_name
         return f"MrkleBranch(dtype={node_type})"
 
 
+def _proof_leaf_indices(tree: "MrkleTree", leaves: Any) -> Any:
+    # A single index or node becomes a one-element list, and nodes in a
+    # sequence are replaced by their indices; anything else is left for the
+    # backend to accept or reject.
+    if isinstance(leaves, int):
+        return [leaves]
+    elif isinstance(leaves, range):
+        return leaves
+    elif isinstance(leaves, MrkleNode):
+        return [_find_index_from_node(tree, leaves)]
+    elif isinstance(leaves, Sequence):
+        return _replace_nodes(tree, leaves)
+    return leaves
+
+
+def _replace_nodes(tree: "MrkleTree", leaves: Sequence[Any]) -> Sequence[Any]:
+    # MrkleNode is final, so the exact types of the items find every node.
+    if MrkleNode not in set(map(type, leaves)):
+        return leaves
+    return [
+        _find_index_from_node(tree, node) if isinstance(node, MrkleNode) else node
+        for node in leaves
+    ]
+
+
 def _find_index_from_node(tree: "MrkleTree", item: "MrkleNode") -> int:
     if p := item.parent():
         parent = tree[p]
@@ -1,7 +1,14 @@
 import io
 import sys
 from typing import Union, runtime_checkable, Protocol
-from typing_extensions import TypeAlias
+
+if sys.version_info >= (3, 12):
+    from typing import TypeAlias, override
+elif sys.version_info >= (3, 10):
+    from typing import TypeAlias
+    from typing_extensions import override
+else:
+    from typing_extensions import TypeAlias, override
 
 if sys.version_info >= (3, 12):
     # Buffer protocol is available in Python 3.12+
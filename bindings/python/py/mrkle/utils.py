@@ -6,7 +6,7 @@ functions are *not* part of the public interface.
 
 from __future__ import annotations
 
-from typing import Union
+from typing import Optional, Union
 from mrkle.typing import BufferLike as Buffer
 
 
@@ -16,6 +16,10 @@ NestedDict = dict[str, Union[Buffer, str, "NestedDict"]]
 def unflatten(state_dict: dict[str, Buffer], sep: str = ".") -> NestedDict:
     """Returns an unflattened tree.
 
+    ``MrkleTree.from_dict(state_dict, format="flatten")`` splits the keys
+    in the backend and never calls this, so it is only needed when the
+    nested dict itself is wanted.
+
     Args:
         state_dict (dict[str, BufferLike]): Flattened dictionary where keys
         contain depth of leaf.
@@ -31,12 +35,25 @@ def unflatten(state_dict: dict[str, Buffer], sep: str = ".") -> NestedDict:
         {'a': {'a': b'hello', 'c': b'world'}}
     """
     result_dict: NestedDict = {}
+    # Flattened keys usually arrive grouped by parent, so the parent of the
+    # previous key is reused whenever the next key shares its prefix. Only
+    # that key's leaf has been written since, so the cached dict is current.
+    prefix: Optional[str] = None
+    parent: NestedDict = result_dict
     for key, value in state_dict.items():
-        parts: list[str] = key.split(sep)
-        d: NestedDict = result_dict
-        for part in parts[:-1]:
-            if part not in d or not isinstance(d[part], dict):
-                d[part] = {}
-            d = d[part]  # type: ignore[assignment]
-        d[parts[-1]] = value  # type: ignore[index]
+        head, found, leaf = key.rpartition(sep)
+        if not found:
+            # A top level leaf may replace the dict the cache points into.
+            result_dict[key] = value
+            prefix = None
+            continue
+        if head != prefix:
+            d: NestedDict = result_dict
+            for part in head.split(sep):
+                child = d.get(part)
+                if not isinstance(child, dict):
+                    child = d[part] = {}
+                d = child
+            parent, prefix = d, head
+        parent[leaf] = value
     return result_dict
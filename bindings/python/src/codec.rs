@@ -30,7 +30,7 @@ impl<'py> FromPyObject<'py> for PyCodecFormat {
     }
 }
 
-#[derive(Debug, Clone, serde::Serialize, serde::Deserialize)]
+#[derive(Debug, Clone, serde::Serialize)]
 pub struct JsonCodec<T, D>
 where
     T: Eq + PartialEq + Hash + Clone,
@@ -46,6 +46,41 @@ where
     tree: MerkleTreeJson<T>,
 }
 
+/// Wire form of a [`JsonCodec`]: the header fields next to those of the
+/// root node, which `flatten` would otherwise collect into serde's buffered
+/// `Content` before decoding the tree a second time.
+#[derive(serde::Deserialize)]
+struct JsonCodecRepr<T>
+where
+    T: Eq + PartialEq + Hash + Clone,
+{
+    hash_type: String,
+    hash_size: usize,
+    #[serde(with = "hex_serde")]
+    hash: Vec<u8>,
+    value: Option<T>,
+    children: Option<Vec<MerkleTreeJson<T>>>,
+}
+
+impl<'de, T, D> serde::Deserialize<'de> for JsonCodec<T, D>
+where
+    T: Eq + PartialEq + Hash + Clone + serde::Deserialize<'de>,
+    D: PyDigest,
+{
+    fn deserialize<De>(deserializer: De) -> Result<Self, De::Error>
+    where
+        De: serde::Deserializer<'de>,
+    {
+        let repr = JsonCodecRepr::<T>::deserialize(deserializer)?;
+        Ok(Self {
+            hash_type: repr.hash_type,
+            hash_size: repr.hash_size,
+            phantom: PhantomData,
+            tree: MerkleTreeJson::from_parts(repr.hash, repr.value, repr.children)?,
+        })
+    }
+}
+
 impl<'de, T, D> JsonCodec<T, D>
 where
     T: Eq + PartialEq + Hash + Clone + serde::Serialize + serde::Deserialize<'de>,
@@ -93,8 +128,61 @@ where
     }
 }
 
+/// Just the `hash_type` field of a serialized [`JsonCodec`].
+///
+/// Every other field, the tree included, is skipped by the parser without
+/// being materialised, so the digest of a payload can be read before
+/// picking the backend that decodes it.
+#[derive(Debug, serde::Deserialize)]
+pub struct HashTypeProbe {
+    pub hash_type: Option<String>,
+}
+
+impl HashTypeProbe {
+    pub fn from_slice(data: &[u8]) -> Result<Self, serde_json::Error> {
+        match Self::leading(data) {
+            Some(hash_type) => Ok(Self {
+                hash_type: Some(hash_type.to_owned()),
+            }),
+            None => serde_json::from_slice(data),
+        }
+    }
+
+    pub fn from_str_utf8(data: &str) -> Result<Self, serde_json::Error> {
+        match Self::leading(data.as_bytes()) {
+            Some(hash_type) => Ok(Self {
+                hash_type: Some(hash_type.to_owned()),
+            }),
+            None => serde_json::from_str(data),
+        }
+    }
+
+    /// Read `hash_type` when it is the first key of the object, as
+    /// [`JsonCodec`] writes it, without scanning the rest of the payload.
+    /// Any other layout, or an escaped name, is left to the parser.
+    fn leading(data: &[u8]) -> Option<&str> {
+        fn skip_ws(data: &[u8]) -> &[u8] {
+            let start = data
+                .iter()
+                .position(|b| !matches!(b, b' ' | b'\t' | b'\n' | b'\r'))
+                .unwrap_or(data.len());
+            &data[start..]
+        }
+
+        let rest = skip_ws(data).strip_prefix(b"{")?;
+        let rest = skip_ws(rest).strip_prefix(b"\"hash_type\"")?;
+        let rest = skip_ws(rest).strip_prefix(b":")?;
+        let rest = skip_ws(rest).strip_prefix(b"\"")?;
+        let end = rest.iter().position(|&b| b == b'"' || b == b'\\')?;
+        if rest[end] != b'"' {
+            return None;
+        }
+        std::str::from_utf8(&rest[..end]).ok()
+    }
+}
+
 /// A recursive JSON codec for Merkle tree structures
-#[derive(Debug, Clone, PartialEq, Eq, serde::Serialize, serde::Deserialize)]
+#[derive(Debug, Clone, PartialEq, Eq, serde::Serialize)]
 #[serde(untagged)]
 pub enum MerkleTreeJson<T>
 where
@@ -114,9 +202,61 @@ where
     },
 }
 
+/// Wire form of one [`MerkleTreeJson`] node, whose variant is told apart
+/// by which of `value` and `children` is present. Decoding it directly
+/// streams the payload, where `untagged` would buffer every node into
+/// serde's `Content` and then decode it again.
+#[derive(serde::Deserialize)]
+struct NodeRepr<T>
+where
+    T: Eq + PartialEq + Hash + Clone,
+{
+    #[serde(with = "hex_serde")]
+    hash: Vec<u8>,
+    value: Option<T>,
+    children: Option<Vec<MerkleTreeJson<T>>>,
+}
+
+impl<T> MerkleTreeJson<T>
+where
+    T: Eq + PartialEq + Hash + Clone,
+{
+    /// Pick the variant a node's fields describe. A `value` makes a leaf,
+    /// as it did when the leaf variant was tried first.
+    fn from_parts<E: serde::de::Error>(
+        hash: Vec<u8>,
+        value: Option<T>,
+        children: Option<Vec<MerkleTreeJson<T>>>,
+    ) -> Result<Self, E> {
+        match (value, children) {
+            (Some(value), _) => Ok(Self::Leaf { hash, value }),
+            (None, Some(children)) => Ok(Self::Parent { hash, children }),
+            (None, None) => Err(E::custom(
+                "data did not match any variant of untagged enum MerkleTreeJson",
+            )),
+        }
+    }
+}
+
+impl<'de, T> serde::Deserialize<'de> for MerkleTreeJson<T>
+where
+    T: Eq + PartialEq + Hash + Clone + serde::Deserialize<'de>,
+{
+    fn deserialize<De>(deserializer: De) -> Result<Self, De::Error>
+    where
+        De: serde::Deserializer<'de>,
+    {
+        let repr = NodeRepr::<T>::deserialize(deserializer)?;
+        Self::from_parts(repr.hash, repr.value, repr.children)
+    }
+}
+
 // Custom hex serialization for Vec<u8>
 mod hex_serde {
-    use serde::{Deserialize, Deserializer, Serializer};
+    use std::fmt;
+
+    use serde::de::{self, Visitor};
+    use serde::{Deserializer, Serializer};
 
     pub fn serialize<S>(bytes: &[u8], serializer: S) -> Result<S::Ok, S::Error>
     where
@@ -129,10 +269,25 @@ mod hex_serde {
     where
         D: Deserializer<'de>,
     {
-        let s = String::deserialize(deserializer)?;
-        let mut buffer = vec![0; s.len() / 2];
-        faster_hex::hex_decode(s.as_bytes(), &mut buffer)
-            .map_err(|e| serde::de::Error::custom(e.to_string()))?;
-        Ok(buffer)
+        // Decoded straight from the parser's borrowed string, so no owned
+        // copy of the hex text is made first.
+        struct HexVisitor;
+
+        impl Visitor<'_> for HexVisitor {
+            type Value = Vec<u8>;
+
+            fn expecting(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+                f.write_str("a hex-encoded digest")
+            }
+
+            fn visit_str<E: de::Error>(self, s: &str) -> Result<Vec<u8>, E> {
+                let mut buffer = vec![0; s.len() / 2];
+                faster_hex::hex_decode(s.as_bytes(), &mut buffer)
+                    .map_err(|e| E::custom(e.to_string()))?;
+                Ok(buffer)
+            }
+        }
+
+        deserializer.deserialize_str(HexVisitor)
     }
 }
@@ -1,14 +1,28 @@
+use std::collections::HashMap;
+
 use blake2::{Blake2b512, Blake2s256};
+use blake3::Hasher as Blake3;
 use crypto::digest::{
     Digest, FixedOutput, FixedOutputReset, Output, OutputSizeUser, Reset, Update,
+    consts::{U64, U128},
+    generic_array::GenericArray,
 };
 use pyo3::prelude::*;
-use pyo3::types::{PyAny, PyBytes};
-use pyo3::{Bound as PyBound, Py};
+use pyo3::types::{PyAny, PyBytes, PyString};
+use pyo3::{Bound as PyBound, Py, intern};
 use sha1::Sha1;
 use sha2::{Sha224, Sha256, Sha384, Sha512};
 use sha3::{Keccak224, Keccak256, Keccak384, Keccak512};
 
+use crate::utils::extract_to_bytes;
+
+#[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+mod blake2b_x86;
+#[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+mod sha256_sse2;
+#[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+mod sha256_x86;
+
 /// Trait for Python-exposed digest algorithms
 pub trait PyDigest: Sized + Clone + Send + Sync {
     /// The underlying digest type from RustCrypto
@@ -40,10 +54,411 @@ pub trait PyDigest: Sized + Clone + Send + Sync {
 
     /// Compute digest of data in one step
     fn digest(data: &[u8]) -> Output<Self::Inner>;
+
+    /// Compute the digest of `left || right`, the message hashed for an
+    /// internal node with two children.
+    fn digest_pair(left: &[u8], right: &[u8]) -> Output<Self::Inner> {
+        <Self::Inner as Digest>::new_with_prefix(left)
+            .chain_update(right)
+            .finalize()
+    }
+
+    /// Compute [`PyDigest::digest_pair`] for two independent pairs at once,
+    /// letting backends overlap the work of sibling nodes.
+    fn digest_pair_2x(pairs: [(&[u8], &[u8]); 2]) -> [Output<Self::Inner>; 2] {
+        pairs.map(|(left, right)| Self::digest_pair(left, right))
+    }
+
+    /// Compute [`PyDigest::digest`] for two independent messages at once,
+    /// letting backends overlap the work of sibling leaves.
+    fn digest_2x(data: [&[u8]; 2]) -> [Output<Self::Inner>; 2] {
+        data.map(Self::digest)
+    }
+
+    /// Compute [`PyDigest::digest`] for four independent messages at once,
+    /// for backends whose kernel runs four lanes; the default splits them
+    /// over [`PyDigest::digest_2x`].
+    fn digest_4x([a, b, c, d]: [&[u8]; 4]) -> [Output<Self::Inner>; 4] {
+        let [a, b] = Self::digest_2x([a, b]);
+        let [c, d] = Self::digest_2x([c, d]);
+        [a, b, c, d]
+    }
+
+    /// Compute [`PyDigest::digest_pair`] for four independent pairs at once,
+    /// for backends whose kernel runs four lanes; the default splits them
+    /// over [`PyDigest::digest_pair_2x`].
+    fn digest_pair_4x([a, b, c, d]: [(&[u8], &[u8]); 4]) -> [Output<Self::Inner>; 4] {
+        let [a, b] = Self::digest_pair_2x([a, b]);
+        let [c, d] = Self::digest_pair_2x([c, d]);
+        [a, b, c, d]
+    }
+}
+
+/// SHA-256 initial hash value (FIPS 180-4, section 5.3.3).
+const SHA256_IV: [u32; 8] = [
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+];
+
+/// Padding block that follows a message of exactly 64 bytes: the `0x80`
+/// terminator and the big-endian bit length 512.
+const SHA256_PAIR_PADDING: [u8; 64] = {
+    let mut block = [0u8; 64];
+    block[0] = 0x80;
+    block[62] = 0x02;
+    block
+};
+
+/// SHA-256 of two 32-byte child digests.
+///
+/// The message is always exactly one block followed by a fixed padding
+/// block, so both are handed straight to the compression function (which
+/// still dispatches to SHA-NI / ARMv8 SHA2 at runtime) and the generic
+/// buffering and padding path is skipped.
+fn sha256_pair(left: &[u8], right: &[u8]) -> Output<Sha256> {
+    if left.len() != 32 || right.len() != 32 {
+        return Sha256::new_with_prefix(left).chain_update(right).finalize();
+    }
+
+    let mut block = GenericArray::<u8, U64>::default();
+    block[..32].copy_from_slice(left);
+    block[32..].copy_from_slice(right);
+
+    let mut state = SHA256_IV;
+    sha2::compress256(
+        &mut state,
+        &[block, *GenericArray::from_slice(&SHA256_PAIR_PADDING)],
+    );
+
+    sha256_output(state)
+}
+
+/// SHA-224 initial hash value (FIPS 180-4, section 5.3.2).
+const SHA224_IV: [u32; 8] = [
+    0xc1059ed8, 0x367cd507, 0x3070dd17, 0xf70e5939, 0xffc00b31, 0x68581511, 0x64f98fa7, 0xbefa4fa4,
+];
+
+/// Second block of a 56-byte message, which leaves no room in the first
+/// block for the length: the big-endian bit length 448 alone.
+const SHA224_PAIR_PADDING: [u8; 64] = {
+    let mut block = [0u8; 64];
+    block[62] = 0x01;
+    block[63] = 0xc0;
+    block
+};
+
+/// SHA-224 of two 28-byte child digests.
+///
+/// The message and its `0x80` terminator fill the first block and the
+/// second is constant, so both go straight to the compression function as
+/// in [`sha256_pair`].
+fn sha224_pair(left: &[u8], right: &[u8]) -> Output<Sha224> {
+    if left.len() != 28 || right.len() != 28 {
+        return Sha224::new_with_prefix(left).chain_update(right).finalize();
+    }
+
+    let mut block = GenericArray::<u8, U64>::default();
+    block[..28].copy_from_slice(left);
+    block[28..56].copy_from_slice(right);
+    block[56] = 0x80;
+
+    let mut state = SHA224_IV;
+    sha2::compress256(
+        &mut state,
+        &[block, *GenericArray::from_slice(&SHA224_PAIR_PADDING)],
+    );
+
+    // SHA-224 keeps the first seven state words.
+    let mut out = Output::<Sha224>::default();
+    for (chunk, word) in out.chunks_exact_mut(4).zip(state) {
+        chunk.copy_from_slice(&word.to_be_bytes());
+    }
+    out
+}
+
+/// SHA-384 initial hash value (FIPS 180-4, section 5.3.4).
+const SHA384_IV: [u64; 8] = [
+    0xcbbb9d5dc1059ed8,
+    0x629a292a367cd507,
+    0x9159015a3070dd17,
+    0x152fecd8f70e5939,
+    0x67332667ffc00b31,
+    0x8eb44a8768581511,
+    0xdb0c2e0d64f98fa7,
+    0x47b5481dbefa4fa4,
+];
+
+/// SHA-512 initial hash value (FIPS 180-4, section 5.3.5).
+const SHA512_IV: [u64; 8] = [
+    0x6a09e667f3bcc908,
+    0xbb67ae8584caa73b,
+    0x3c6ef372fe94f82b,
+    0xa54ff53a5f1d36f1,
+    0x510e527fade682d1,
+    0x9b05688c2b3e6c1f,
+    0x1f83d9abfb41bd6b,
+    0x5be0cd19137e2179,
+];
+
+/// Padding block that follows a message of exactly 128 bytes: the `0x80`
+/// terminator and the big-endian 128-bit bit length 1024.
+const SHA512_PAIR_PADDING: [u8; 128] = {
+    let mut block = [0u8; 128];
+    block[0] = 0x80;
+    block[126] = 0x04;
+    block
+};
+
+/// SHA-384 of two 48-byte child digests. The 96-byte message fits in one
+/// block together with its padding, which is compressed directly.
+fn sha384_pair(left: &[u8], right: &[u8]) -> Output<Sha384> {
+    if left.len() != 48 || right.len() != 48 {
+        return Sha384::new_with_prefix(left).chain_update(right).finalize();
+    }
+
+    let mut block = GenericArray::<u8, U128>::default();
+    block[..48].copy_from_slice(left);
+    block[48..96].copy_from_slice(right);
+    block[96] = 0x80;
+    block[126] = 0x03;
+
+    let mut state = SHA384_IV;
+    sha2::compress512(&mut state, &[block]);
+
+    sha512_output::<Sha384>(state)
+}
+
+/// SHA-512 of two 64-byte child digests: one message block followed by a
+/// fixed padding block, both compressed directly as in [`sha256_pair`].
+fn sha512_pair(left: &[u8], right: &[u8]) -> Output<Sha512> {
+    if left.len() != 64 || right.len() != 64 {
+        return Sha512::new_with_prefix(left).chain_update(right).finalize();
+    }
+
+    let mut block = GenericArray::<u8, U128>::default();
+    block[..64].copy_from_slice(left);
+    block[64..].copy_from_slice(right);
+
+    let mut state = SHA512_IV;
+    sha2::compress512(
+        &mut state,
+        &[block, *GenericArray::from_slice(&SHA512_PAIR_PADDING)],
+    );
+
+    sha512_output::<Sha512>(state)
+}
+
+/// Serialize a final SHA-384 or SHA-512 state as the big-endian digest,
+/// truncated to the output size of `D`.
+fn sha512_output<D: OutputSizeUser>(state: [u64; 8]) -> Output<D> {
+    let mut out = Output::<D>::default();
+    for (chunk, word) in out.chunks_exact_mut(8).zip(state) {
+        chunk.copy_from_slice(&word.to_be_bytes());
+    }
+    out
+}
+
+/// Two SHA-256 pair digests, interleaved on SHA-NI when the CPU has it.
+fn sha256_pair_2x(pairs: [(&[u8], &[u8]); 2]) -> [Output<Sha256>; 2] {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    if pairs
+        .iter()
+        .all(|(left, right)| left.len() == 32 && right.len() == 32)
+        && sha256_x86::available()
+    {
+        let blocks = pairs.map(|(left, right)| {
+            let mut block = [0u8; 64];
+            block[..32].copy_from_slice(left);
+            block[32..].copy_from_slice(right);
+            block
+        });
+        // SAFETY: the required CPU features were detected above.
+        let states = unsafe { sha256_x86::digest_pairs_2x([&blocks[0], &blocks[1]]) };
+        return states.map(sha256_output);
+    }
+
+    pairs.map(|(left, right)| sha256_pair(left, right))
+}
+
+/// Longest message that fits in one SHA-256 block together with its
+/// `0x80` terminator and 64-bit length.
+#[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+const SHA256_SINGLE_BLOCK_MAX: usize = 55;
+
+/// Pad a message of at most [`SHA256_SINGLE_BLOCK_MAX`] bytes into the
+/// single block SHA-256 compresses for it.
+#[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+fn sha256_single_block(data: &[u8]) -> [u8; 64] {
+    let mut block = [0u8; 64];
+    block[..data.len()].copy_from_slice(data);
+    block[data.len()] = 0x80;
+    block[56..].copy_from_slice(&((data.len() as u64) * 8).to_be_bytes());
+    block
+}
+
+/// Deterministic bytes for the SIMD kernel tests, different for every `seed`.
+#[cfg(all(test, any(target_arch = "x86", target_arch = "x86_64")))]
+fn test_bytes<const N: usize>(seed: u8) -> [u8; N] {
+    core::array::from_fn(|i| (i as u8).wrapping_mul(31) ^ seed.wrapping_mul(97))
+}
+
+/// Two SHA-256 leaf digests, interleaved on SHA-NI when both messages fit
+/// in a single block and the CPU has it.
+fn sha256_2x(data: [&[u8]; 2]) -> [Output<Sha256>; 2] {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    if data.iter().all(|d| d.len() <= SHA256_SINGLE_BLOCK_MAX) && sha256_x86::available() {
+        let blocks = data.map(sha256_single_block);
+        // SAFETY: the required CPU features were detected above.
+        let states = unsafe { sha256_x86::digest_blocks_2x([&blocks[0], &blocks[1]]) };
+        return states.map(sha256_output);
+    }
+
+    data.map(Sha256::digest)
+}
+
+/// Four SHA-256 pair digests. SHA-NI runs them as two interleaved pairs;
+/// without it, they go through the four-lane SSE2 kernel.
+fn sha256_pair_4x([a, b, c, d]: [(&[u8], &[u8]); 4]) -> [Output<Sha256>; 4] {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    if [a, b, c, d]
+        .iter()
+        .all(|(left, right)| left.len() == 32 && right.len() == 32)
+        && !sha256_x86::available()
+        && sha256_sse2::available()
+    {
+        let blocks = [a, b, c, d].map(|(left, right)| {
+            let mut block = [0u8; 64];
+            block[..32].copy_from_slice(left);
+            block[32..].copy_from_slice(right);
+            block
+        });
+        // SAFETY: the required CPU features were detected above.
+        let states = unsafe { sha256_sse2::digest_pairs_4x(blocks.each_ref()) };
+        return states.map(sha256_output);
+    }
+
+    let [a, b] = sha256_pair_2x([a, b]);
+    let [c, d] = sha256_pair_2x([c, d]);
+    [a, b, c, d]
+}
+
+/// Four SHA-256 leaf digests. SHA-NI runs them as two interleaved pairs;
+/// without it, messages that fit in a single block go through the
+/// four-lane SSE2 kernel.
+fn sha256_4x([a, b, c, d]: [&[u8]; 4]) -> [Output<Sha256>; 4] {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    if [a, b, c, d]
+        .iter()
+        .all(|data| data.len() <= SHA256_SINGLE_BLOCK_MAX)
+        && !sha256_x86::available()
+        && sha256_sse2::available()
+    {
+        let blocks = [a, b, c, d].map(sha256_single_block);
+        // SAFETY: the required CPU features were detected above.
+        let states = unsafe { sha256_sse2::digest_blocks_4x(blocks.each_ref()) };
+        return states.map(sha256_output);
+    }
+
+    let [a, b] = sha256_2x([a, b]);
+    let [c, d] = sha256_2x([c, d]);
+    [a, b, c, d]
+}
+
+/// Serialize a final SHA-256 state as the big-endian digest.
+fn sha256_output(state: [u32; 8]) -> Output<Sha256> {
+    let mut out = Output::<Sha256>::default();
+    for (chunk, word) in out.chunks_exact_mut(4).zip(state) {
+        chunk.copy_from_slice(&word.to_be_bytes());
+    }
+    out
+}
+
+/// Four BLAKE2b-512 digests, interleaved on AVX2 when the messages have
+/// the same length and the CPU has it.
+fn blake2b_4x(data: [&[u8]; 4]) -> [Output<Blake2b512>; 4] {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    if data.iter().all(|d| d.len() == data[0].len()) && blake2b_x86::available() {
+        // SAFETY: the required CPU features were detected above.
+        let states = unsafe { blake2b_x86::digest_4x(data) };
+        return states.map(blake2b_output);
+    }
+
+    data.map(Blake2b512::digest)
+}
+
+/// Four BLAKE2b-512 pair digests, interleaved on AVX2 when the CPU has it.
+/// Two 64-byte child digests make exactly one message block.
+fn blake2b_pair_4x(pairs: [(&[u8], &[u8]); 4]) -> [Output<Blake2b512>; 4] {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    if pairs
+        .iter()
+        .all(|(left, right)| left.len() == 64 && right.len() == 64)
+        && blake2b_x86::available()
+    {
+        let blocks = pairs.map(|(left, right)| {
+            let mut block = [0u8; 128];
+            block[..64].copy_from_slice(left);
+            block[64..].copy_from_slice(right);
+            block
+        });
+        // SAFETY: the required CPU features were detected above.
+        let states = unsafe { blake2b_x86::digest_4x(blocks.each_ref().map(|b| b.as_slice())) };
+        return states.map(blake2b_output);
+    }
+
+    pairs.map(|(left, right)| {
+        Blake2b512::new_with_prefix(left)
+            .chain_update(right)
+            .finalize()
+    })
+}
+
+/// Serialize a final BLAKE2b-512 state as the little-endian digest.
+#[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+fn blake2b_output(state: [u64; 8]) -> Output<Blake2b512> {
+    let mut out = Output::<Blake2b512>::default();
+    for (chunk, word) in out.chunks_exact_mut(8).zip(state) {
+        chunk.copy_from_slice(&word.to_le_bytes());
+    }
+    out
+}
+
+/// Hash every buffer in `buffers` independently with `D`.
+///
+/// The GIL is released for the duration of the batch so the digest backend
+/// (which selects SHA-NI / ARMv8 SHA2 at runtime when available) runs over
+/// all buffers without re-entering the interpreter between leaves.
+pub(crate) fn digest_batch<D, B>(py: Python<'_>, buffers: &[B]) -> Vec<Output<D>>
+where
+    D: Digest,
+    B: AsRef<[u8]> + Sync,
+{
+    py.detach(|| {
+        buffers
+            .iter()
+            .map(|buffer| <D as Digest>::digest(buffer))
+            .collect()
+    })
+}
+
+/// Finish a copy of `state` with each buffer in `buffers` appended.
+///
+/// Data already absorbed into `state` (e.g. a shared key prefix) is hashed
+/// only once; every buffer resumes from that intermediate state.
+pub(crate) fn finalize_batch<D, B>(py: Python<'_>, state: &D, buffers: &[B]) -> Vec<Output<D>>
+where
+    D: Digest + Clone + Sync,
+    B: AsRef<[u8]> + Sync,
+{
+    py.detach(|| {
+        buffers
+            .iter()
+            .map(|buffer| state.clone().chain_update(buffer).finalize())
+            .collect()
+    })
 }
 
 macro_rules! py_digest {
-    ($classname:tt, $name:ident, $digest:ty, $size:ty, $output:tt) => {
+    ($classname:tt, $name:ident, $digest:ty, $size:ty, $output:tt $(, pair = $pair:path)? $(, pair_2x = $pair_2x:path)? $(, leaf_2x = $leaf_2x:path)? $(, leaf_4x = $leaf_4x:path)? $(, pair_4x = $pair_4x:path)?) => {
         #[derive(Debug, Clone)]
         #[pyclass(name = $classname, eq)]
         pub struct $name($digest);
@@ -84,7 +499,7 @@ macro_rules! py_digest {
             }
 
             fn finalize(self) -> Output<Self::Inner> {
-                self.0.finalize()
+                Digest::finalize(self.0)
             }
 
             fn finalize_reset(&mut self) -> Output<Self::Inner> {
@@ -98,14 +513,54 @@ macro_rules! py_digest {
             fn digest(data: &[u8]) -> Output<Self::Inner> {
                 <$digest>::digest(data)
             }
+
+            $(
+                fn digest_pair(left: &[u8], right: &[u8]) -> Output<Self::Inner> {
+                    $pair(left, right)
+                }
+            )?
+
+            $(
+                fn digest_pair_2x(pairs: [(&[u8], &[u8]); 2]) -> [Output<Self::Inner>; 2] {
+                    $pair_2x(pairs)
+                }
+            )?
+
+            $(
+                fn digest_2x(data: [&[u8]; 2]) -> [Output<Self::Inner>; 2] {
+                    $leaf_2x(data)
+                }
+            )?
+
+            $(
+                fn digest_4x(data: [&[u8]; 4]) -> [Output<Self::Inner>; 4] {
+                    $leaf_4x(data)
+                }
+            )?
+
+            $(
+                fn digest_pair_4x(pairs: [(&[u8], &[u8]); 4]) -> [Output<Self::Inner>; 4] {
+                    $pair_4x(pairs)
+                }
+            )?
         }
 
-        #[pymethods]
         impl $name {
-            #[new]
             pub fn new() -> Self {
                 <Self as PyDigest>::new()
             }
+        }
+
+        #[pymethods]
+        impl $name {
+            #[new]
+            #[pyo3(signature = (data = None))]
+            pub fn py_new(data: Option<PyBound<'_, PyBytes>>) -> Self {
+                match data {
+                    Some(data) => <Self as PyDigest>::new_with_prefix(data.as_bytes()),
+                    None => <Self as PyDigest>::new(),
+                }
+            }
 
             #[staticmethod]
             #[pyo3(name = "new_with_prefix")]
@@ -142,14 +597,53 @@ macro_rules! py_digest {
                 PyBytes::new(py, &result).unbind()
             }
 
+            #[staticmethod]
+            #[pyo3(name = "digest_batch")]
+            pub fn digest_batch_py(
+                py: Python<'_>,
+                buffers: Vec<PyBound<'_, PyAny>>,
+            ) -> PyResult<Vec<Py<PyBytes>>> {
+                let payloads = buffers
+                    .iter()
+                    .map(extract_to_bytes)
+                    .collect::<PyResult<Vec<_>>>()?;
+
+                Ok(digest_batch::<Self, _>(py, &payloads)
+                    .iter()
+                    .map(|hash| PyBytes::new(py, hash).unbind())
+                    .collect())
+            }
+
+            /// Return a copy of the current hashing state.
+            pub fn copy(&self) -> Self {
+                self.clone()
+            }
+
+            #[pyo3(name = "finalize_batch")]
+            pub fn finalize_batch_py(
+                &self,
+                py: Python<'_>,
+                buffers: Vec<PyBound<'_, PyAny>>,
+            ) -> PyResult<Vec<Py<PyBytes>>> {
+                let payloads = buffers
+                    .iter()
+                    .map(extract_to_bytes)
+                    .collect::<PyResult<Vec<_>>>()?;
+
+                Ok(finalize_batch(py, self, &payloads)
+                    .iter()
+                    .map(|hash| PyBytes::new(py, hash).unbind())
+                    .collect())
+            }
+
             #[staticmethod]
             pub fn output_size() -> usize {
                 <Self as PyDigest>::output_size()
             }
 
             #[staticmethod]
-            pub fn name() -> String {
-                <Self as PyDigest>::algorithm_name().to_string()
+            pub fn name(py: Python<'_>) -> PyBound<'_, PyString> {
+                intern!(py, $classname).clone()
             }
 
             fn __setattr__(&self, _name: &str, _value: Py<PyAny>) -> PyResult<()> {
@@ -236,7 +730,7 @@ macro_rules! py_digest {
             }
 
             fn finalize(self) -> crypto::digest::Output<Self> {
-                self.0.finalize()
+                Digest::finalize(self.0)
             }
 
             fn finalize_reset(&mut self) -> crypto::digest::Output<Self>
@@ -294,28 +788,36 @@ py_digest!(
     PySha224Wrapper,
     Sha224,
     crypto::digest::consts::U28,
-    28
+    28,
+    pair = sha224_pair
 );
 py_digest!(
     "sha256",
     PySha256Wrapper,
     Sha256,
     crypto::digest::consts::U32,
-    32
+    32,
+    pair = sha256_pair,
+    pair_2x = sha256_pair_2x,
+    leaf_2x = sha256_2x,
+    leaf_4x = sha256_4x,
+    pair_4x = sha256_pair_4x
 );
 py_digest!(
     "sha384",
     PySha384Wrapper,
     Sha384,
     crypto::digest::consts::U48,
-    48
+    48,
+    pair = sha384_pair
 );
 py_digest!(
     "sha512",
     PySha512Wrapper,
     Sha512,
     crypto::digest::consts::U64,
-    64
+    64,
+    pair = sha512_pair
 );
 
 // SHA-3/Keccak family
@@ -361,9 +863,53 @@ py_digest!(
     PyBlake2b512Wrapper,
     Blake2b512,
     crypto::digest::consts::U64,
-    64
+    64,
+    leaf_4x = blake2b_4x,
+    pair_4x = blake2b_pair_4x
 );
 
+// BLAKE3
+py_digest!(
+    "blake3",
+    PyBlake3Wrapper,
+    Blake3,
+    crypto::digest::consts::U32,
+    32
+);
+
+/// Canonical name of every registered digest class, paired with the aliases
+/// it is also looked up by. The Python `crypto` package builds its algorithm
+/// table from this list, so the two can not disagree.
+const ALGORITHMS: &[(&str, &[&str])] = &[
+    ("sha1", &[]),
+    ("sha224", &[]),
+    ("sha256", &[]),
+    ("sha384", &[]),
+    ("sha512", &[]),
+    ("keccak224", &[]),
+    ("keccak256", &[]),
+    ("keccak384", &[]),
+    ("keccak512", &[]),
+    ("blake2s256", &["blake2s"]),
+    ("blake2b512", &["blake2b"]),
+    ("blake3", &[]),
+];
+
+/// Return the canonical name of every registered digest.
+#[pyfunction]
+fn registered_algorithms() -> Vec<&'static str> {
+    ALGORITHMS.iter().map(|(name, _)| *name).collect()
+}
+
+/// Return a mapping from each digest alias to its canonical name.
+#[pyfunction]
+fn algorithm_aliases() -> HashMap<&'static str, &'static str> {
+    ALGORITHMS
+        .iter()
+        .flat_map(|(name, aliases)| aliases.iter().map(move |alias| (*alias, *name)))
+        .collect()
+}
+
 /// Register all custom crypto with the Python module.
 #[pymodule]
 pub(crate) fn register_crypto(m: &Bound<'_, PyModule>) -> PyResult<()> {
@@ -385,5 +931,15 @@ pub(crate) fn register_crypto(m: &Bound<'_, PyModule>) -> PyResult<()> {
     exce_m.add_class::<PyBlake2b512Wrapper>()?;
     exce_m.add_class::<PyBlake2s256Wrapper>()?;
 
+    exce_m.add_class::<PyBlake3Wrapper>()?;
+
+    exce_m.add_function(wrap_pyfunction!(registered_algorithms, &exce_m)?)?;
+    exce_m.add_function(wrap_pyfunction!(algorithm_aliases, &exce_m)?)?;
+
+    // Every name handed to Python must resolve to a registered class.
+    for (name, _) in ALGORITHMS {
+        exce_m.getattr(*name)?;
+    }
+
     m.add_submodule(&exce_m)
 }
@@ -0,0 +1,237 @@
+//! Four-way interleaved BLAKE2b-512 using AVX2.
+//!
+//! Four independent messages of the same length are hashed in lockstep:
+//! each 256-bit register holds one state word of all four messages, so
+//! every step of `G` advances the four compressions at once. Messages are
+//! transposed into that layout one block at a time. The rotations by 32,
+//! 24 and 16 are byte shuffles; the rotation by 63 is a shift and an add.
+
+#[cfg(target_arch = "x86")]
+use core::arch::x86::*;
+#[cfg(target_arch = "x86_64")]
+use core::arch::x86_64::*;
+
+/// BLAKE2b initialization vector (RFC 7693, section 2.6).
+const IV: [u64; 8] = [
+    0x6a09e667f3bcc908,
+    0xbb67ae8584caa73b,
+    0x3c6ef372fe94f82b,
+    0xa54ff53a5f1d36f1,
+    0x510e527fade682d1,
+    0x9b05688c2b3e6c1f,
+    0x1f83d9abfb41bd6b,
+    0x5be0cd19137e2179,
+];
+
+/// Parameter block word 0 for an unkeyed 64-byte digest: digest length,
+/// key length, fanout and depth.
+const PARAM_0: u64 = 0x0101_0040;
+
+/// Message word permutation of each round (RFC 7693, section 2.7).
+const SIGMA: [[usize; 16]; 12] = [
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+    [14, 10, 4, 8, 9, 15, 13, 6, 1, 12, 0, 2, 11, 7, 5, 3],
+    [11, 8, 12, 0, 5, 2, 15, 13, 10, 14, 3, 6, 7, 1, 9, 4],
+    [7, 9, 3, 1, 13, 12, 11, 14, 2, 6, 5, 10, 4, 0, 15, 8],
+    [9, 0, 5, 7, 2, 4, 10, 15, 14, 1, 11, 12, 6, 8, 3, 13],
+    [2, 12, 6, 10, 0, 11, 8, 3, 4, 13, 7, 5, 15, 14, 1, 9],
+    [12, 5, 1, 15, 14, 13, 4, 10, 0, 7, 6, 3, 9, 2, 8, 11],
+    [13, 11, 7, 14, 12, 1, 3, 9, 5, 0, 15, 4, 8, 6, 2, 10],
+    [6, 15, 14, 9, 11, 3, 0, 8, 12, 2, 13, 7, 1, 4, 10, 5],
+    [10, 2, 8, 4, 7, 6, 1, 5, 15, 11, 9, 14, 3, 12, 13, 0],
+    [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15],
+    [14, 10, 4, 8, 9, 15, 13, 6, 1, 12, 0, 2, 11, 7, 5, 3],
+];
+
+/// Bytes in one BLAKE2b message block.
+const BLOCK_LEN: usize = 128;
+
+/// Whether the running CPU supports the instructions used by [`digest_4x`].
+#[inline]
+pub(super) fn available() -> bool {
+    is_x86_feature_detected!("avx2")
+}
+
+/// Rotate every 64-bit lane right by `$n` bits, for the rotations in `G`.
+macro_rules! rotr {
+    ($x:expr, 32) => {
+        _mm256_shuffle_epi32($x, 0xB1)
+    };
+    ($x:expr, 24) => {
+        _mm256_shuffle_epi8(
+            $x,
+            _mm256_setr_epi8(
+                3, 4, 5, 6, 7, 0, 1, 2, 11, 12, 13, 14, 15, 8, 9, 10, 3, 4, 5, 6, 7, 0, 1, 2, 11,
+                12, 13, 14, 15, 8, 9, 10,
+            ),
+        )
+    };
+    ($x:expr, 16) => {
+        _mm256_shuffle_epi8(
+            $x,
+            _mm256_setr_epi8(
+                2, 3, 4, 5, 6, 7, 0, 1, 10, 11, 12, 13, 14, 15, 8, 9, 2, 3, 4, 5, 6, 7, 0, 1, 10,
+                11, 12, 13, 14, 15, 8, 9,
+            ),
+        )
+    };
+    ($x:expr, 63) => {{
+        let x = $x;
+        _mm256_or_si256(_mm256_srli_epi64(x, 63), _mm256_add_epi64(x, x))
+    }};
+}
+
+/// The BLAKE2b mixing function `G` on columns or diagonals of `$v`.
+macro_rules! g {
+    ($v:ident, $a:literal, $b:literal, $c:literal, $d:literal, $x:expr, $y:expr) => {
+        $v[$a] = _mm256_add_epi64(_mm256_add_epi64($v[$a], $v[$b]), $x);
+        $v[$d] = rotr!(_mm256_xor_si256($v[$d], $v[$a]), 32);
+        $v[$c] = _mm256_add_epi64($v[$c], $v[$d]);
+        $v[$b] = rotr!(_mm256_xor_si256($v[$b], $v[$c]), 24);
+        $v[$a] = _mm256_add_epi64(_mm256_add_epi64($v[$a], $v[$b]), $y);
+        $v[$d] = rotr!(_mm256_xor_si256($v[$d], $v[$a]), 16);
+        $v[$c] = _mm256_add_epi64($v[$c], $v[$d]);
+        $v[$b] = rotr!(_mm256_xor_si256($v[$b], $v[$c]), 63);
+    };
+}
+
+/// Compute the BLAKE2b-512 state after hashing each message in `inputs`.
+///
+/// All four messages must have the same length, so they share the block
+/// count, byte counter and final-block flag.
+///
+/// # Safety
+///
+/// The CPU must support the features checked by [`available`].
+#[allow(clippy::cast_ptr_alignment)]
+#[target_feature(enable = "avx2")]
+pub(super) unsafe fn digest_4x(inputs: [&[u8]; 4]) -> [[u64; 8]; 4] {
+    let len = inputs[0].len();
+    debug_assert!(inputs.iter().all(|input| input.len() == len));
+
+    unsafe {
+        let mut h: [__m256i; 8] = core::array::from_fn(|i| _mm256_set1_epi64x(IV[i] as i64));
+        h[0] = _mm256_xor_si256(h[0], _mm256_set1_epi64x(PARAM_0 as i64));
+
+        // An empty message still compresses one (all-zero) block.
+        let blocks = len.div_ceil(BLOCK_LEN).max(1);
+        for block in 0..blocks {
+            let start = block * BLOCK_LEN;
+            let end = (start + BLOCK_LEN).min(len);
+
+            // Transpose: word `j` of every lane's block into register `j`.
+            let mut words = [[0u64; 4]; 16];
+            for (lane, input) in inputs.iter().enumerate() {
+                let mut bytes = [0u8; BLOCK_LEN];
+                bytes[..end - start].copy_from_slice(&input[start..end]);
+                for (j, word) in bytes.chunks_exact(8).enumerate() {
+                    words[j][lane] = u64::from_le_bytes(word.try_into().expect("8-byte chunk"));
+                }
+            }
+            let m: [__m256i; 16] =
+                core::array::from_fn(|j| _mm256_loadu_si256(words[j].as_ptr() as *const __m256i));
+
+            let mut v: [__m256i; 16] = core::array::from_fn(|i| {
+                if i < 8 {
+                    h[i]
+                } else {
+                    _mm256_set1_epi64x(IV[i - 8] as i64)
+                }
+            });
+            // Messages are far below 2^64 bytes, so the high counter word
+            // stays zero.
+            v[12] = _mm256_xor_si256(v[12], _mm256_set1_epi64x(end as i64));
+            if block + 1 == blocks {
+                v[14] = _mm256_xor_si256(v[14], _mm256_set1_epi64x(-1));
+            }
+
+            for s in &SIGMA {
+                g!(v, 0, 4, 8, 12, m[s[0]], m[s[1]]);
+                g!(v, 1, 5, 9, 13, m[s[2]], m[s[3]]);
+                g!(v, 2, 6, 10, 14, m[s[4]], m[s[5]]);
+                g!(v, 3, 7, 11, 15, m[s[6]], m[s[7]]);
+                g!(v, 0, 5, 10, 15, m[s[8]], m[s[9]]);
+                g!(v, 1, 6, 11, 12, m[s[10]], m[s[11]]);
+                g!(v, 2, 7, 8, 13, m[s[12]], m[s[13]]);
+                g!(v, 3, 4, 9, 14, m[s[14]], m[s[15]]);
+            }
+
+            for i in 0..8 {
+                h[i] = _mm256_xor_si256(h[i], _mm256_xor_si256(v[i], v[i + 8]));
+            }
+        }
+
+        let mut words = [[0u64; 4]; 8];
+        for (word, h) in words.iter_mut().zip(h) {
+            _mm256_storeu_si256(word.as_mut_ptr() as *mut __m256i, h);
+        }
+        core::array::from_fn(|lane| core::array::from_fn(|i| words[i][lane]))
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use blake2::{Blake2b512, Digest};
+
+    use super::super::{blake2b_4x, blake2b_output, test_bytes};
+    use super::{BLOCK_LEN, available, digest_4x};
+
+    /// Longest message the tests hash.
+    const MAX_LEN: usize = 8 * BLOCK_LEN;
+
+    /// Hash four different messages of `len` bytes through the kernel and
+    /// compare every lane with `blake2`.
+    fn check_lanes(len: usize) {
+        let data: [[u8; MAX_LEN]; 4] = core::array::from_fn(|lane| test_bytes(lane as u8));
+        let inputs: [&[u8]; 4] = core::array::from_fn(|lane| &data[lane][..len]);
+        // SAFETY: callers check the required CPU features first.
+        let states = unsafe { digest_4x(inputs) };
+        for (state, input) in states.into_iter().zip(inputs) {
+            assert_eq!(
+                blake2b_output(state),
+                Blake2b512::digest(input),
+                "len {len}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_digest_4x_empty() {
+        if !available() {
+            return;
+        }
+
+        check_lanes(0);
+    }
+
+    #[test]
+    fn test_digest_4x_one_block() {
+        if !available() {
+            return;
+        }
+
+        check_lanes(BLOCK_LEN);
+    }
+
+    #[test]
+    fn test_digest_4x_multi_block() {
+        if !available() {
+            return;
+        }
+
+        for len in [1, BLOCK_LEN - 1, BLOCK_LEN + 1, 2 * BLOCK_LEN, MAX_LEN - 24] {
+            check_lanes(len);
+        }
+    }
+
+    #[test]
+    fn test_blake2b_4x_lanes_of_different_lengths() {
+        // The kernel needs equal lengths; mixed ones must still hash right.
+        let data: [[u8; MAX_LEN]; 4] = core::array::from_fn(|lane| test_bytes(lane as u8));
+        let lens = [0, BLOCK_LEN, BLOCK_LEN + 1, 3 * BLOCK_LEN];
+        let inputs: [&[u8]; 4] = core::array::from_fn(|lane| &data[lane][..lens[lane]]);
+        for (digest, input) in blake2b_4x(inputs).into_iter().zip(inputs) {
+            assert_eq!(digest, Blake2b512::digest(input));
+        }
+    }
+}
@@ -0,0 +1,201 @@
+//! Four-way interleaved SHA-256 using SSE2, for CPUs without SHA-NI.
+//!
+//! Four independent single-block messages are hashed in lockstep: each
+//! 128-bit register holds one state or schedule word of all four
+//! messages, so every step of a round advances the four compressions at
+//! once. SSE2 has no rotate, so each rotation is two shifts and an OR. The
+//! words are byte-swapped while the blocks are transposed into that layout.
+
+#[cfg(target_arch = "x86")]
+use core::arch::x86::*;
+#[cfg(target_arch = "x86_64")]
+use core::arch::x86_64::*;
+
+use super::SHA256_IV;
+use super::sha256_x86::{K, PADDING_WK};
+
+/// Whether the running CPU supports the instructions used by [`digest_blocks_4x`].
+#[inline]
+pub(super) fn available() -> bool {
+    is_x86_feature_detected!("sse2")
+}
+
+/// Rotate every 32-bit lane right by `$n` bits.
+macro_rules! rotr {
+    ($x:expr, $n:literal) => {{
+        let x = $x;
+        _mm_or_si128(_mm_srli_epi32(x, $n), _mm_slli_epi32(x, 32 - $n))
+    }};
+}
+
+/// Run the 64 rounds over `state`, given each round's `W + K` words, and
+/// add the result to the state the rounds started from.
+#[inline]
+#[target_feature(enable = "sse2")]
+unsafe fn rounds(state: &mut [__m128i; 8], wk: &[__m128i; 64]) {
+    let [mut a, mut b, mut c, mut d, mut e, mut f, mut g, mut h] = *state;
+
+    for wk in wk {
+        let s1 = _mm_xor_si128(_mm_xor_si128(rotr!(e, 6), rotr!(e, 11)), rotr!(e, 25));
+        let ch = _mm_xor_si128(_mm_and_si128(e, f), _mm_andnot_si128(e, g));
+        let t1 = _mm_add_epi32(_mm_add_epi32(h, s1), _mm_add_epi32(ch, *wk));
+        let s0 = _mm_xor_si128(_mm_xor_si128(rotr!(a, 2), rotr!(a, 13)), rotr!(a, 22));
+        let maj = _mm_or_si128(_mm_and_si128(a, b), _mm_and_si128(c, _mm_or_si128(a, b)));
+        let t2 = _mm_add_epi32(s0, maj);
+
+        (h, g, f) = (g, f, e);
+        e = _mm_add_epi32(d, t1);
+        (d, c, b) = (c, b, a);
+        a = _mm_add_epi32(t1, t2);
+    }
+
+    for (word, new) in state.iter_mut().zip([a, b, c, d, e, f, g, h]) {
+        *word = _mm_add_epi32(*word, new);
+    }
+}
+
+/// Compress one 64-byte block from each lane into `state`.
+#[inline]
+#[allow(clippy::cast_ptr_alignment)]
+#[target_feature(enable = "sse2")]
+unsafe fn compress_block(state: &mut [__m128i; 8], blocks: [&[u8; 64]; 4]) {
+    unsafe {
+        // Transpose: big-endian word `j` of every lane's block into `w[j]`.
+        let mut words = [[0u32; 4]; 16];
+        for (lane, block) in blocks.iter().enumerate() {
+            for (j, word) in block.chunks_exact(4).enumerate() {
+                words[j][lane] = u32::from_be_bytes(word.try_into().expect("4-byte chunk"));
+            }
+        }
+
+        let mut w = [_mm_setzero_si128(); 64];
+        for (w, words) in w.iter_mut().zip(&words) {
+            *w = _mm_loadu_si128(words.as_ptr() as *const __m128i);
+        }
+        for i in 16..64 {
+            let s0 = _mm_xor_si128(
+                _mm_xor_si128(rotr!(w[i - 15], 7), rotr!(w[i - 15], 18)),
+                _mm_srli_epi32(w[i - 15], 3),
+            );
+            let s1 = _mm_xor_si128(
+                _mm_xor_si128(rotr!(w[i - 2], 17), rotr!(w[i - 2], 19)),
+                _mm_srli_epi32(w[i - 2], 10),
+            );
+            w[i] = _mm_add_epi32(_mm_add_epi32(w[i - 16], s0), _mm_add_epi32(w[i - 7], s1));
+        }
+        for (w, k) in w.iter_mut().zip(K) {
+            *w = _mm_add_epi32(*w, _mm_set1_epi32(k as i32));
+        }
+
+        rounds(state, &w);
+    }
+}
+
+/// Load the SHA-256 initial state into every lane.
+#[inline]
+#[target_feature(enable = "sse2")]
+unsafe fn load_iv() -> [__m128i; 8] {
+    SHA256_IV.map(|word| _mm_set1_epi32(word as i32))
+}
+
+/// Split the lockstep state back into one state array per lane.
+#[inline]
+#[allow(clippy::cast_ptr_alignment)]
+#[target_feature(enable = "sse2")]
+unsafe fn store_state(state: [__m128i; 8]) -> [[u32; 8]; 4] {
+    unsafe {
+        let mut words = [[0u32; 4]; 8];
+        for (word, state) in words.iter_mut().zip(state) {
+            _mm_storeu_si128(word.as_mut_ptr() as *mut __m128i, state);
+        }
+        core::array::from_fn(|lane| core::array::from_fn(|i| words[i][lane]))
+    }
+}
+
+/// Compute the SHA-256 state after hashing each 64-byte block in `blocks`
+/// as a complete message.
+///
+/// # Safety
+///
+/// The CPU must support the features checked by [`available`].
+#[target_feature(enable = "sse2")]
+pub(super) unsafe fn digest_pairs_4x(blocks: [&[u8; 64]; 4]) -> [[u32; 8]; 4] {
+    unsafe {
+        let mut state = load_iv();
+
+        // Message block: the concatenated child digests.
+        compress_block(&mut state, blocks);
+
+        // Padding block: the schedule is constant, only the rounds remain.
+        let padding = PADDING_WK.map(|wk| _mm_set1_epi32(wk as i32));
+        rounds(&mut state, &padding);
+
+        store_state(state)
+    }
+}
+
+/// Compute the SHA-256 state after compressing each block in `blocks`,
+/// which must already hold a whole message together with its padding.
+///
+/// # Safety
+///
+/// The CPU must support the features checked by [`available`].
+#[target_feature(enable = "sse2")]
+pub(super) unsafe fn digest_blocks_4x(blocks: [&[u8; 64]; 4]) -> [[u32; 8]; 4] {
+    unsafe {
+        let mut state = load_iv();
+        compress_block(&mut state, blocks);
+        store_state(state)
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use sha2::{Digest, Sha256};
+
+    use super::super::{SHA256_SINGLE_BLOCK_MAX, sha256_output, sha256_single_block, test_bytes};
+    use super::{available, digest_blocks_4x, digest_pairs_4x};
+
+    #[test]
+    fn test_digest_pairs_4x_matches_sha2() {
+        if !available() {
+            return;
+        }
+
+        for seed in (0..64).step_by(4) {
+            let blocks: [[u8; 64]; 4] = core::array::from_fn(|lane| test_bytes(seed + lane as u8));
+            // SAFETY: the required CPU features were detected above.
+            let states = unsafe { digest_pairs_4x(blocks.each_ref()) };
+            for (state, block) in states.into_iter().zip(&blocks) {
+                assert_eq!(sha256_output(state), Sha256::digest(block));
+            }
+        }
+    }
+
+    #[test]
+    fn test_digest_blocks_4x_matches_sha2() {
+        if !available() {
+            return;
+        }
+
+        // Every length a single block holds, with the four lanes of a call
+        // at different lengths and contents.
+        for len in 0..=SHA256_SINGLE_BLOCK_MAX {
+            let data: [[u8; 55]; 4] =
+                core::array::from_fn(|lane| test_bytes(len as u8 ^ lane as u8));
+            let lens = [
+                len,
+                SHA256_SINGLE_BLOCK_MAX - len,
+                len / 2,
+                (len * 7) % (SHA256_SINGLE_BLOCK_MAX + 1),
+            ];
+            let messages: [&[u8]; 4] = core::array::from_fn(|lane| &data[lane][..lens[lane]]);
+            let blocks = messages.map(sha256_single_block);
+            // SAFETY: the required CPU features were detected above.
+            let states = unsafe { digest_blocks_4x(blocks.each_ref()) };
+            for (state, message) in states.into_iter().zip(messages) {
+                assert_eq!(sha256_output(state), Sha256::digest(message));
+            }
+        }
+    }
+}
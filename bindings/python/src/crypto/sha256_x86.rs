@@ -0,0 +1,308 @@
+//! Two-way interleaved SHA-256 using SHA-NI.
+//!
+//! Two independent messages are advanced round for round side by side, so
+//! the latency of one `sha256rnds2` chain is hidden behind the other. Two
+//! shapes of message are covered: a pair of child digests, which is one
+//! 64-byte block (`left || right`) followed by the constant padding block,
+//! and a short leaf that fits in a single block together with its padding.
+//! The padding block's message schedule never changes, so it is folded
+//! together with the round constants at compile time and its compression
+//! only issues the round instructions.
+
+#[cfg(target_arch = "x86")]
+use core::arch::x86::*;
+#[cfg(target_arch = "x86_64")]
+use core::arch::x86_64::*;
+
+use super::SHA256_IV;
+
+/// SHA-256 round constants (FIPS 180-4, section 4.2.2).
+pub(super) const K: [u32; 64] = [
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+];
+
+/// Message schedule of the padding block after a 64-byte message, with the
+/// round constants already added.
+pub(super) const PADDING_WK: [u32; 64] = {
+    let mut w = [0u32; 64];
+    w[0] = 0x8000_0000;
+    w[15] = 512;
+
+    let mut i = 16;
+    while i < 64 {
+        let s0 = w[i - 15].rotate_right(7) ^ w[i - 15].rotate_right(18) ^ (w[i - 15] >> 3);
+        let s1 = w[i - 2].rotate_right(17) ^ w[i - 2].rotate_right(19) ^ (w[i - 2] >> 10);
+        w[i] = w[i - 16]
+            .wrapping_add(s0)
+            .wrapping_add(w[i - 7])
+            .wrapping_add(s1);
+        i += 1;
+    }
+
+    let mut i = 0;
+    while i < 64 {
+        w[i] = w[i].wrapping_add(K[i]);
+        i += 1;
+    }
+    w
+};
+
+/// Whether the running CPU supports the instructions used by [`digest_pairs_2x`].
+#[inline]
+pub(super) fn available() -> bool {
+    is_x86_feature_detected!("sha")
+        && is_x86_feature_detected!("sse2")
+        && is_x86_feature_detected!("ssse3")
+        && is_x86_feature_detected!("sse4.1")
+}
+
+/// Next four message schedule words from the previous sixteen.
+macro_rules! schedule {
+    ($v0:expr, $v1:expr, $v2:expr, $v3:expr) => {{
+        let t1 = _mm_sha256msg1_epu32($v0, $v1);
+        let t2 = _mm_alignr_epi8($v3, $v2, 4);
+        _mm_sha256msg2_epu32(_mm_add_epi32(t1, t2), $v3)
+    }};
+}
+
+/// Four rounds on both lanes, given each lane's `W + K` words.
+macro_rules! rounds4 {
+    ($abef:ident, $cdgh:ident, $wk0:expr, $wk1:expr) => {{
+        let wk0 = $wk0;
+        let wk1 = $wk1;
+        $cdgh[0] = _mm_sha256rnds2_epu32($cdgh[0], $abef[0], wk0);
+        $cdgh[1] = _mm_sha256rnds2_epu32($cdgh[1], $abef[1], wk1);
+        $abef[0] = _mm_sha256rnds2_epu32($abef[0], $cdgh[0], _mm_shuffle_epi32(wk0, 0x0E));
+        $abef[1] = _mm_sha256rnds2_epu32($abef[1], $cdgh[1], _mm_shuffle_epi32(wk1, 0x0E));
+    }};
+}
+
+/// Four message block rounds on both lanes using schedule words `$w`.
+macro_rules! block_rounds4 {
+    ($abef:ident, $cdgh:ident, $w:ident, $i:expr) => {{
+        let k = _mm_loadu_si128(K.as_ptr().add(4 * $i) as *const __m128i);
+        rounds4!(
+            $abef,
+            $cdgh,
+            _mm_add_epi32($w[0], k),
+            _mm_add_epi32($w[1], k)
+        );
+    }};
+}
+
+/// Extend the schedule on both lanes into `$w4`, then run its four rounds.
+macro_rules! schedule_rounds4 {
+    (
+        $abef:ident, $cdgh:ident,
+        $w0:ident, $w1:ident, $w2:ident, $w3:ident, $w4:ident,
+        $i:expr
+    ) => {{
+        $w4 = [
+            schedule!($w0[0], $w1[0], $w2[0], $w3[0]),
+            schedule!($w0[1], $w1[1], $w2[1], $w3[1]),
+        ];
+        block_rounds4!($abef, $cdgh, $w4, $i);
+    }};
+}
+
+/// Convert the `ABEF`/`CDGH` register layout back into a state array.
+macro_rules! store_state {
+    ($abef:expr, $cdgh:expr) => {{
+        let feba = _mm_shuffle_epi32($abef, 0x1B);
+        let dchg = _mm_shuffle_epi32($cdgh, 0xB1);
+        let dcba = _mm_blend_epi16(feba, dchg, 0xF0);
+        let hgef = _mm_alignr_epi8(dchg, feba, 8);
+
+        let mut state = [0u32; 8];
+        let state_ptr = state.as_mut_ptr() as *mut __m128i;
+        _mm_storeu_si128(state_ptr, dcba);
+        _mm_storeu_si128(state_ptr.add(1), hgef);
+        state
+    }};
+}
+
+/// Load the SHA-256 initial state in the `ABEF`/`CDGH` register layout.
+macro_rules! load_iv {
+    () => {{
+        let state_ptr = SHA256_IV.as_ptr() as *const __m128i;
+        let dcba = _mm_loadu_si128(state_ptr);
+        let efgh = _mm_loadu_si128(state_ptr.add(1));
+        let cdab = _mm_shuffle_epi32(dcba, 0xB1);
+        let efgh = _mm_shuffle_epi32(efgh, 0x1B);
+        (
+            _mm_alignr_epi8(cdab, efgh, 8),
+            _mm_blend_epi16(efgh, cdab, 0xF0),
+        )
+    }};
+}
+
+/// Compress one 64-byte message block into each lane's state, including
+/// the feed-forward of the state the block started from.
+macro_rules! compress_block {
+    ($abef:ident, $cdgh:ident, $blocks:expr) => {{
+        let mask = _mm_set_epi64x(
+            0x0C0D_0E0F_0809_0A0Bu64 as i64,
+            0x0405_0607_0001_0203u64 as i64,
+        );
+        let (abef_in, cdgh_in) = ($abef, $cdgh);
+
+        let data = [
+            $blocks[0].as_ptr() as *const __m128i,
+            $blocks[1].as_ptr() as *const __m128i,
+        ];
+        let mut w0 = [
+            _mm_shuffle_epi8(_mm_loadu_si128(data[0]), mask),
+            _mm_shuffle_epi8(_mm_loadu_si128(data[1]), mask),
+        ];
+        let mut w1 = [
+            _mm_shuffle_epi8(_mm_loadu_si128(data[0].add(1)), mask),
+            _mm_shuffle_epi8(_mm_loadu_si128(data[1].add(1)), mask),
+        ];
+        let mut w2 = [
+            _mm_shuffle_epi8(_mm_loadu_si128(data[0].add(2)), mask),
+            _mm_shuffle_epi8(_mm_loadu_si128(data[1].add(2)), mask),
+        ];
+        let mut w3 = [
+            _mm_shuffle_epi8(_mm_loadu_si128(data[0].add(3)), mask),
+            _mm_shuffle_epi8(_mm_loadu_si128(data[1].add(3)), mask),
+        ];
+        let mut w4;
+
+        block_rounds4!($abef, $cdgh, w0, 0);
+        block_rounds4!($abef, $cdgh, w1, 1);
+        block_rounds4!($abef, $cdgh, w2, 2);
+        block_rounds4!($abef, $cdgh, w3, 3);
+        schedule_rounds4!($abef, $cdgh, w0, w1, w2, w3, w4, 4);
+        schedule_rounds4!($abef, $cdgh, w1, w2, w3, w4, w0, 5);
+        schedule_rounds4!($abef, $cdgh, w2, w3, w4, w0, w1, 6);
+        schedule_rounds4!($abef, $cdgh, w3, w4, w0, w1, w2, 7);
+        schedule_rounds4!($abef, $cdgh, w4, w0, w1, w2, w3, 8);
+        schedule_rounds4!($abef, $cdgh, w0, w1, w2, w3, w4, 9);
+        schedule_rounds4!($abef, $cdgh, w1, w2, w3, w4, w0, 10);
+        schedule_rounds4!($abef, $cdgh, w2, w3, w4, w0, w1, 11);
+        schedule_rounds4!($abef, $cdgh, w3, w4, w0, w1, w2, 12);
+        schedule_rounds4!($abef, $cdgh, w4, w0, w1, w2, w3, 13);
+        schedule_rounds4!($abef, $cdgh, w0, w1, w2, w3, w4, 14);
+        schedule_rounds4!($abef, $cdgh, w1, w2, w3, w4, w0, 15);
+
+        $abef = [
+            _mm_add_epi32($abef[0], abef_in[0]),
+            _mm_add_epi32($abef[1], abef_in[1]),
+        ];
+        $cdgh = [
+            _mm_add_epi32($cdgh[0], cdgh_in[0]),
+            _mm_add_epi32($cdgh[1], cdgh_in[1]),
+        ];
+    }};
+}
+
+/// Compute the SHA-256 state after hashing each 64-byte block in `blocks`
+/// as a complete message.
+///
+/// # Safety
+///
+/// The CPU must support the features checked by [`available`].
+#[allow(clippy::cast_ptr_alignment)]
+#[target_feature(enable = "sha,sse2,ssse3,sse4.1")]
+pub(super) unsafe fn digest_pairs_2x(blocks: [&[u8; 64]; 2]) -> [[u32; 8]; 2] {
+    unsafe {
+        let (iv_abef, iv_cdgh) = load_iv!();
+        let mut abef = [iv_abef; 2];
+        let mut cdgh = [iv_cdgh; 2];
+
+        // Message block: the concatenated child digests.
+        compress_block!(abef, cdgh, blocks);
+        let (abef_mid, cdgh_mid) = (abef, cdgh);
+
+        // Padding block: the schedule is constant, only the rounds remain.
+        for i in 0..16 {
+            let wk = _mm_loadu_si128(PADDING_WK.as_ptr().add(4 * i) as *const __m128i);
+            rounds4!(abef, cdgh, wk, wk);
+        }
+
+        [
+            store_state!(
+                _mm_add_epi32(abef[0], abef_mid[0]),
+                _mm_add_epi32(cdgh[0], cdgh_mid[0])
+            ),
+            store_state!(
+                _mm_add_epi32(abef[1], abef_mid[1]),
+                _mm_add_epi32(cdgh[1], cdgh_mid[1])
+            ),
+        ]
+    }
+}
+
+/// Compute the SHA-256 state after compressing each block in `blocks`,
+/// which must already hold a whole message together with its padding.
+///
+/// # Safety
+///
+/// The CPU must support the features checked by [`available`].
+#[allow(clippy::cast_ptr_alignment)]
+#[target_feature(enable = "sha,sse2,ssse3,sse4.1")]
+pub(super) unsafe fn digest_blocks_2x(blocks: [&[u8; 64]; 2]) -> [[u32; 8]; 2] {
+    unsafe {
+        let (iv_abef, iv_cdgh) = load_iv!();
+        let mut abef = [iv_abef; 2];
+        let mut cdgh = [iv_cdgh; 2];
+
+        compress_block!(abef, cdgh, blocks);
+
+        [
+            store_state!(abef[0], cdgh[0]),
+            store_state!(abef[1], cdgh[1]),
+        ]
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use sha2::{Digest, Sha256};
+
+    use super::super::{SHA256_SINGLE_BLOCK_MAX, sha256_output, sha256_single_block, test_bytes};
+    use super::{available, digest_blocks_2x, digest_pairs_2x};
+
+    #[test]
+    fn test_digest_pairs_2x_matches_sha2() {
+        if !available() {
+            return;
+        }
+
+        for seed in (0..32).step_by(2) {
+            let blocks = [test_bytes::<64>(seed), test_bytes::<64>(seed + 1)];
+            // SAFETY: the required CPU features were detected above.
+            let states = unsafe { digest_pairs_2x([&blocks[0], &blocks[1]]) };
+            for (state, block) in states.into_iter().zip(&blocks) {
+                assert_eq!(sha256_output(state), Sha256::digest(block));
+            }
+        }
+    }
+
+    #[test]
+    fn test_digest_blocks_2x_matches_sha2() {
+        if !available() {
+            return;
+        }
+
+        // Every length a single block holds, with the two lanes of a call
+        // at different lengths and contents.
+        for len in 0..=SHA256_SINGLE_BLOCK_MAX {
+            let data = [test_bytes::<55>(len as u8), test_bytes::<55>(!(len as u8))];
+            let messages = [&data[0][..len], &data[1][..SHA256_SINGLE_BLOCK_MAX - len]];
+            let blocks = messages.map(sha256_single_block);
+            // SAFETY: the required CPU features were detected above.
+            let states = unsafe { digest_blocks_2x([&blocks[0], &blocks[1]]) };
+            for (state, message) in states.into_iter().zip(messages) {
+                assert_eq!(sha256_output(state), Sha256::digest(message));
+            }
+        }
+    }
+}
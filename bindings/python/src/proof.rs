@@ -1,8 +1,12 @@
+use std::collections::hash_map::Entry;
+use std::sync::OnceLock;
+
 use pyo3::intern;
 use pyo3::prelude::*;
 use pyo3::sync::OnceLockExt;
 
 use pyo3::Bound as PyBound;
+use pyo3::pycell::PyRef;
 
 use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
 use pyo3::types::{PyModule, PySequence, PyType};
@@ -10,24 +14,51 @@ use pyo3::types::{PyModule, PySequence, PyType};
 use mrkle::error::{ProofError, TreeError};
 use mrkle::{GenericArray, MrkleProof, Node, NodeIndex, ProofLevel, ProofPath};
 
+use rustc_hash::FxHashMap as FastHashMap;
+
 use crate::{
     MRKLE_MODULE,
     crypto::{
-        PyBlake2b512Wrapper, PyBlake2s256Wrapper, PyKeccak224Wrapper, PyKeccak256Wrapper,
-        PyKeccak384Wrapper, PyKeccak512Wrapper, PySha1Wrapper, PySha224Wrapper, PySha256Wrapper,
-        PySha384Wrapper, PySha512Wrapper,
+        PyBlake2b512Wrapper, PyBlake2s256Wrapper, PyBlake3Wrapper, PyKeccak224Wrapper,
+        PyKeccak256Wrapper, PyKeccak384Wrapper, PyKeccak512Wrapper, PySha1Wrapper, PySha224Wrapper,
+        PySha256Wrapper, PySha384Wrapper, PySha512Wrapper,
     },
     errors::{ProofError as PyProofError, TreeError as PyTreeError},
     tree::{
-        PyMrkleNode_Blake2b, PyMrkleNode_Blake2s, PyMrkleNode_Keccak224, PyMrkleNode_Keccak256,
-        PyMrkleNode_Keccak384, PyMrkleNode_Keccak512, PyMrkleNode_Sha1, PyMrkleNode_Sha224,
-        PyMrkleNode_Sha256, PyMrkleNode_Sha384, PyMrkleNode_Sha512, PyMrkleTreeBlake2b,
-        PyMrkleTreeBlake2s, PyMrkleTreeKeccak224, PyMrkleTreeKeccak256, PyMrkleTreeKeccak384,
-        PyMrkleTreeKeccak512, PyMrkleTreeSha1, PyMrkleTreeSha224, PyMrkleTreeSha256,
-        PyMrkleTreeSha384, PyMrkleTreeSha512,
+        PyMrkleNode_Blake2b, PyMrkleNode_Blake2s, PyMrkleNode_Blake3, PyMrkleNode_Keccak224,
+        PyMrkleNode_Keccak256, PyMrkleNode_Keccak384, PyMrkleNode_Keccak512, PyMrkleNode_Sha1,
+        PyMrkleNode_Sha224, PyMrkleNode_Sha256, PyMrkleNode_Sha384, PyMrkleNode_Sha512,
+        PyMrkleTreeBlake2b, PyMrkleTreeBlake2s, PyMrkleTreeBlake3, PyMrkleTreeKeccak224,
+        PyMrkleTreeKeccak256, PyMrkleTreeKeccak384, PyMrkleTreeKeccak512, PyMrkleTreeSha1,
+        PyMrkleTreeSha224, PyMrkleTreeSha256, PyMrkleTreeSha384, PyMrkleTreeSha512,
     },
 };
 
+static TREE_TYPE: OnceLock<Py<PyAny>> = OnceLock::new();
+static NODE_TYPE: OnceLock<Py<PyAny>> = OnceLock::new();
+
+/// Return the attribute `name` of the `mrkle` package, cached in `cell`.
+///
+/// It is looked up once, so generating or verifying a proof does not go
+/// through the import system on every call.
+fn mrkle_attr<'py>(
+    py: Python<'py>,
+    cell: &'static OnceLock<Py<PyAny>>,
+    name: &str,
+) -> PyResult<PyBound<'py, PyAny>> {
+    if let Some(attr) = cell.get() {
+        return Ok(attr.bind(py).clone());
+    }
+
+    let module = PyModule::import(py, intern!(py, "mrkle"))?;
+    MRKLE_MODULE.get_or_init_py_attached(py, || module.clone().unbind());
+    let attr = module.getattr(name)?;
+    Ok(cell
+        .get_or_init_py_attached(py, || attr.unbind())
+        .bind(py)
+        .clone())
+}
+
 macro_rules! py_mrkle_proof {
     ($name:ident, $digest:ty, $tree:ty, $node:ty, $classname:literal) => {
         #[pyclass]
@@ -41,10 +72,62 @@ macro_rules! py_mrkle_proof {
         unsafe impl Send for $name {}
 
         impl $name {
+            /// The level proving `current` against its parent, paired with the
+            /// parent's index, or `None` once `current` has no parent.
+            fn proof_level(
+                tree: &$tree,
+                current_idx: NodeIndex<usize>,
+            ) -> Result<Option<(NodeIndex<usize>, ProofLevel<$digest>)>, ProofError> {
+                let Some(node) = tree.get(current_idx.index()) else {
+                    return Ok(None);
+                };
+
+                let Some(parent_idx) = node.parent() else {
+                    // Reached a node with no parent (should be root)
+                    return Ok(None);
+                };
+
+                let parent = tree.get(parent_idx.index()).ok_or(ProofError::from(
+                    TreeError::IndexOutOfBounds {
+                        index: parent_idx.index(),
+                        len: tree.len(),
+                    },
+                ))?;
+
+                let children = parent.children();
+                let position =
+                    children
+                        .iter()
+                        .position(|&idx| idx == current_idx)
+                        .ok_or(ProofError::from(TreeError::IndexOutOfBounds {
+                            index: current_idx.index(),
+                            len: tree.len(),
+                        }))?;
+
+                let mut siblings = Vec::with_capacity(children.len() - 1);
+                for (i, &child_idx) in children.iter().enumerate() {
+                    if i != position {
+                        let sibling = tree.get(child_idx.index()).ok_or(ProofError::from(
+                            TreeError::IndexOutOfBounds {
+                                index: child_idx.index(),
+                                len: tree.len(),
+                            },
+                        ))?;
+                        siblings.push(sibling.hash().clone());
+                    }
+                }
+
+                Ok(Some((parent_idx, ProofLevel::new(position, siblings))))
+            }
+
+            /// Walk up from `leaf` to `root`. Levels already built for another
+            /// leaf of the same batch are taken from `levels`, so ancestors
+            /// shared by several leaves are gathered from the tree once.
             fn generate_path(
                 tree: &$tree,
                 root: NodeIndex<usize>,
                 leaf: NodeIndex<usize>,
+                levels: &mut FastHashMap<NodeIndex<usize>, (NodeIndex<usize>, ProofLevel<$digest>)>,
             ) -> Result<ProofPath<$digest>, ProofError> {
                 if leaf > tree.len() {
                     return Err(ProofError::InvalidSize);
@@ -57,51 +140,152 @@ macro_rules! py_mrkle_proof {
                 let mut path = Vec::new();
                 let mut current_idx = leaf;
 
-                // Walk up from leaf to root
-                while let Some(node) = tree.get(current_idx.index()) {
-                    if current_idx == root {
-                        break;
+                while current_idx != root {
+                    let (parent_idx, level) = match levels.entry(current_idx) {
+                        Entry::Occupied(entry) => entry.get().clone(),
+                        Entry::Vacant(entry) => match Self::proof_level(tree, current_idx)? {
+                            Some(found) => entry.insert(found).clone(),
+                            None => break,
+                        },
+                    };
+
+                    path.push(level);
+
+                    // Move to parent for next iteration
+                    current_idx = parent_idx;
+                }
+                Ok(ProofPath::new(path))
+            }
+
+            /// Borrow the backend tree of a `MrkleTree` and resolve `leaves`,
+            /// with negative indexing, against it.
+            fn resolve_leaves<'py>(
+                tree: &PyBound<'py, PyAny>,
+                leaves: &[isize],
+            ) -> PyResult<(PyRef<'py, $tree>, NodeIndex<usize>, Vec<NodeIndex<usize>>)> {
+                let py = tree.py();
+
+                let ttype = mrkle_attr(py, &TREE_TYPE, "MrkleTree")?;
+
+                if !tree.is_instance(&ttype)? {
+                    return Err(PyTypeError::new_err("Expected a MrkleTree instance"));
+                }
+
+                if leaves.is_empty() {
+                    return Err(PyValueError::new_err(
+                        "Must provide at least one leaf index",
+                    ));
+                }
+
+                // Borrow the _inner attribute which contains the actual Rust tree
+                let internal_tree = tree
+                    .getattr(intern!(py, "_inner"))?
+                    .extract::<PyRef<'py, $tree>>()?;
+
+                // Get tree information
+                let tree_len = internal_tree.len() as isize;
+                let root = internal_tree
+                    .inner
+                    .start()
+                    .ok_or_else(|| PyTreeError::new_err("Tree has no root"))?;
+
+                // Convert Python indices (with negative indexing support) to NodeIndex
+                let mut node_indices = Vec::with_capacity(leaves.len());
+
+                for &index in leaves {
+                    let mut normalized_idx = index;
+
+                    // Handle negative indexing
+                    if normalized_idx < 0 {
+                        normalized_idx = tree_len
+                            .checked_add(normalized_idx)
+                            .ok_or_else(|| PyIndexError::new_err("index out of range"))?;
                     }
 
-                    if let Some(parent_idx) = node.parent() {
-                        let parent = tree.get(parent_idx.index()).ok_or(ProofError::from(
-                            TreeError::IndexOutOfBounds {
-                                index: parent_idx.index(),
-                                len: tree.len(),
-                            },
-                        ))?;
+                    // Validate bounds
+                    if normalized_idx < 0 || normalized_idx >= tree_len {
+                        return Err(PyIndexError::new_err(format!(
+                            "leaf index {} out of range (tree has {} leaves)",
+                            index, tree_len
+                        )));
+                    }
 
-                        let children = parent.children();
-                        let position = children.iter().position(|&idx| idx == current_idx).ok_or(
-                            ProofError::from(TreeError::IndexOutOfBounds {
-                                index: current_idx.index(),
-                                len: tree.len(),
-                            }),
-                        )?;
-
-                        let mut siblings = Vec::with_capacity(children.len() - 1);
-                        for (i, &child_idx) in children.iter().enumerate() {
-                            if i != position {
-                                let sibling = tree.get(child_idx.index()).ok_or(
-                                    ProofError::from(TreeError::IndexOutOfBounds {
-                                        index: child_idx.index(),
-                                        len: tree.len(),
-                                    }),
-                                )?;
-                                siblings.push(sibling.hash().clone());
-                            }
-                        }
+                    node_indices.push(NodeIndex::new(normalized_idx as usize));
+                }
 
-                        path.push(ProofLevel::new(position, siblings));
+                Ok((internal_tree, root, node_indices))
+            }
+
+            /// The Python `MrkleNode` type, leaves of which `verify` accepts.
+            fn node_type(py: Python<'_>) -> PyResult<PyBound<'_, PyAny>> {
+                mrkle_attr(py, &NODE_TYPE, "MrkleNode")
+            }
 
-                        // Move to parent for next iteration
-                        current_idx = parent_idx;
-                    } else {
-                        // Reached a node with no parent (should be root)
-                        break;
+            /// Digests of the leaves handed to `verify`: a `MrkleNode`, digest
+            /// bytes, a hex string, or a sequence of one of those.
+            fn leaf_digests(
+                node_type: &PyBound<'_, PyAny>,
+                leaves: &PyBound<'_, PyAny>,
+            ) -> PyResult<Vec<GenericArray<$digest>>> {
+                // Helper closure: decode hex string into bytes
+                let decode_hex = |hex_str: &str| -> PyResult<Vec<u8>> {
+                    let mut buffer = vec![0; hex_str.len() / 2];
+                    faster_hex::hex_decode(hex_str.as_bytes(), &mut buffer)
+                        .map_err(|e| PyValueError::new_err(e.to_string()))?;
+                    Ok(buffer)
+                };
+
+                // Convert leaves input into Vec<GenericArray<$digest>>
+                if leaves.is_instance(node_type)? {
+                    // Single MrkleNode
+                    let inner = leaves.getattr("_inner")?.extract::<$node>()?;
+                    Ok(vec![GenericArray::<$digest>::clone_from_slice(
+                        &inner.digest(),
+                    )])
+                } else if let Ok(bytes) = leaves.extract::<&[u8]>() {
+                    // Single bytes
+                    Ok(vec![GenericArray::<$digest>::clone_from_slice(bytes)])
+                } else if let Ok(hex_str) = leaves.extract::<String>() {
+                    // Single hex string
+                    Ok(vec![GenericArray::<$digest>::clone_from_slice(
+                        &decode_hex(&hex_str)?,
+                    )])
+                } else if let Ok(vec_bytes) = leaves.extract::<Vec<Vec<u8>>>() {
+                    // Multiple bytes
+                    Ok(vec_bytes
+                        .iter()
+                        .map(|v| GenericArray::<$digest>::clone_from_slice(v))
+                        .collect())
+                } else if let Ok(vec_hex) = leaves.extract::<Vec<String>>() {
+                    // Multiple hex strings
+                    let decoded: PyResult<Vec<GenericArray<$digest>>> = vec_hex
+                        .iter()
+                        .map(|s| {
+                            decode_hex(s)
+                                .map(|bytes| GenericArray::<$digest>::clone_from_slice(&bytes))
+                        })
+                        .collect();
+                    decoded
+                } else if let Ok(seq) = leaves.downcast::<PySequence>() {
+                    // Generic sequence of MrkleNodes
+                    let mut result = Vec::with_capacity(seq.len()?);
+                    for item in seq.try_iter()? {
+                        let item = item?;
+                        if item.is_instance(node_type)? {
+                            let inner = item.getattr("_inner")?.extract::<$node>()?;
+                            result.push(GenericArray::<$digest>::clone_from_slice(&inner.digest()));
+                        } else {
+                            return Err(PyValueError::new_err(
+                                "Sequence contains non-MrkleNode item",
+                            ));
+                        }
                     }
+                    Ok(result)
+                } else {
+                    Err(PyTypeError::new_err(
+                        "Expected bytes, hex string, MrkleNode, or a sequence thereof",
+                    ))
                 }
-                Ok(ProofPath::new(path))
             }
         }
 
@@ -118,152 +302,145 @@ macro_rules! py_mrkle_proof {
                 tree: &PyBound<'_, PyAny>,
                 leaves: Vec<isize>,
             ) -> PyResult<Self> {
-                Python::attach(|py| {
-                    // Import the mrkle module to verify tree type
-                    let module = PyModule::import(py, intern!(py, "mrkle"))?;
-                    MRKLE_MODULE.get_or_init_py_attached(py, || module.clone().unbind());
-
-                    let ttype = module.getattr(intern!(py, "MrkleTree"))?;
-
-                    if !tree.is_instance(&ttype)? {
-                        return Err(PyTypeError::new_err("Expected a MrkleTree instance"));
-                    }
-
-                    if leaves.is_empty() {
-                        return Err(PyValueError::new_err(
-                            "Must provide at least one leaf index",
-                        ));
-                    }
-
-                    // Get the _inner attribute which contains the actual Rust tree
-                    let inner_attr = tree.getattr(intern!(py, "_inner"))?;
-                    let internal_tree = inner_attr.extract::<$tree>()?;
-
-                    // Get tree information
-                    let tree_len = internal_tree.len() as isize;
-                    let root = internal_tree
-                        .inner
-                        .start()
-                        .ok_or_else(|| PyTreeError::new_err("Tree has no root"))?;
-
-                    // Convert Python indices (with negative indexing support) to NodeIndex
-                    let mut node_indices = Vec::with_capacity(leaves.len());
+                let (internal_tree, root, node_indices) = Self::resolve_leaves(tree, &leaves)?;
+
+                // Generate paths for each leaf
+                let mut levels = FastHashMap::default();
+                let mut paths = Vec::with_capacity(node_indices.len());
+                for &leaf_idx in &node_indices {
+                    let path = Self::generate_path(&internal_tree, root, leaf_idx, &mut levels)
+                        .map_err(|e| PyProofError::new_err(format!("{e}")))?;
+                    paths.push(path);
+                }
 
-                    for &index in &leaves {
-                        let mut normalized_idx = index;
+                // Get expected root hash
+                let expected_root = internal_tree.inner.root().hash().clone();
 
-                        // Handle negative indexing
-                        if normalized_idx < 0 {
-                            normalized_idx = tree_len
-                                .checked_add(normalized_idx)
-                                .ok_or_else(|| PyIndexError::new_err("index out of range"))?;
-                        }
-
-                        // Validate bounds
-                        if normalized_idx < 0 || normalized_idx >= tree_len {
-                            return Err(PyIndexError::new_err(format!(
-                                "leaf index {} out of range (tree has {} leaves)",
-                                index, tree_len
-                            )));
-                        }
+                // Create the proof
+                let proof = MrkleProof::new(paths, None, expected_root);
+                Ok(Self { inner: proof })
+            }
 
-                        node_indices.push(NodeIndex::new(normalized_idx as usize));
-                    }
+            /// Generate a proof of the leaves `range(start, stop, step)`, built
+            /// here so no Python list of the indices is ever made.
+            #[classmethod]
+            fn generate_range(
+                cls: &PyBound<'_, PyType>,
+                tree: &PyBound<'_, PyAny>,
+                start: isize,
+                stop: isize,
+                step: isize,
+            ) -> PyResult<Self> {
+                // The length of the range as Python computes it.
+                if step == 0 {
+                    return Err(PyValueError::new_err("range step must not be zero"));
+                }
+                let len = if (step > 0 && start < stop) || (step < 0 && start > stop) {
+                    (stop.abs_diff(start) - 1) / step.unsigned_abs() + 1
+                } else {
+                    0
+                };
+                let leaves = (0..len as isize).map(|i| start + i * step).collect();
+                Self::generate(cls, tree, leaves)
+            }
 
-                    // Generate paths for each leaf
-                    let mut paths = Vec::with_capacity(node_indices.len());
-                    for &leaf_idx in &node_indices {
-                        let path = Self::generate_path(&internal_tree, root, leaf_idx)
+            /// Generate one single-leaf proof per entry of `leaves` in a single
+            /// call, sharing the levels common to several leaves.
+            #[classmethod]
+            fn generate_multi(
+                _cls: &PyBound<'_, PyType>,
+                tree: &PyBound<'_, PyAny>,
+                leaves: Vec<isize>,
+            ) -> PyResult<Vec<Self>> {
+                let (internal_tree, root, node_indices) = Self::resolve_leaves(tree, &leaves)?;
+                let expected_root = internal_tree.inner.root().hash().clone();
+
+                let mut levels = FastHashMap::default();
+                node_indices
+                    .iter()
+                    .map(|&leaf_idx| {
+                        let path = Self::generate_path(&internal_tree, root, leaf_idx, &mut levels)
                             .map_err(|e| PyProofError::new_err(format!("{e}")))?;
-                        paths.push(path);
-                    }
+                        Ok(Self {
+                            inner: MrkleProof::new(vec![path], None, expected_root.clone()),
+                        })
+                    })
+                    .collect()
+            }
 
-                    // Get expected root hash
-                    let expected_root = internal_tree.inner.root().hash().clone();
+            /// Generate one proof per leaf set in `leaf_sets` in a single call,
+            /// sharing the levels common to any of the sets.
+            #[classmethod]
+            fn generate_many(
+                _cls: &PyBound<'_, PyType>,
+                tree: &PyBound<'_, PyAny>,
+                leaf_sets: Vec<Vec<isize>>,
+            ) -> PyResult<Vec<Self>> {
+                if leaf_sets.iter().any(|leaves| leaves.is_empty()) {
+                    return Err(PyValueError::new_err(
+                        "Must provide at least one leaf index",
+                    ));
+                }
 
-                    // Create the proof
-                    let proof = MrkleProof::new(paths, None, expected_root);
-                    Ok(Self { inner: proof })
-                })
+                let leaves = leaf_sets.concat();
+                let (internal_tree, root, node_indices) = Self::resolve_leaves(tree, &leaves)?;
+                let expected_root = internal_tree.inner.root().hash().clone();
+
+                let mut levels = FastHashMap::default();
+                let mut remaining = node_indices.as_slice();
+                leaf_sets
+                    .iter()
+                    .map(|leaves| {
+                        let (set, rest) = remaining.split_at(leaves.len());
+                        remaining = rest;
+
+                        let paths = set
+                            .iter()
+                            .map(|&leaf_idx| {
+                                Self::generate_path(&internal_tree, root, leaf_idx, &mut levels)
+                                    .map_err(|e| PyProofError::new_err(format!("{e}")))
+                            })
+                            .collect::<PyResult<Vec<_>>>()?;
+                        Ok(Self {
+                            inner: MrkleProof::new(paths, None, expected_root.clone()),
+                        })
+                    })
+                    .collect()
             }
 
             fn verify(&self, leaves: PyBound<'_, PyAny>) -> PyResult<bool> {
-                Python::attach(|py| {
-                    // Import the mrkle module and cache it
-                    let module = PyModule::import(py, "mrkle")?;
-                    MRKLE_MODULE.get_or_init_py_attached(py, || module.clone().unbind());
-                    let node_type = module.getattr("MrkleNode")?;
-
-                    // Helper closure: decode hex string into bytes
-                    let decode_hex = |hex_str: &str| -> PyResult<Vec<u8>> {
-                        let mut buffer = vec![0; hex_str.len() / 2];
-                        faster_hex::hex_decode(hex_str.as_bytes(), &mut buffer)
-                            .map_err(|e| PyValueError::new_err(e.to_string()))?;
-                        Ok(buffer)
-                    };
+                let node_type = Self::node_type(leaves.py())?;
+                let leaves = Self::leaf_digests(&node_type, &leaves)?;
 
-                    // Convert leaves input into Vec<GenericArray<$digest>>
-                    let leaves_vec: PyResult<Vec<GenericArray<$digest>>> = (|| {
-                        if leaves.is_instance(&node_type)? {
-                            // Single MrkleNode
-                            let inner = leaves.getattr("_inner")?.extract::<$node>()?;
-                            Ok(vec![GenericArray::<$digest>::clone_from_slice(
-                                &inner.digest(),
-                            )])
-                        } else if let Ok(bytes) = leaves.extract::<&[u8]>() {
-                            // Single bytes
-                            Ok(vec![GenericArray::<$digest>::clone_from_slice(bytes)])
-                        } else if let Ok(hex_str) = leaves.extract::<String>() {
-                            // Single hex string
-                            Ok(vec![GenericArray::<$digest>::clone_from_slice(
-                                &decode_hex(&hex_str)?,
-                            )])
-                        } else if let Ok(vec_bytes) = leaves.extract::<Vec<Vec<u8>>>() {
-                            // Multiple bytes
-                            Ok(vec_bytes
-                                .iter()
-                                .map(|v| GenericArray::<$digest>::clone_from_slice(v))
-                                .collect())
-                        } else if let Ok(vec_hex) = leaves.extract::<Vec<String>>() {
-                            // Multiple hex strings
-                            let decoded: PyResult<Vec<GenericArray<$digest>>> = vec_hex
-                                .iter()
-                                .map(|s| {
-                                    decode_hex(s).map(|bytes| {
-                                        GenericArray::<$digest>::clone_from_slice(&bytes)
-                                    })
-                                })
-                                .collect();
-                            decoded
-                        } else if let Ok(seq) = leaves.downcast::<PySequence>() {
-                            // Generic sequence of MrkleNodes
-                            let mut result = Vec::with_capacity(seq.len()?);
-                            for item in seq.try_iter()? {
-                                let item = item?;
-                                if item.is_instance(&node_type)? {
-                                    let inner = item.getattr("_inner")?.extract::<$node>()?;
-                                    result.push(GenericArray::<$digest>::clone_from_slice(
-                                        &inner.digest(),
-                                    ));
-                                } else {
-                                    return Err(PyValueError::new_err(
-                                        "Sequence contains non-MrkleNode item",
-                                    ));
-                                }
-                            }
-                            Ok(result)
-                        } else {
-                            Err(PyTypeError::new_err(
-                                "Expected bytes, hex string, MrkleNode, or a sequence thereof",
-                            ))
-                        }
-                    })();
+                // Verify using inner tree
+                self.inner
+                    .verify(leaves)
+                    .map_err(|e| PyProofError::new_err(format!("{e}")))
+            }
 
-                    // Verify using inner tree
-                    self.inner
-                        .verify(leaves_vec?)
-                        .map_err(|e| PyProofError::new_err(format!("{e}")))
+            /// Verify many candidate leaf sets against this proof in one call.
+            ///
+            /// Every candidate takes the same forms as `verify`. They are all
+            /// converted first, then checked back to back with the GIL
+            /// released, so the proof's sibling digests stay cache-warm.
+            fn verify_batch(
+                &self,
+                py: Python<'_>,
+                candidates: Vec<PyBound<'_, PyAny>>,
+            ) -> PyResult<Vec<bool>> {
+                let node_type = Self::node_type(py)?;
+                let candidates = candidates
+                    .iter()
+                    .map(|leaves| Self::leaf_digests(&node_type, leaves))
+                    .collect::<PyResult<Vec<_>>>()?;
+
+                py.detach(|| {
+                    candidates
+                        .into_iter()
+                        .map(|leaves| self.inner.verify(leaves))
+                        .collect::<Result<Vec<bool>, ProofError>>()
                 })
+                .map_err(|e| PyProofError::new_err(format!("{e}")))
             }
 
             #[inline]
@@ -361,6 +538,14 @@ py_mrkle_proof!(
     "MrkleProofBlake2s"
 );
 
+py_mrkle_proof!(
+    PyMrkleProofBlake3,
+    PyBlake3Wrapper,
+    PyMrkleTreeBlake3,
+    PyMrkleNode_Blake3,
+    "MrkleProofBlake3"
+);
+
 py_mrkle_proof!(
     PyMrkleProofKeccak224,
     PyKeccak224Wrapper,
@@ -421,6 +606,7 @@ pub(crate) fn register_proof(m: &PyBound<'_, PyModule>) -> PyResult<()> {
 
     proof_m.add_class::<PyMrkleProofBlake2b>()?;
     proof_m.add_class::<PyMrkleProofBlake2s>()?;
+    proof_m.add_class::<PyMrkleProofBlake3>()?;
 
     m.add_submodule(&proof_m)
 }
@@ -1,8 +1,8 @@
 #![allow(dead_code)]
 #![allow(non_camel_case_types)]
 
-use std::collections::HashMap;
 use std::io::{Read, Write};
+use std::sync::OnceLock;
 
 use serde::Serialize;
 
@@ -12,29 +12,45 @@ use pyo3::exceptions::{PyIndexError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::pycell::PyRef;
 use pyo3::sync::OnceLockExt;
-use pyo3::types::{PyAny, PyBytes, PyDict, PyIterator, PyList, PySequence, PySlice, PyType};
+use pyo3::types::{
+    PyAny, PyByteArray, PyBytes, PyDict, PyIterator, PyList, PySequence, PySlice, PyString,
+    PyTuple, PyType,
+};
 use pyo3::{Bound as PyBound, Py, intern};
 
 use pyo3_file::PyFileLikeObject;
 
+use rayon::prelude::*;
+use rustc_hash::FxHashMap as FastHashMap;
+
 use crate::{
     MRKLE_MODULE,
-    codec::{JsonCodec, MerkleTreeJson, PyCodecFormat},
+    codec::{HashTypeProbe, JsonCodec, MerkleTreeJson, PyCodecFormat},
     crypto::{
-        PyBlake2b512Wrapper, PyBlake2s256Wrapper, PyKeccak224Wrapper, PyKeccak256Wrapper,
-        PyKeccak384Wrapper, PyKeccak512Wrapper, PySha1Wrapper, PySha224Wrapper, PySha256Wrapper,
-        PySha384Wrapper, PySha512Wrapper,
+        PyBlake2b512Wrapper, PyBlake2s256Wrapper, PyBlake3Wrapper, PyKeccak224Wrapper,
+        PyKeccak256Wrapper, PyKeccak384Wrapper, PyKeccak512Wrapper, PySha1Wrapper, PySha224Wrapper,
+        PySha256Wrapper, PySha384Wrapper, PySha512Wrapper,
     },
     errors::{NodeError as PyNodeError, SerdeError, TreeError},
-    utils::extract_to_bytes,
+    utils::{ChunkWriter, extract_to_bytes, with_workers},
 };
 
 use mrkle::error::NodeError;
 use mrkle::{GenericArray, IndexType, Iter, MrkleNode, MutNode, Node, NodeIndex, Tree};
 
+/// Fewest leaves hashed by one Rayon task. Splitting below this costs more
+/// in scheduling than the hashing it spreads out.
+const LEAF_GRAIN: usize = 64;
+
+/// Fewest sibling-pair chunks hashed by one Rayon task on a level. Narrow
+/// levels near the root stay on the calling thread.
+const PAIR_GRAIN: usize = 128;
+
 trait PyMrkleNode<D: Digest, Ix: IndexType>: Node<Ix> + MutNode<Ix> + Sized {
     fn hash(&self) -> &GenericArray<D>;
     fn leaf(data: impl AsRef<[u8]>) -> Self;
+    fn leaf_with_hash(data: Vec<u8>, hash: GenericArray<D>) -> Self;
+    fn internal_with_hash(hash: GenericArray<D>, children: Vec<NodeIndex<Ix>>) -> Self;
     fn internal(tree: &Tree<Self, Ix>, children: Vec<NodeIndex<Ix>>) -> Result<Self, NodeError>;
 }
 
@@ -65,6 +81,13 @@ macro_rules! py_mrkle_node {
         }
 
         impl $name {
+            pub fn leaf(payload: Vec<u8>) -> Self {
+                let bytes: Box<[u8]> = payload.into_boxed_slice();
+                Self {
+                    inner: MrkleNode::<Box<[u8]>, $digest, usize>::leaf(bytes),
+                }
+            }
+
             pub(crate) fn internal(
                 tree: &Tree<$name, usize>,
                 children: Vec<NodeIndex<usize>>,
@@ -91,6 +114,15 @@ macro_rules! py_mrkle_node {
                     inner: MrkleNode::internal_with_hash(hash, children),
                 })
             }
+
+            pub(crate) fn internal_with_hash(
+                hash: GenericArray<$digest>,
+                children: Vec<NodeIndex<usize>>,
+            ) -> Self {
+                Self {
+                    inner: MrkleNode::internal_with_hash(hash, children),
+                }
+            }
         }
 
         impl Node<usize> for $name {
@@ -114,6 +146,22 @@ macro_rules! py_mrkle_node {
                 }
             }
 
+            fn leaf_with_hash(data: Vec<u8>, hash: GenericArray<$digest>) -> Self {
+                Self {
+                    inner: MrkleNode::<Box<[u8]>, $digest, usize>::leaf_with_hash_unchecked(
+                        data.into_boxed_slice(),
+                        hash,
+                    ),
+                }
+            }
+
+            fn internal_with_hash(
+                hash: GenericArray<$digest>,
+                children: Vec<NodeIndex<usize>>,
+            ) -> Self {
+                <$name>::internal_with_hash(hash, children)
+            }
+
             fn internal(
                 tree: &Tree<$name, usize>,
                 children: Vec<NodeIndex<usize>>,
@@ -159,13 +207,32 @@ macro_rules! py_mrkle_node {
                 faster_hex::hex_string(self.inner.hash())
             }
 
+            /// Hex encoding of the first `n` digest bytes (the whole digest
+            /// when it is shorter), for display without encoding the rest.
+            #[inline]
+            pub fn short_hex(&self, n: usize) -> String {
+                let hash = self.inner.hash();
+                faster_hex::hex_string(&hash[..n.min(hash.len())])
+            }
+
+            /// The digest is already uniformly distributed, so its leading
+            /// bytes serve as the Python hash without hashing it again.
+            #[inline]
+            pub fn __hash__(&self) -> u64 {
+                let mut prefix = [0u8; 8];
+                prefix.copy_from_slice(&self.inner.hash()[..8]);
+                u64::from_ne_bytes(prefix)
+            }
+
+            /// Hash `payload` and wrap it in a leaf node in a single call.
+            ///
+            /// The payload is copied once, straight into the node's owned
+            /// buffer, whatever bytes-like type (or `str`) it arrives as.
             #[inline]
             #[staticmethod]
-            pub fn leaf(payload: Vec<u8>) -> Self {
-                let bytes: Box<[u8]> = payload.into_boxed_slice();
-                Self {
-                    inner: MrkleNode::<Box<[u8]>, $digest, usize>::leaf(bytes),
-                }
+            #[pyo3(name = "leaf")]
+            pub fn leaf_py(payload: &PyBound<'_, PyAny>) -> PyResult<Self> {
+                extract_to_bytes(payload).map(Self::leaf)
             }
 
             #[inline]
@@ -252,6 +319,7 @@ py_mrkle_node!(PyMrkleNode_Sha384, PySha384Wrapper, "MrkleNodeSha384");
 py_mrkle_node!(PyMrkleNode_Sha512, PySha512Wrapper, "MrkleNodeSha512");
 py_mrkle_node!(PyMrkleNode_Blake2b, PyBlake2b512Wrapper, "MrkleNodeBlake2b");
 py_mrkle_node!(PyMrkleNode_Blake2s, PyBlake2s256Wrapper, "MrkleNodeBlake2s");
+py_mrkle_node!(PyMrkleNode_Blake3, PyBlake3Wrapper, "MrkleNodeBlake3");
 py_mrkle_node!(
     PyMrkleNode_Keccak224,
     PyKeccak224Wrapper,
@@ -279,12 +347,25 @@ macro_rules! py_mrkle_tree {
         #[pyclass(name = $classname, eq)]
         pub struct $name {
             pub inner: Tree<$node, usize>,
+            /// Node indices in breadth-first order, computed on the first
+            /// iteration and shared by every later one: the tree never changes.
+            order: OnceLock<Box<[usize]>>,
         }
 
         impl Clone for $name {
             fn clone(&self) -> Self {
                 Self {
                     inner: self.inner.clone(),
+                    order: self.order.clone(),
+                }
+            }
+        }
+
+        impl From<Tree<$node, usize>> for $name {
+            fn from(inner: Tree<$node, usize>) -> Self {
+                Self {
+                    inner,
+                    order: OnceLock::new(),
                 }
             }
         }
@@ -304,7 +385,7 @@ macro_rules! py_mrkle_tree {
                 D: serde::Deserializer<'de>,
             {
                 let inner = Tree::deserialize(deserializer)?;
-                Ok(Self { inner })
+                Ok(Self::from(inner))
             }
         }
 
@@ -314,7 +395,23 @@ macro_rules! py_mrkle_tree {
                     return false;
                 }
 
-                self.len() == other.len() && self.iter().eq(other.iter())
+                if self.len() != other.len() {
+                    return false;
+                }
+
+                // Trees built the same way store their nodes in the same
+                // order, and then one pass over both node vectors settles it
+                // without the breadth-first walk, which clones every child
+                // list. Matching storage implies matching walks; otherwise
+                // the walk decides, as layouts may differ between equal trees.
+                (self.inner.start() == other.inner.start()
+                    && (0..self.len()).all(|index| {
+                        let (lhs, rhs) = (&self.inner[index].inner, &other.inner[index].inner);
+                        lhs.hash() == rhs.hash()
+                            && lhs.child_count() == rhs.child_count()
+                            && (0..lhs.child_count()).all(|k| lhs.child_at(k) == rhs.child_at(k))
+                    }))
+                    || self.iter().eq(other.iter())
             }
         }
         impl Eq for $name {}
@@ -322,7 +419,8 @@ macro_rules! py_mrkle_tree {
         #[pyclass(name = $itername)]
         struct $iter_name {
             tree: Py<$name>,
-            queue: std::collections::VecDeque<usize>,
+            /// Position of the next node in the tree's breadth-first order.
+            position: usize,
         }
 
         #[pymethods]
@@ -331,35 +429,64 @@ macro_rules! py_mrkle_tree {
                 slf
             }
 
-            fn __next__(mut slf: PyRefMut<'_, Self>) -> PyResult<Option<$node>> {
-                // Pop from queue first (mutable borrow of slf)
-                let index = match slf.queue.pop_front() {
-                    Some(idx) => idx,
-                    None => return Ok(None),
-                };
+            fn __next__(mut slf: PyRefMut<'_, Self>, py: Python<'_>) -> Option<$node> {
+                let tree = slf.tree.clone_ref(py);
+                let tree = tree.borrow(py);
 
-                // Now we can borrow tree and work with it
-                Python::attach(|py| {
-                    let tree = slf.tree.borrow(py);
+                let index = *tree.bfs_order().get(slf.position)?;
+                slf.position += 1;
+                Some(tree.inner[index].clone())
+            }
 
-                    if let Some(node) = tree.inner.get(index) {
-                        // Get children indices before cloning
-                        let children_indices = tree.get_children_indices(NodeIndex::new(index));
-                        let node_clone = node.clone();
+            /// Take up to `chunk` nodes in breadth-first order in a single call.
+            #[pyo3(signature = (chunk = 4096))]
+            fn drain(mut slf: PyRefMut<'_, Self>, py: Python<'_>, chunk: usize) -> Vec<$node> {
+                let tree = slf.tree.clone_ref(py);
+                let tree = tree.borrow(py);
+
+                let order = tree.bfs_order();
+                let start = slf.position.min(order.len());
+                let end = start.saturating_add(chunk).min(order.len());
+                slf.position = end;
+                order[start..end]
+                    .iter()
+                    .map(|&index| tree.inner[index].clone())
+                    .collect()
+            }
 
-                        // Drop the tree borrow before mutating slf again
-                        drop(tree);
+            /// Take up to `chunk` nodes like `drain`, returning them already
+            /// wrapped in the Python `MrkleNode` type.
+            #[pyo3(signature = (chunk = 4096))]
+            fn drain_wrapped<'py>(
+                slf: PyRefMut<'py, Self>,
+                py: Python<'py>,
+                chunk: usize,
+            ) -> PyResult<PyBound<'py, PyList>> {
+                let nodes = Self::drain(slf, py, chunk);
+                let wrapper = node_wrapper(py)?;
+                let nodes = nodes
+                    .into_iter()
+                    .map(|node| wrapper.wrap(py, node))
+                    .collect::<PyResult<Vec<_>>>()?;
+                PyList::new(py, nodes)
+            }
 
-                        // Now add children to queue (mutable borrow of slf)
-                        for child_idx in children_indices {
-                            slf.queue.push_back(child_idx.index());
-                        }
+            /// Take every remaining node in breadth-first order, returning
+            /// only their digests packed back to back into one buffer.
+            fn digests(mut slf: PyRefMut<'_, Self>, py: Python<'_>) -> Py<PyBytes> {
+                let tree = slf.tree.clone_ref(py);
+                let tree = tree.borrow(py);
 
-                        Ok(Some(node_clone))
-                    } else {
-                        Ok(None)
-                    }
-                })
+                let order = tree.bfs_order();
+                let rest = &order[slf.position.min(order.len())..];
+                slf.position = order.len();
+
+                let size = <$digest as Digest>::output_size();
+                let mut digests = Vec::with_capacity(rest.len() * size);
+                for &index in rest {
+                    digests.extend_from_slice(tree.inner[index].hash());
+                }
+                PyBytes::new(py, &digests).unbind()
             }
         }
 
@@ -374,16 +501,87 @@ macro_rules! py_mrkle_tree {
                     .hash())
             }
 
+            /// The root digest, or `None` for an empty tree; unlike `root`,
+            /// an empty tree raises nothing.
+            #[inline]
+            fn root_or_none(&self) -> Option<&[u8]> {
+                self.inner.try_root().ok().map(|root| &root.hash()[..])
+            }
+
+            /// The leading bytes of the root digest serve as the Python hash,
+            /// as they do for nodes; an empty tree hashes to zero.
+            #[inline]
+            fn __hash__(&self) -> u64 {
+                self.inner.try_root().map_or(0, |root| {
+                    let mut prefix = [0u8; 8];
+                    prefix.copy_from_slice(&root.hash()[..8]);
+                    u64::from_ne_bytes(prefix)
+                })
+            }
+
             #[inline]
             pub fn is_empty(&self) -> bool {
                 self.inner.is_empty()
             }
 
+            /// Return every node digest packed row-major into one buffer, in
+            /// storage order, with each node's parent index (`-1` for none).
+            pub fn as_arrays(&self, py: Python<'_>) -> (Py<PyBytes>, Vec<i64>) {
+                let len = self.inner.len();
+                let size = <$digest as Digest>::output_size();
+
+                let mut digests = Vec::with_capacity(len * size);
+                let mut parents = Vec::with_capacity(len);
+                for index in 0..len {
+                    let node = &self.inner[index];
+                    digests.extend_from_slice(node.hash());
+                    parents.push(node.parent().map_or(-1, |parent| parent.index() as i64));
+                }
+                (PyBytes::new(py, &digests).unbind(), parents)
+            }
+
+            /// Return every leaf digest packed row-major into one buffer, in
+            /// leaf order, written straight into the new `bytes` object.
+            pub fn leaf_digests<'py>(
+                &self,
+                py: Python<'py>,
+            ) -> PyResult<PyBound<'py, PyBytes>> {
+                let leaves = self.leaf_indices();
+                let size = <$digest as Digest>::output_size();
+                PyBytes::new_with(py, leaves.len() * size, |buffer| {
+                    for (row, &index) in buffer.chunks_exact_mut(size).zip(leaves.iter()) {
+                        row.copy_from_slice(self.inner[index].hash());
+                    }
+                    Ok(())
+                })
+            }
+
             #[inline]
             pub fn capacity(&self) -> usize {
                 self.inner.capacity()
             }
 
+            #[inline]
+            #[pyo3(name = "leaf_indices")]
+            pub fn leaf_indices_py(&self) -> Vec<usize> {
+                self.leaf_indices().iter().map(|index| index.index()).collect()
+            }
+
+            /// Every leaf wrapped as a Python `MrkleNode`, built in one call.
+            #[pyo3(name = "leaves_wrapped")]
+            pub fn leaves_wrapped_py<'py>(
+                &self,
+                py: Python<'py>,
+            ) -> PyResult<PyBound<'py, PyList>> {
+                let wrapper = node_wrapper(py)?;
+                let nodes = self
+                    .leaves()
+                    .into_iter()
+                    .map(|node| wrapper.wrap(py, node.clone()))
+                    .collect::<PyResult<Vec<_>>>()?;
+                PyList::new(py, nodes)
+            }
+
             #[inline]
             #[pyo3(name = "leaves")]
             pub fn leaves_py(&self) -> Vec<$node> {
@@ -400,87 +598,292 @@ macro_rules! py_mrkle_tree {
 
             #[inline]
             #[classmethod]
-            #[pyo3(text_signature = "(cls, data : Dict[str, bytes])")]
+            #[pyo3(
+                signature = (data, workers = None),
+                text_signature = "(cls, data : Dict[str, bytes], workers : Optional[int] = None)"
+            )]
             pub fn from_dict(
                 _cls: &PyBound<'_, PyType>,
                 data: PyBound<'_, PyDict>,
+                workers: Option<usize>,
             ) -> PyResult<Self> {
                 let mut inner = Tree::new();
 
-                traverse_dict_depth(data, &mut inner)?;
+                traverse_dict_depth(data, &mut inner, workers)?;
 
-                Ok(Self { inner })
+                Ok(Self::from(inner))
             }
 
             #[inline]
             #[classmethod]
+            #[pyo3(
+                signature = (data, sep = ".", workers = None),
+                text_signature = "(cls, data : Dict[str, bytes], sep : str = '.', workers : Optional[int] = None)"
+            )]
+            pub fn from_flat_dict(
+                _cls: &PyBound<'_, PyType>,
+                data: PyBound<'_, PyDict>,
+                sep: &str,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let mut inner = Tree::new();
+
+                traverse_flat_dict(data, sep, &mut inner, workers)?;
+
+                Ok(Self::from(inner))
+            }
+
+            #[inline]
+            #[classmethod]
+            #[pyo3(signature = (leaves, workers = None))]
             pub fn from_leaves(
                 _cls: &PyBound<'_, PyType>,
                 leaves: PyBound<'_, PyAny>,
+                workers: Option<usize>,
             ) -> PyResult<Self> {
-                let mut tree = Tree::<$node, usize>::new();
-
-                let mut leaves = if let Ok(leaves) = leaves.extract::<Vec<PyBound<'_, PyAny>>>() {
-                    leaves
-                        .into_iter()
-                        .map(|obj| extract_to_bytes(&obj))
-                        .collect::<PyResult<Vec<_>>>()
+                // Payloads are written straight into a buffer sized from the
+                // input; collecting a fallible iterator would regrow it, and
+                // pairing the payloads with their digest slots afterwards
+                // would allocate and move every entry a second time.
+                let mut payloads: Vec<(Vec<u8>, Option<GenericArray<$digest>>)>;
+
+                // Lists and tuples are walked in place; other sequences are
+                // first gathered into a vector of references.
+                if let Ok(leaves) = leaves.downcast::<PyList>() {
+                    payloads = Vec::with_capacity(leaves.len());
+                    for obj in leaves.iter() {
+                        payloads.push((extract_to_bytes(&obj)?, None));
+                    }
+                } else if let Ok(leaves) = leaves.downcast::<PyTuple>() {
+                    payloads = Vec::with_capacity(leaves.len());
+                    for obj in leaves.iter() {
+                        payloads.push((extract_to_bytes(&obj)?, None));
+                    }
+                } else if let Ok(leaves) = leaves.extract::<Vec<PyBound<'_, PyAny>>>() {
+                    payloads = Vec::with_capacity(leaves.len());
+                    for obj in leaves {
+                        payloads.push((extract_to_bytes(&obj)?, None));
+                    }
                 } else if let Ok(leaves) = leaves.extract::<PyBound<'_, PyIterator>>() {
-                    leaves
-                        .try_iter()?
-                        .map(|obj| obj.and_then(|obj| extract_to_bytes(&obj)))
-                        .collect::<PyResult<Vec<_>>>()
+                    // Iterators are drained one leaf at a time, so no Python
+                    // list of the payloads is ever held; when the iterator can
+                    // tell its length, the buffer is sized from that. A length
+                    // hint is only an estimate (PEP 424), so one too large to
+                    // reserve is ignored and the buffer grows as it fills.
+                    let hint = leaves
+                        .call_method0(intern!(leaves.py(), "__length_hint__"))
+                        .and_then(|hint| hint.extract::<usize>())
+                        .unwrap_or(0);
+                    payloads = Vec::new();
+                    let _ = payloads.try_reserve(hint);
+                    for obj in leaves.try_iter()? {
+                        payloads.push((extract_to_bytes(&obj?)?, None));
+                    }
                 } else {
                     return Err(PyTypeError::new_err(
                         "Unable to construct tree due to wrong types",
                     ));
-                }?;
-
-                if leaves.is_empty() {
-                    return Ok(Self { inner: tree });
                 }
 
-                if leaves.len() == 1 {
-                    let payload = leaves.pop().unwrap();
+                Self::from_payloads(_cls.py(), payloads, workers)
+            }
 
-                    let leaf = <$node>::leaf(payload);
+            /// Build a tree from leaves packed back to back in `data` (bytes
+            /// or bytearray), where leaf `i` spans `offsets[i]..offsets[i + 1]`
+            /// and `offsets` holds native-endian 64-bit integers.
+            #[inline]
+            #[classmethod]
+            #[pyo3(signature = (data, offsets, workers = None))]
+            pub fn from_packed(
+                _cls: &PyBound<'_, PyType>,
+                data: PyBound<'_, PyAny>,
+                offsets: PyBound<'_, PyBytes>,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let data = if let Ok(bytes) = data.downcast::<PyBytes>() {
+                    bytes.as_bytes()
+                } else if let Ok(bytearray) = data.downcast::<PyByteArray>() {
+                    // SAFETY: the GIL is held and no Python code runs until every
+                    // leaf has been copied out below, so the buffer cannot be
+                    // resized or freed while it is borrowed.
+                    unsafe { bytearray.as_bytes() }
+                } else {
+                    return Err(PyTypeError::new_err("data must be bytes or bytearray"));
+                };
+                let offsets = offsets.as_bytes();
+                if offsets.len() % 8 != 0 {
+                    return Err(PyValueError::new_err(
+                        "offsets must hold whole 64-bit integers",
+                    ));
+                }
 
-                    let leaf_idx = tree.push(leaf);
+                // Boundaries are decoded as the leaves are sliced, so no
+                // vector of offsets is built; the leaves go into a buffer
+                // sized up front, since collecting a fallible iterator would
+                // regrow it.
+                let mut bounds = offsets.chunks_exact(8).map(|word| {
+                    let offset = u64::from_ne_bytes(word.try_into().unwrap());
+                    usize::try_from(offset)
+                        .map_err(|_| PyValueError::new_err("offset does not fit in memory"))
+                });
+
+                let mut leaves = Vec::with_capacity((offsets.len() / 8).saturating_sub(1));
+                if let Some(first) = bounds.next() {
+                    let mut start = first?;
+                    for end in bounds {
+                        let end = end?;
+                        let payload = data.get(start..end).ok_or_else(|| {
+                            PyValueError::new_err("offsets must be non-decreasing and within data")
+                        })?;
+                        leaves.push((payload.to_vec(), None));
+                        start = end;
+                    }
+                }
 
-                    let root = <$node>::internal(&tree, vec![leaf_idx])
-                        .map_err(|e| PyNodeError::new_err(format!("{e}")))?;
-                    let root_idx = tree.push(root);
-                    tree[leaf_idx].parent = Some(root_idx);
-                    tree.set_root(Some(root_idx));
+                Self::from_payloads(_cls.py(), leaves, workers)
+            }
 
-                    return Ok(Self { inner: tree });
+            /// Build a tree from leaves of `width` bytes each, packed back to
+            /// back in `data` (bytes or bytearray), so no offsets are needed.
+            #[inline]
+            #[classmethod]
+            #[pyo3(signature = (data, width, workers = None))]
+            pub fn from_rows(
+                _cls: &PyBound<'_, PyType>,
+                data: PyBound<'_, PyAny>,
+                width: usize,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let data = if let Ok(bytes) = data.downcast::<PyBytes>() {
+                    bytes.as_bytes()
+                } else if let Ok(bytearray) = data.downcast::<PyByteArray>() {
+                    // SAFETY: as in `from_packed`, no Python code runs until
+                    // every leaf has been copied out below.
+                    unsafe { bytearray.as_bytes() }
+                } else {
+                    return Err(PyTypeError::new_err("data must be bytes or bytearray"));
+                };
+                if width == 0 || data.len() % width != 0 {
+                    return Err(PyValueError::new_err(
+                        "data must hold a whole number of rows of a positive width",
+                    ));
                 }
 
-                let mut queue: std::collections::VecDeque<NodeIndex<usize>> =
-                    std::collections::VecDeque::new();
+                let leaves = data
+                    .chunks_exact(width)
+                    .map(|payload| (payload.to_vec(), None))
+                    .collect();
 
-                for payload in leaves {
-                    let idx = tree.push(<$node>::leaf(payload));
-                    queue.push_back(idx);
-                }
+                Self::from_payloads(_cls.py(), leaves, workers)
+            }
 
-                while queue.len() > 1 {
-                    let lhs = queue.pop_front().unwrap();
-                    let rhs = queue.pop_front().unwrap();
+            /// Build a tree whose leaves carry the given digests as they are,
+            /// so only the internal nodes are hashed. `digests` is one buffer
+            /// of digests packed back to back (bytes or bytearray, as
+            /// `leaf_digests` returns) or an iterable of single digests. Each
+            /// leaf's value is its digest.
+            #[inline]
+            #[classmethod]
+            #[pyo3(signature = (digests, workers = None))]
+            pub fn from_digests(
+                _cls: &PyBound<'_, PyType>,
+                digests: PyBound<'_, PyAny>,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let size = <$digest as Digest>::output_size();
+
+                let packed = if let Ok(bytes) = digests.downcast::<PyBytes>() {
+                    Some(bytes.as_bytes())
+                } else if let Ok(bytearray) = digests.downcast::<PyByteArray>() {
+                    // SAFETY: as in `from_packed`, no Python code runs until
+                    // every digest has been copied out below.
+                    Some(unsafe { bytearray.as_bytes() })
+                } else {
+                    None
+                };
 
-                    let parent_idx = tree.push(
-                        <$node>::internal(&tree, vec![lhs, rhs])
-                            .map_err(|e| PyNodeError::new_err(format!("{e}")))?,
-                    );
+                let leaves = if let Some(data) = packed {
+                    if data.len() % size != 0 {
+                        return Err(PyValueError::new_err(format!(
+                            "digests must hold a whole number of {size}-byte digests"
+                        )));
+                    }
+                    data.chunks_exact(size)
+                        .map(|digest| {
+                            let hash = GenericArray::<$digest>::clone_from_slice(digest);
+                            (digest.to_vec(), Some(hash))
+                        })
+                        .collect()
+                } else {
+                    let mut leaves = Vec::new();
+                    for obj in digests.try_iter()? {
+                        let digest = extract_to_bytes(&obj?)?;
+                        if digest.len() != size {
+                            return Err(PyValueError::new_err(format!(
+                                "every digest must be {size} bytes long"
+                            )));
+                        }
+                        let hash = GenericArray::<$digest>::clone_from_slice(&digest);
+                        leaves.push((digest, Some(hash)));
+                    }
+                    leaves
+                };
+
+                Self::from_payloads(_cls.py(), leaves, workers)
+            }
+
+            /// Return a copy of the tree with the leaves at the given
+            /// positions (in leaf order) replaced. Only the new leaves and
+            /// their ancestors are hashed; every other digest is kept.
+            #[pyo3(signature = (changes, workers = None))]
+            pub fn replace_leaves(
+                &self,
+                py: Python<'_>,
+                changes: Vec<(usize, PyBound<'_, PyAny>)>,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let indices = self.leaf_indices();
+                let mut replaced: FastHashMap<NodeIndex<usize>, Vec<u8>> = FastHashMap::default();
+
+                for (position, payload) in changes {
+                    let index = indices
+                        .get(position)
+                        .ok_or_else(|| PyIndexError::new_err("leaf index out of range"))?;
+                    replaced.insert(*index, extract_to_bytes(&payload)?);
+                }
+
+                Ok(self.patch_leaves(py, replaced.into_iter().collect(), workers))
+            }
 
-                    tree[lhs].parent = Some(parent_idx);
-                    tree[rhs].parent = Some(parent_idx);
+            /// Return a copy of the tree holding `leaves`, one per existing
+            /// leaf in leaf order. Leaves whose bytes are unchanged keep
+            /// their digest, and so does every internal node with no changed
+            /// leaf below it.
+            #[pyo3(signature = (leaves, workers = None))]
+            pub fn rebuild_from_leaves(
+                &self,
+                py: Python<'_>,
+                leaves: Vec<PyBound<'_, PyAny>>,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let indices = self.leaf_indices();
+                if leaves.len() != indices.len() {
+                    return Err(PyValueError::new_err(format!(
+                        "expected {} leaves, got {}",
+                        indices.len(),
+                        leaves.len()
+                    )));
+                }
 
-                    queue.push_back(parent_idx);
+                let mut replaced = Vec::new();
+                for (index, payload) in indices.into_iter().zip(leaves) {
+                    let payload = extract_to_bytes(&payload)?;
+                    if self.inner[index].value() != Some(payload.as_slice()) {
+                        replaced.push((index, payload));
+                    }
                 }
-                tree.set_root(queue.pop_front());
 
-                Ok(Self { inner: tree })
+                Ok(self.patch_leaves(py, replaced, workers))
             }
 
             fn __getitem__<'py>(
@@ -488,11 +891,21 @@ macro_rules! py_mrkle_tree {
                 py: Python<'py>,
                 key: &PyBound<'py, PyAny>,
             ) -> PyResult<PyBound<'py, PyAny>> {
-                let module = PyModule::import(py, intern!(py, "mrkle"))?;
-                MRKLE_MODULE.get_or_init_py_attached(py, || module.clone().unbind());
-                let node_cls = module.getattr(intern!(py, "MrkleNode"))?;
+                let wrapper = node_wrapper(py)?;
+
+                // Slices, lists and tuples are told apart by type first, so
+                // they skip the integer conversion, whose failure raises and
+                // fetches a Python exception.
+                let index = if key.is_instance_of::<PySlice>()
+                    || key.is_instance_of::<PyList>()
+                    || key.is_instance_of::<PyTuple>()
+                {
+                    None
+                } else {
+                    key.extract::<isize>().ok()
+                };
 
-                if let Ok(mut index) = key.extract::<isize>() {
+                if let Some(mut index) = index {
                     let len = self.len() as isize;
 
                     if index < 0 {
@@ -510,38 +923,32 @@ macro_rules! py_mrkle_tree {
                         .get(idx)
                         .ok_or_else(|| PyIndexError::new_err("index out of range"))?;
 
-                    let py_node = node_cls
-                        .call_method1(intern!(py, "construct_from_node"), (value.clone(),))?;
-
-                    return Ok(py_node);
+                    return wrapper.wrap(py, value.clone());
                 }
 
-                if let Ok(slice) = key.extract::<PyBound<'_, PySlice>>() {
+                if let Ok(slice) = key.downcast::<PySlice>() {
                     let indices = slice.indices(self.len() as isize)?;
-                    let (start, stop, step) = (indices.start, indices.stop, indices.step);
+                    let (start, step) = (indices.start, indices.step);
 
-                    let mut out = Vec::new();
-                    let mut i = start;
-                    while if step > 0 { i < stop } else { i > stop } {
-                        let idx = i as usize;
+                    // The slice length is known, so the output is sized once
+                    // and the positions are stepped without a bounds test.
+                    let mut out = Vec::with_capacity(indices.slicelength);
+                    for k in 0..indices.slicelength as isize {
+                        let idx = (start + k * step) as usize;
                         if let Some(value) = self.get(idx) {
-                            let py_node = node_cls.call_method1(
-                                intern!(py, "construct_from_node"),
-                                (value.clone(),),
-                            )?;
-                            out.push(py_node);
+                            out.push(wrapper.wrap(py, value.clone())?);
                         }
-                        i += step;
                     }
 
                     return Ok(PyList::new(py, &out)?.into_any());
                 }
-                if let Ok(seq) = key.extract::<PyBound<'_, PySequence>>() {
-                    let mut out = Vec::new();
+
+                if let Ok(seq) = key.downcast::<PySequence>() {
+                    let len = self.len() as isize;
+                    let mut out = Vec::with_capacity(seq.len().unwrap_or(0));
 
                     for item in seq.try_iter()? {
                         let mut index: isize = item?.extract()?;
-                        let len = self.len() as isize;
 
                         if index < 0 {
                             index = len
@@ -555,11 +962,7 @@ macro_rules! py_mrkle_tree {
 
                         let idx = index as usize;
                         if let Some(value) = self.get(idx) {
-                            let py_node = node_cls.call_method1(
-                                intern!(py, "construct_from_node"),
-                                (value.clone(),),
-                            )?;
-                            out.push(py_node);
+                            out.push(wrapper.wrap(py, value.clone())?);
                         }
                     }
 
@@ -572,15 +975,9 @@ macro_rules! py_mrkle_tree {
             }
 
             fn __iter__(slf: PyRef<'_, Self>) -> PyResult<$iter_name> {
-                let mut queue = std::collections::VecDeque::new();
-
-                if let Some(root) = slf.inner.start() {
-                    queue.push_back(root.index());
-                }
-
                 Ok($iter_name {
                     tree: slf.into(),
-                    queue,
+                    position: 0,
                 })
             }
 
@@ -597,7 +994,34 @@ macro_rules! py_mrkle_tree {
             }
 
             fn to_string(&self) -> String {
-                format!("{}", self.inner)
+                // Each line holds an 11-character digest preview and, below
+                // the root, a 4-character connector, so the text is sized
+                // near its final length rather than regrown as it is written.
+                let mut out = String::with_capacity(self.len() * 16);
+                std::fmt::Write::write_fmt(&mut out, format_args!("{}", self.inner))
+                    .expect("writing to a String can not fail");
+                out
+            }
+
+            /// Pass the pretty print to `write` in chunks of about
+            /// `chunk_size` bytes, instead of returning it as one string.
+            #[pyo3(signature = (write, chunk_size = 65536))]
+            fn write_string(
+                &self,
+                write: &PyBound<'_, PyAny>,
+                chunk_size: usize,
+            ) -> PyResult<()> {
+                // Formatting an empty tree would panic on its missing root.
+                self.root()?;
+                if chunk_size == 0 {
+                    return Err(PyValueError::new_err(
+                        "chunk_size must be a positive integer",
+                    ));
+                }
+
+                let mut writer = ChunkWriter::new(write, chunk_size);
+                let result = std::fmt::write(&mut writer, format_args!("{}", self.inner));
+                writer.finish(result)
             }
 
             #[pyo3(text_signature = "(self, fp, *, indent : Optional[int] = None encoding : Literal['bytes', 'utf-8'])")]
@@ -611,7 +1035,7 @@ macro_rules! py_mrkle_tree {
                 let buf = JsonCodec::<&[u8], $digest>::new(
                     self.inner
                         .start()
-                        .and_then(|root| self.visit_node(root, &mut HashMap::new()))
+                        .and_then(|root| self.visit_node(root, &mut FastHashMap::default()))
                         .ok_or_else(|| SerdeError::new_err("JSON could not be serialized."))?,
                 );
 
@@ -696,11 +1120,12 @@ macro_rules! py_mrkle_tree {
                 py: Python<'_>,
                 data: &Bound<'_, PyAny>,
             ) -> PyResult<Self> {
-                // Try to extract as bytes or string
+                // Try to extract as bytes or string. Parsing touches no Python
+                // object, so other threads run while a large payload is decoded.
                 let json_codec = if let Ok(bytes) = data.extract::<&[u8]>() {
-                    JsonCodec::<Box<[u8]>, $digest>::from_slice(bytes)
+                    py.detach(|| JsonCodec::<Box<[u8]>, $digest>::from_slice(bytes))
                 } else if let Ok(string) = data.extract::<String>() {
-                    JsonCodec::<Box<[u8]>, $digest>::from_str_utf8(string.as_str())
+                    py.detach(|| JsonCodec::<Box<[u8]>, $digest>::from_str_utf8(string.as_str()))
                 } else {
                     return Err(PyTypeError::new_err(
                         "Expected bytes or string for JSON deserialization",
@@ -733,7 +1158,7 @@ macro_rules! py_mrkle_tree {
                     Self::build_tree_from_json(py, json_codec.into_tree(), &mut tree)?;
                 tree.set_root(Some(root_idx));
 
-                Ok(Self { inner: tree })
+                Ok(Self::from(tree))
             }
 
             // Add a load method for reading from file
@@ -758,8 +1183,9 @@ macro_rules! py_mrkle_tree {
                         ))
                     })?;
 
-                    // Deserialize from the buffer
-                    let json_codec = JsonCodec::<Box<[u8]>, $digest>::from_slice(&buffer)
+                    // Deserialize from the buffer, without holding the GIL
+                    let json_codec = py
+                        .detach(|| JsonCodec::<Box<[u8]>, $digest>::from_slice(&buffer))
                         .map_err(|e| {
                             SerdeError::new_err(format!(
                                 "{}",
@@ -790,12 +1216,251 @@ macro_rules! py_mrkle_tree {
                         Self::build_tree_from_json(py, json_codec.into_tree(), &mut tree)?;
                     tree.set_root(Some(root_idx));
 
-                    Ok(Self { inner: tree })
+                    Ok(Self::from(tree))
                 })
             }
         }
 
         impl $name {
+            /// Hash `leaves` and assemble them into a balanced tree. Leaves
+            /// that already carry their digest are not hashed again.
+            fn from_payloads(
+                py: Python<'_>,
+                mut leaves: Vec<(Vec<u8>, Option<GenericArray<$digest>>)>,
+                workers: Option<usize>,
+            ) -> PyResult<Self> {
+                let mut tree = Tree::<$node, usize>::new();
+
+                if leaves.is_empty() {
+                    return Ok(Self::from(tree));
+                }
+
+                if leaves.len() == 1 {
+                    let leaf = match leaves.pop().unwrap() {
+                        (payload, Some(hash)) => <$node>::leaf_with_hash(payload, hash),
+                        (payload, None) => <$node>::leaf(payload),
+                    };
+
+                    let leaf_idx = tree.push(leaf);
+
+                    let root = <$node>::internal(&tree, vec![leaf_idx])
+                        .map_err(|e| PyNodeError::new_err(format!("{e}")))?;
+                    let root_idx = tree.push(root);
+                    tree[leaf_idx].parent = Some(root_idx);
+                    tree.set_root(Some(root_idx));
+
+                    return Ok(Self::from(tree));
+                }
+
+                // Leaf digests are independent, so they are computed in parallel
+                // before the nodes are pushed in input order, four at a time so
+                // backends with an interleaved kernel can overlap neighbours.
+                // Pair nodes in FIFO order one round at a time: every pair in a
+                // round is independent, so their digests are computed in
+                // parallel too. An odd node left over is carried to the front of
+                // the next round.
+                let digest_4x = <$digest as crate::crypto::PyDigest>::digest_4x;
+                let digest_pair = <$digest as crate::crypto::PyDigest>::digest_pair;
+                let digest_pair_4x = <$digest as crate::crypto::PyDigest>::digest_pair_4x;
+
+                let root = py.detach(|| {
+                    with_workers(workers, || {
+                        leaves
+                            .par_chunks_mut(4)
+                            .with_min_len(LEAF_GRAIN / 4)
+                            .for_each(|chunk| match chunk {
+                                [(a, ha), (b, hb), (c, hc), (d, hd)]
+                                    if ha.is_none()
+                                        && hb.is_none()
+                                        && hc.is_none()
+                                        && hd.is_none() =>
+                                {
+                                    let [da, db, dc, dd] = digest_4x([
+                                        a.as_slice(),
+                                        b.as_slice(),
+                                        c.as_slice(),
+                                        d.as_slice(),
+                                    ]);
+                                    (*ha, *hb) = (Some(da), Some(db));
+                                    (*hc, *hd) = (Some(dc), Some(dd));
+                                }
+                                _ => {
+                                    for (payload, hash) in chunk {
+                                        hash.get_or_insert_with(|| {
+                                            <$digest as Digest>::digest(payload)
+                                        });
+                                    }
+                                }
+                            });
+
+                        // Each round reads its children's digests from a packed
+                        // buffer instead of striding through the node structs,
+                        // and hands the digests it produces to the next round
+                        // the same way.
+                        let mut digests: Vec<GenericArray<$digest>> =
+                            Vec::with_capacity(leaves.len());
+                        let mut level: Vec<NodeIndex<usize>> = leaves
+                            .into_iter()
+                            .map(|(payload, hash)| {
+                                let hash = hash.expect("hashed above");
+                                digests.push(hash.clone());
+                                tree.push(<$node>::leaf_with_hash(payload, hash))
+                            })
+                            .collect();
+
+                        while level.len() > 1 {
+                            let carry = if level.len() % 2 == 1 {
+                                level.pop().zip(digests.pop())
+                            } else {
+                                None
+                            };
+
+                            // Sibling pairs are hashed four at a time so backends
+                            // with an interleaved kernel can overlap them.
+                            let mut hashes: Vec<GenericArray<$digest>> =
+                                vec![GenericArray::<$digest>::default(); level.len() / 2];
+                            hashes
+                                .par_chunks_mut(4)
+                                .zip(digests.par_chunks(8))
+                                .with_min_len(PAIR_GRAIN / 2)
+                                .for_each(|(out, children)| match children {
+                                    [a, b, c, d, e, f, g, h] => {
+                                        let pairs = [
+                                            (a.as_slice(), b.as_slice()),
+                                            (c.as_slice(), d.as_slice()),
+                                            (e.as_slice(), f.as_slice()),
+                                            (g.as_slice(), h.as_slice()),
+                                        ];
+                                        out.clone_from_slice(&digest_pair_4x(pairs));
+                                    }
+                                    _ => {
+                                        let tail = out.iter_mut().zip(children.chunks_exact(2));
+                                        for (out, pair) in tail {
+                                            *out = digest_pair(&pair[0], &pair[1]);
+                                        }
+                                    }
+                                });
+
+                            let mut next = Vec::with_capacity(hashes.len() + 1);
+                            let mut next_digests = Vec::with_capacity(hashes.len() + 1);
+                            if let Some((index, digest)) = carry {
+                                next.push(index);
+                                next_digests.push(digest);
+                            }
+
+                            for (pair, hash) in level.chunks_exact(2).zip(hashes) {
+                                next_digests.push(hash.clone());
+                                let parent_idx =
+                                    tree.push(<$node>::internal_with_hash(hash, pair.to_vec()));
+                                tree[pair[0]].parent = Some(parent_idx);
+                                tree[pair[1]].parent = Some(parent_idx);
+                                next.push(parent_idx);
+                            }
+
+                            digests = next_digests;
+                            level = next;
+                        }
+                        level.pop()
+                    })
+                })?;
+                tree.set_root(root);
+
+                Ok(Self::from(tree))
+            }
+
+            /// Copy the tree with the leaves at `changes` given new payloads.
+            /// Only the ancestors of a changed leaf are hashed again, one
+            /// depth at a time from the bottom up; every other digest is
+            /// carried over from `self`.
+            fn patch_leaves(
+                &self,
+                py: Python<'_>,
+                changes: Vec<(NodeIndex<usize>, Vec<u8>)>,
+                workers: Option<usize>,
+            ) -> Self {
+                let mut tree = self.inner.clone();
+
+                if changes.is_empty() {
+                    return Self::from(tree);
+                }
+
+                let digest_pair = <$digest as crate::crypto::PyDigest>::digest_pair;
+
+                py.detach(|| {
+                    with_workers(workers, || {
+                        let hashes: Vec<GenericArray<$digest>> = changes
+                            .par_iter()
+                            .with_min_len(LEAF_GRAIN)
+                            .map(|(_, payload)| <$digest as Digest>::digest(payload))
+                            .collect();
+
+                        // Depth below the root of every node on a changed spine.
+                        // A walk stops at the first node another spine reached.
+                        let mut depths: FastHashMap<NodeIndex<usize>, usize> =
+                            FastHashMap::default();
+                        for ((index, payload), hash) in changes.into_iter().zip(hashes) {
+                            let parent = tree[index].parent;
+                            tree[index] = <$node>::leaf_with_hash(payload, hash);
+                            tree[index].parent = parent;
+
+                            let mut spine = Vec::new();
+                            let mut cursor = parent;
+                            while let Some(node) = cursor {
+                                if depths.contains_key(&node) {
+                                    break;
+                                }
+                                spine.push(node);
+                                cursor = tree[node].parent;
+                            }
+
+                            let base = cursor.map_or(0, |node| depths[&node] + 1);
+                            for (offset, node) in spine.into_iter().rev().enumerate() {
+                                depths.insert(node, base + offset);
+                            }
+                        }
+
+                        let mut levels: Vec<Vec<NodeIndex<usize>>> = Vec::new();
+                        for (node, depth) in depths {
+                            if levels.len() <= depth {
+                                levels.resize_with(depth + 1, Vec::new);
+                            }
+                            levels[depth].push(node);
+                        }
+
+                        // Nodes at one depth only read digests from the depth
+                        // below, which is already final.
+                        for level in levels.into_iter().rev() {
+                            let rehashed: Vec<_> = level
+                                .into_par_iter()
+                                .with_min_len(PAIR_GRAIN)
+                                .map(|index| {
+                                    let children = tree[index].children();
+                                    let hash = match *children.as_slice() {
+                                        [a, b] => digest_pair(tree[a].hash(), tree[b].hash()),
+                                        _ => {
+                                            let mut hasher = <$digest>::new();
+                                            for &child in &children {
+                                                hasher.update(tree[child].hash());
+                                            }
+                                            hasher.finalize()
+                                        }
+                                    };
+                                    (index, hash, children)
+                                })
+                                .collect();
+
+                            for (index, hash, children) in rehashed {
+                                let parent = tree[index].parent;
+                                tree[index] = <$node>::internal_with_hash(hash, children);
+                                tree[index].parent = parent;
+                            }
+                        }
+                    })
+                });
+
+                Self::from(tree)
+            }
+
             /// Return the length of the [`Tree`] i.e # of nodes
             #[inline]
             pub fn len(&self) -> usize {
@@ -853,6 +1518,18 @@ macro_rules! py_mrkle_tree {
                 self.inner.iter()
             }
 
+            /// Node indices in breadth-first order, walked once and then
+            /// served to every iterator over this tree.
+            fn bfs_order(&self) -> &[usize] {
+                self.order.get_or_init(|| {
+                    self.inner
+                        .iter_idx()
+                        .map(|index| index.index())
+                        .filter(|&index| index < self.inner.len())
+                        .collect()
+                })
+            }
+
             fn build_tree_from_json(
                 py: Python<'_>,
                 node: MerkleTreeJson<Box<[u8]>>,
@@ -900,7 +1577,7 @@ macro_rules! py_mrkle_tree {
             fn visit_node(
                 &self,
                 index: NodeIndex<usize>,
-                visited: &mut HashMap<usize, ()>,
+                visited: &mut FastHashMap<usize, ()>,
             ) -> Option<MerkleTreeJson<&[u8]>> {
                 let idx = index.index();
                 if visited.contains_key(&idx) {
@@ -993,6 +1670,15 @@ py_mrkle_tree!(
     "MrkleTreeIterBlake2s"
 );
 
+py_mrkle_tree!(
+    PyMrkleTreeBlake3,
+    PyMrkleTreeIterBlake3,
+    PyMrkleNode_Blake3,
+    PyBlake3Wrapper,
+    "MrkleTreeBlake3",
+    "MrkleTreeIterBlake3"
+);
+
 py_mrkle_tree!(
     PyMrkleTreeKeccak224,
     PyMrkleTreeIterKeccak224,
@@ -1029,9 +1715,70 @@ py_mrkle_tree!(
     "MrkleTreeIterKeccak512"
 );
 
+/// The pieces of `mrkle.MrkleNode.construct_from_node`, resolved on first use.
+static NODE_WRAPPER: OnceLock<NodeWrapper> = OnceLock::new();
+
+/// Wraps backend nodes in the Python `MrkleNode` type the way
+/// `MrkleNode.construct_from_node` does: a bare `object.__new__` followed
+/// by a store through the `_inner` slot's descriptor. Both are C callables,
+/// so no Python frame runs per wrapped node.
+struct NodeWrapper {
+    class: Py<PyAny>,
+    new: Py<PyAny>,
+    set_inner: Py<PyAny>,
+}
+
+impl NodeWrapper {
+    fn wrap<'py, N>(&self, py: Python<'py>, node: N) -> PyResult<PyBound<'py, PyAny>>
+    where
+        N: IntoPyObject<'py>,
+    {
+        let obj = self.new.bind(py).call1((self.class.bind(py),))?;
+        self.set_inner.bind(py).call1((&obj, node))?;
+        Ok(obj)
+    }
+}
+
+/// Return the cached [`NodeWrapper`] for `mrkle.MrkleNode`.
+///
+/// The class is looked up once, so indexing a single node does not go
+/// through the import system on every call.
+fn node_wrapper(py: Python<'_>) -> PyResult<&'static NodeWrapper> {
+    if let Some(wrapper) = NODE_WRAPPER.get() {
+        return Ok(wrapper);
+    }
+
+    let module = PyModule::import(py, intern!(py, "mrkle"))?;
+    MRKLE_MODULE.get_or_init_py_attached(py, || module.clone().unbind());
+    let class = module.getattr(intern!(py, "MrkleNode"))?;
+    let new = PyModule::import(py, intern!(py, "builtins"))?
+        .getattr(intern!(py, "object"))?
+        .getattr(intern!(py, "__new__"))?;
+    let set_inner = class
+        .getattr(intern!(py, "__dict__"))?
+        .get_item(intern!(py, "_inner"))?
+        .getattr(intern!(py, "__set__"))?;
+    Ok(NODE_WRAPPER.get_or_init_py_attached(py, || NodeWrapper {
+        class: class.unbind(),
+        new: new.unbind(),
+        set_inner: set_inner.unbind(),
+    }))
+}
+
+/// Shape of a nested leaf dictionary.
+///
+/// Leaf payloads are stored out of line (in depth-first order) and referenced
+/// by index so that every leaf can be hashed in a single batch, after which the
+/// internal digests are filled in before the tree is assembled.
+enum DictShape<D: Digest> {
+    Leaf(usize),
+    Branch(Option<GenericArray<D>>, Vec<DictShape<D>>),
+}
+
 fn traverse_dict_depth<N: PyMrkleNode<D, usize>, D: Digest>(
     dict: PyBound<'_, PyDict>,
     tree: &mut Tree<N, usize>,
+    workers: Option<usize>,
 ) -> PyResult<()> {
     if dict.len() != 1 {
         return Err(PyValueError::new_err(
@@ -1042,9 +1789,9 @@ fn traverse_dict_depth<N: PyMrkleNode<D, usize>, D: Digest>(
     let root: Vec<_> = dict.items().iter().collect();
 
     if let Ok((_, value)) = root[0].extract::<(Bound<PyAny>, Bound<PyAny>)>() {
-        let root = process_traversal(&value, tree)?;
-        tree.set_root(Some(root));
-        Ok(())
+        let mut payloads = Vec::new();
+        let shape = process_traversal::<D>(&value, &mut payloads)?;
+        assemble_from_shape(dict.py(), shape, payloads, tree, workers)
     } else {
         Err(PyValueError::new_err(String::from(
             "Invalid value type for expected dict or bytes",
@@ -1052,34 +1799,203 @@ fn traverse_dict_depth<N: PyMrkleNode<D, usize>, D: Digest>(
     }
 }
 
-fn process_traversal<N: PyMrkleNode<D, usize>, D: Digest>(
-    value: &Bound<'_, PyAny>,
+/// Hash the leaves and internal nodes described by `shape` and push the
+/// resulting nodes into `tree`.
+fn assemble_from_shape<N: PyMrkleNode<D, usize>, D: Digest>(
+    py: Python<'_>,
+    mut shape: DictShape<D>,
+    payloads: Vec<Vec<u8>>,
     tree: &mut Tree<N, usize>,
-) -> PyResult<NodeIndex<usize>> {
-    if let Ok(child_dict) = value.downcast::<PyDict>() {
-        let mut indices: Vec<NodeIndex<usize>> = Vec::new();
+    workers: Option<usize>,
+) -> PyResult<()> {
+    // Leaves are hashed on the same pool as the internal nodes, so `workers`
+    // bounds the whole build and no step holds the GIL.
+    let hashes = py.detach(|| {
+        with_workers(workers, || {
+            let hashes: Vec<GenericArray<D>> = payloads
+                .par_iter()
+                .with_min_len(LEAF_GRAIN)
+                .map(|payload| <D as Digest>::digest(payload))
+                .collect();
+            digest_shape(&mut shape, &hashes);
+            hashes
+        })
+    })?;
+
+    let mut leaves = payloads.into_iter().zip(hashes);
+    let root = build_from_shape(shape, &mut leaves, tree)?;
+    tree.set_root(Some(root));
+    Ok(())
+}
 
-        // Process all children
-        for (_, child) in child_dict.iter() {
-            let child_id: NodeIndex<usize> = process_traversal(&child, tree)?;
-            indices.push(child_id);
+/// Entry of a flattened dictionary once its keys have been split on the
+/// separator. Mirrors the nesting produced by `mrkle.utils.unflatten`.
+enum FlatEntry<'py> {
+    Value(PyBound<'py, PyAny>),
+    Branch(FlatBranch<'py>),
+}
+
+/// Children of a branch this wide or narrower are found by scanning their
+/// keys; wider branches build a hash index once.
+const FLAT_INDEX_THRESHOLD: usize = 16;
+
+/// Insertion-ordered children of a [`FlatEntry::Branch`].
+///
+/// Most branches of a flattened dictionary hold a handful of children, so
+/// they are searched linearly and never allocate a hash table.
+#[derive(Default)]
+struct FlatBranch<'py> {
+    keys: Vec<Box<str>>,
+    entries: Vec<FlatEntry<'py>>,
+    index: Option<FastHashMap<Box<str>, usize>>,
+}
+
+impl<'py> FlatBranch<'py> {
+    fn position(&self, key: &str) -> Option<usize> {
+        match &self.index {
+            Some(index) => index.get(key).copied(),
+            None => self.keys.iter().position(|existing| &**existing == key),
+        }
+    }
+
+    /// Position of the child under `key`, appending an empty branch there
+    /// when there is none.
+    fn slot(&mut self, key: &str) -> usize {
+        if let Some(position) = self.position(key) {
+            return position;
+        }
+
+        let position = self.entries.len();
+        self.keys.push(key.into());
+        self.entries.push(FlatEntry::Branch(FlatBranch::default()));
+
+        if let Some(index) = &mut self.index {
+            index.insert(key.into(), position);
+        } else if self.keys.len() > FLAT_INDEX_THRESHOLD {
+            let index = self.keys.iter().cloned().zip(0..).collect();
+            self.index = Some(index);
+        }
+        position
+    }
+
+    /// Descend into `key`, replacing any value stored there with a branch,
+    /// and return the child's position.
+    fn branch(&mut self, key: &str) -> usize {
+        let position = self.slot(key);
+        if let FlatEntry::Value(_) = self.entries[position] {
+            self.entries[position] = FlatEntry::Branch(FlatBranch::default());
+        }
+        position
+    }
+
+    /// The branch at `position`, as returned by [`FlatBranch::branch`].
+    fn child(&mut self, position: usize) -> &mut FlatBranch<'py> {
+        match &mut self.entries[position] {
+            FlatEntry::Branch(branch) => branch,
+            FlatEntry::Value(_) => unreachable!("a walked position holds a branch"),
+        }
+    }
+
+    fn insert(&mut self, key: &str, value: PyBound<'py, PyAny>) {
+        let position = self.slot(key);
+        self.entries[position] = FlatEntry::Value(value);
+    }
+}
+
+/// Build a tree from a flattened dictionary whose keys encode the path to
+/// each leaf, splitting keys in a single pass over the dictionary rather
+/// than unflattening it in Python first.
+fn traverse_flat_dict<N: PyMrkleNode<D, usize>, D: Digest>(
+    dict: PyBound<'_, PyDict>,
+    sep: &str,
+    tree: &mut Tree<N, usize>,
+    workers: Option<usize>,
+) -> PyResult<()> {
+    if sep.is_empty() {
+        return Err(PyValueError::new_err("empty separator"));
+    }
+
+    // Keys usually arrive grouped by parent, so the previous key's parent
+    // prefix is kept with the child positions that lead to it. A key with
+    // the same prefix is inserted there without looking up its components.
+    let mut root = FlatBranch::default();
+    let mut parent: Option<String> = None;
+    let mut path: Vec<usize> = Vec::new();
+    for (key, value) in dict.iter() {
+        // Borrows the interpreter's cached UTF-8 buffer where the ABI allows it.
+        let key = key.downcast::<PyString>()?.to_cow()?;
+        let leaf = key
+            .split(sep)
+            .last()
+            .expect("split yields at least one part");
+        let prefix = &key[..key.len() - leaf.len()];
+
+        if parent.as_deref() != Some(prefix) {
+            path.clear();
+            let mut steps = prefix.split(sep);
+            let mut step = steps.next().expect("split yields at least one part");
+            let mut branch = &mut root;
+            for next in steps {
+                let position = branch.branch(step);
+                path.push(position);
+                branch = branch.child(position);
+                step = next;
+            }
+            parent = Some(prefix.to_owned());
+        }
+
+        let mut branch = &mut root;
+        for &position in &path {
+            branch = branch.child(position);
         }
+        branch.insert(leaf, value);
+    }
 
-        // Create internal node from children
-        let node_id = tree
-            .push(N::internal(tree, indices).map_err(|e| PyNodeError::new_err(format!("{e}")))?);
+    if root.entries.len() != 1 {
+        return Err(PyValueError::new_err(
+            "The dictionary can not contain more than one root.",
+        ));
+    }
 
-        for child in tree[node_id].children() {
-            tree[child.index()].set_parent(node_id);
+    let mut payloads = Vec::new();
+    let shape = flat_shape::<D>(root.entries.remove(0), &mut payloads)?;
+    assemble_from_shape(dict.py(), shape, payloads, tree, workers)
+}
+
+fn flat_shape<D: Digest>(
+    entry: FlatEntry<'_>,
+    payloads: &mut Vec<Vec<u8>>,
+) -> PyResult<DictShape<D>> {
+    match entry {
+        FlatEntry::Value(value) => process_traversal(&value, payloads),
+        FlatEntry::Branch(branch) => {
+            let mut children = Vec::with_capacity(branch.entries.len());
+            for child in branch.entries {
+                children.push(flat_shape(child, payloads)?);
+            }
+            Ok(DictShape::Branch(None, children))
         }
+    }
+}
 
-        return Ok(node_id);
+fn process_traversal<D: Digest>(
+    value: &Bound<'_, PyAny>,
+    payloads: &mut Vec<Vec<u8>>,
+) -> PyResult<DictShape<D>> {
+    if let Ok(child_dict) = value.downcast::<PyDict>() {
+        let mut children = Vec::with_capacity(child_dict.len());
+
+        // Process all children
+        for (_, child) in child_dict.iter() {
+            children.push(process_traversal(&child, payloads)?);
+        }
+
+        return Ok(DictShape::Branch(None, children));
     }
 
     if let Ok(child) = extract_to_bytes(value) {
-        let leaf = N::leaf(child);
-        let index = tree.push(leaf);
-        return Ok(index);
+        payloads.push(child);
+        return Ok(DictShape::Leaf(payloads.len() - 1));
     }
 
     Err(PyValueError::new_err(String::from(
@@ -1087,6 +2003,84 @@ fn process_traversal<N: PyMrkleNode<D, usize>, D: Digest>(
     )))
 }
 
+/// Compute the digest of every internal node in `shape`, hashing sibling
+/// subtrees in parallel, and return the digest of `shape` itself.
+fn digest_shape<D: Digest>(
+    shape: &mut DictShape<D>,
+    leaves: &[GenericArray<D>],
+) -> GenericArray<D> {
+    match shape {
+        DictShape::Leaf(index) => leaves[*index].clone(),
+        DictShape::Branch(hash, children) => {
+            let digests: Vec<GenericArray<D>> = children
+                .par_iter_mut()
+                .map(|child| digest_shape(child, leaves))
+                .collect();
+
+            let mut hasher = D::new();
+            digests.iter().for_each(|digest| hasher.update(digest));
+            let digest = hasher.finalize();
+
+            *hash = Some(digest.clone());
+            digest
+        }
+    }
+}
+
+fn build_from_shape<N: PyMrkleNode<D, usize>, D: Digest>(
+    shape: DictShape<D>,
+    leaves: &mut impl Iterator<Item = (Vec<u8>, GenericArray<D>)>,
+    tree: &mut Tree<N, usize>,
+) -> PyResult<NodeIndex<usize>> {
+    match shape {
+        DictShape::Leaf(_) => {
+            let (payload, hash) = leaves
+                .next()
+                .ok_or_else(|| PyValueError::new_err("Missing leaf payload."))?;
+            Ok(tree.push(N::leaf_with_hash(payload, hash)))
+        }
+        DictShape::Branch(hash, children) => {
+            let mut indices: Vec<NodeIndex<usize>> = Vec::with_capacity(children.len());
+            for child in children {
+                indices.push(build_from_shape(child, leaves, tree)?);
+            }
+
+            // Create internal node from children
+            let node = match hash {
+                Some(hash) => N::internal_with_hash(hash, indices),
+                None => {
+                    N::internal(tree, indices).map_err(|e| PyNodeError::new_err(format!("{e}")))?
+                }
+            };
+            let node_id = tree.push(node);
+
+            for child in tree[node_id].children() {
+                tree[child.index()].set_parent(node_id);
+            }
+
+            Ok(node_id)
+        }
+    }
+}
+
+/// Return the `hash_type` recorded in a JSON-serialized tree, or `None`
+/// when the field is absent. The tree itself is not decoded.
+#[pyfunction]
+fn json_hash_type(data: &Bound<'_, PyAny>) -> PyResult<Option<String>> {
+    let probe = if let Ok(bytes) = data.extract::<&[u8]>() {
+        HashTypeProbe::from_slice(bytes)
+    } else if let Ok(string) = data.extract::<String>() {
+        HashTypeProbe::from_str_utf8(string.as_str())
+    } else {
+        return Err(PyTypeError::new_err(
+            "Expected bytes or string for JSON deserialization",
+        ));
+    }
+    .map_err(|e| SerdeError::new_err(format!("{}", e)))?;
+
+    Ok(probe.hash_type)
+}
+
 /// Register MerkleTree data structure.
 ///
 /// This function should be called during module initialization to make
@@ -1116,6 +2110,7 @@ pub(crate) fn register_tree(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     tree_m.add_class::<PyMrkleNode_Blake2b>()?;
     tree_m.add_class::<PyMrkleNode_Blake2s>()?;
+    tree_m.add_class::<PyMrkleNode_Blake3>()?;
 
     // Tree(s)
     tree_m.add_class::<PyMrkleTreeSha1>()?;
@@ -1133,6 +2128,7 @@ pub(crate) fn register_tree(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     tree_m.add_class::<PyMrkleTreeBlake2b>()?;
     tree_m.add_class::<PyMrkleTreeBlake2s>()?;
+    tree_m.add_class::<PyMrkleTreeBlake3>()?;
 
     // Iter(s)
     tree_m.add_class::<PyMrkleTreeIterSha1>()?;
@@ -1149,6 +2145,9 @@ pub(crate) fn register_tree(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     tree_m.add_class::<PyMrkleTreeIterBlake2b>()?;
     tree_m.add_class::<PyMrkleTreeIterBlake2s>()?;
+    tree_m.add_class::<PyMrkleTreeIterBlake3>()?;
+
+    tree_m.add_function(wrap_pyfunction!(json_hash_type, &tree_m)?)?;
 
     m.add_submodule(&tree_m)
 }
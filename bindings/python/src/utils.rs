@@ -1,8 +1,9 @@
-use pyo3::exceptions::{PyModuleNotFoundError, PyTypeError};
+use pyo3::exceptions::{PyModuleNotFoundError, PyTypeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyByteArray, PyBytes};
+use pyo3::types::{PyByteArray, PyBytes, PyString};
 use pyo3::Bound as PyBound;
 
+use std::fmt;
 use std::sync::OnceLock;
 
 pub fn get_module<'py>(
@@ -16,6 +17,24 @@ pub fn get_module<'py>(
     Ok(module)
 }
 
+/// Run `f` on a dedicated Rayon pool with `workers` threads, or on the
+/// global pool when `workers` is `None`.
+pub fn with_workers<T, F>(workers: Option<usize>, f: F) -> PyResult<T>
+where
+    T: Send,
+    F: FnOnce() -> T + Send,
+{
+    match workers {
+        Some(0) => Err(PyValueError::new_err("workers must be a positive integer")),
+        Some(threads) => rayon::ThreadPoolBuilder::new()
+            .num_threads(threads)
+            .build()
+            .map(|pool| pool.install(f))
+            .map_err(|e| PyValueError::new_err(format!("{e}"))),
+        None => Ok(f()),
+    }
+}
+
 pub fn extract_to_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
     if let Ok(bytes) = obj.downcast::<PyBytes>() {
         return Ok(bytes.as_bytes().to_vec());
@@ -25,8 +44,15 @@ pub fn extract_to_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
         return Ok(bytearray.to_vec());
     }
 
-    if let Ok(s) = obj.extract::<String>() {
-        return Ok(s.into_bytes());
+    if let Ok(s) = obj.downcast::<PyString>() {
+        // Surfaces `UnicodeEncodeError` for strings that are not valid UTF-8.
+        //
+        // Strings are encoded here rather than by the Python wrappers: the
+        // owned payload costs exactly one copy either way (from the cached
+        // UTF-8 buffer, or under the 3.8 limited API from the one temporary
+        // `bytes` that `str.encode` would build as well), so encoding in
+        // Python would only add a pass over the input and a second list.
+        return Ok(s.to_cow()?.into_owned().into_bytes());
     }
 
     if obj.hasattr("tobytes")? {
@@ -51,3 +77,55 @@ pub fn extract_to_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
 
     Err(PyTypeError::new_err("Cannot convert to bytes"))
 }
+
+/// A [`fmt::Write`] sink that hands its text to the Python callable `write`
+/// in chunks of about `chunk_size` bytes, so formatted output is never held
+/// as one string on either side of the boundary.
+pub struct ChunkWriter<'a, 'py> {
+    write: &'a PyBound<'py, PyAny>,
+    buffer: String,
+    chunk_size: usize,
+    error: Option<PyErr>,
+}
+
+impl<'a, 'py> ChunkWriter<'a, 'py> {
+    pub fn new(write: &'a PyBound<'py, PyAny>, chunk_size: usize) -> Self {
+        Self {
+            write,
+            buffer: String::with_capacity(chunk_size),
+            chunk_size,
+            error: None,
+        }
+    }
+
+    fn flush(&mut self) -> PyResult<()> {
+        if !self.buffer.is_empty() {
+            self.write.call1((self.buffer.as_str(),))?;
+            self.buffer.clear();
+        }
+        Ok(())
+    }
+
+    /// Hand over the text still buffered, surfacing the first error raised
+    /// by `write` over the failure it caused in the formatter.
+    pub fn finish(mut self, result: fmt::Result) -> PyResult<()> {
+        if let Some(error) = self.error.take() {
+            return Err(error);
+        }
+        result.map_err(|_| PyValueError::new_err("value could not be formatted"))?;
+        self.flush()
+    }
+}
+
+impl fmt::Write for ChunkWriter<'_, '_> {
+    fn write_str(&mut self, s: &str) -> fmt::Result {
+        self.buffer.push_str(s);
+        if self.buffer.len() >= self.chunk_size {
+            self.flush().map_err(|error| {
+                self.error = Some(error);
+                fmt::Error
+            })?;
+        }
+        Ok(())
+    }
+}
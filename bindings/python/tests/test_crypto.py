@@ -48,3 +48,92 @@ def test_mrkle_only(alg, payload):
     h = getattr(crypto, alg).digest(payload)
     assert isinstance(h, (bytes, bytearray))
     assert len(h) == getattr(crypto, alg)().output_size()
+
+
+@pytest.mark.parametrize("alg", list(HASHLIB_ALGS))
+def test_digest_batch_matches_hashlib(alg):
+    """Test batched digests match per-buffer hashlib digests."""
+    expected = [HASHLIB_ALGS[alg](payload).digest() for payload in PAYLOADS]
+    assert getattr(crypto, alg).digest_batch(PAYLOADS) == expected
+
+
+@pytest.mark.parametrize("alg", list(HASHLIB_ALGS))
+def test_finalize_batch_resumes_from_prefix(alg):
+    """Test finalize_batch hashes prefix || buffer for every buffer."""
+    prefix = b"toymodel."
+    state = getattr(crypto, alg)(prefix)
+    expected = [HASHLIB_ALGS[alg](prefix + payload).digest() for payload in PAYLOADS]
+    assert state.finalize_batch(PAYLOADS) == expected
+    assert state.copy().finalize() == HASHLIB_ALGS[alg](prefix).digest()
+
+
+def test_sha256_batch():
+    buffers = [b"a", bytearray(b"b"), memoryview(b"c")]
+    expected = [hashlib.sha256(bytes(b)).digest() for b in buffers]
+    assert crypto.sha256_batch(buffers) == expected
+
+
+@pytest.mark.parametrize("alg", list(HASHLIB_ALGS))
+def test_constructor_with_initial_data(alg):
+    payload = b"hello world"
+    expected = HASHLIB_ALGS[alg](payload).digest()
+    assert getattr(crypto, alg)(payload).finalize() == expected
+    assert getattr(crypto, alg.lower())(payload).finalize() == expected
+
+
+def test_new_with_data():
+    assert (
+        crypto.new("SHA256", data=b"abc").finalize() == hashlib.sha256(b"abc").digest()
+    )
+    assert crypto.new("sha256", b"abc").finalize() == hashlib.sha256(b"abc").digest()
+
+
+def test_new_case_insensitive():
+    assert crypto.new("SHA256").name() == crypto.new("sha256").name()
+    with pytest.raises(ValueError):
+        crypto.new("md5")
+
+
+def test_blake3_known_vector():
+    expected = "af1349b9f5f9a1a6a0404dea36dcc9499bcb25c9adc112b7cc9a93cae41f3262"
+    assert crypto.Blake3.digest(b"").hex() == expected
+    assert crypto.new("blake3").name() == "blake3"
+
+
+def test_registered_algorithms_are_constructible():
+    from mrkle._mrkle_rs import crypto as backend
+
+    for name in backend.registered_algorithms():
+        digest = crypto.new(name)
+        assert digest.name() == name
+    for alias, name in backend.algorithm_aliases().items():
+        assert crypto.new(alias).name() == name
+
+
+def test_algorithms_sets_are_shared_frozensets():
+    guaranteed = crypto.algorithms_guaranteed()
+    assert isinstance(guaranteed, frozenset)
+    assert guaranteed is crypto.algorithms_available()
+    assert guaranteed == set(crypto._algorithms_map)
+
+
+def test_name_is_interned():
+    import sys
+
+    for name in crypto.algorithms_guaranteed():
+        digest_name = crypto.new(name).name()
+        assert digest_name is sys.intern(digest_name)
+
+
+def test_crypto_import_does_not_load_the_tree_modules():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, mrkle.crypto\n"
+        "assert 'mrkle.tree' not in sys.modules\n"
+        "assert 'mrkle.node' not in sys.modules\n"
+        "import mrkle\n"
+        "assert mrkle.MrkleTree is sys.modules['mrkle.tree'].MrkleTree\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
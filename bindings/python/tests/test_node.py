@@ -2,6 +2,7 @@
 
 import hashlib
 import pytest
+from array import array
 from mrkle.node import MrkleNode
 from mrkle.crypto import (
     Sha1,
@@ -15,6 +16,7 @@ from mrkle.crypto import (
     Keccak512,
     Blake2s,
     Blake2b,
+    Blake3,
 )
 from mrkle.crypto.typing import Digest
 
@@ -43,6 +45,7 @@ def test_all_digests_are_digest_types():
         Keccak512,
         Blake2s,
         Blake2b,
+        Blake3,
     ]
     for dtype in digest_types:
         assert isinstance(dtype, type)
@@ -94,7 +97,38 @@ def test_leaf_with_empty_unicode():
     assert node.digest() == hashlib.sha1(b"").digest()
 
 
+def test_node_resolves_dtype_from_backend():
+    node = MrkleNode.leaf(b"data", name="keccak256")
+    assert node.dtype() == Keccak256()
+    assert "keccak256" in repr(node)
+    with pytest.raises(AttributeError):
+        node._dtype_name = "sha1"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [bytearray(b"payload"), memoryview(b"payload"), array("B", b"payload")],
+)
+def test_leaf_with_buffer_types(data):
+    node = MrkleNode.leaf(data)
+    assert node.value() == b"payload"
+    assert node.digest() == hashlib.sha1(b"payload").digest()
+
+
+def test_leaf_with_invalid_utf8_string():
+    with pytest.raises(UnicodeEncodeError):
+        MrkleNode.leaf("\ud800")
+
+
 # Node comparison tests
+def test_leaf_is_shared_by_class_and_instance():
+    node = MrkleNode.leaf(b"data", name="sha256")
+    assert node.leaf(b"data", name="sha256") == node
+    assert type(node) is MrkleNode
+    with pytest.raises(ValueError):
+        MrkleNode.leaf(b"data", name="unknown")
+
+
 def test_different_node_type():
     node_sha1 = MrkleNode.leaf("Hello world")
     node_sha224 = MrkleNode.leaf("Hello world", name="sha224")
@@ -214,6 +248,12 @@ def test_blake2b_output_length():
     assert len(node.hexdigest()) == 128
 
 
+def test_blake3_output_length():
+    node = MrkleNode.leaf("test", name="blake3")
+    assert len(node.digest()) == 32
+    assert len(node.hexdigest()) == 64
+
+
 # Hexdigest format tests
 def test_hexdigest_is_lowercase():
     node = MrkleNode.leaf("test")
@@ -303,7 +343,7 @@ def test_all_keccak_variants():
 
 def test_all_blake_variants():
     data = "test"
-    blake_variants = ["blake2s", "blake2b"]
+    blake_variants = ["blake2s", "blake2b", "blake3"]
     nodes = [MrkleNode.leaf(data, name=variant) for variant in blake_variants]
 
     assert all(node.is_leaf() for node in nodes)
@@ -340,8 +380,40 @@ def test_node_str():
     assert len(str_rep) > 0
 
 
+@pytest.mark.parametrize("name", ["sha1", "sha512", "blake3"])
+def test_node_short_hex_matches_hexdigest_prefix(name):
+    node = MrkleNode.leaf("test", name=name)
+    assert node._inner.short_hex(2) == node.hexdigest()[:4]
+    assert node._inner.short_hex(1000) == node.hexdigest()
+    assert f"id={node.hexdigest()[:4]}," in str(node)
+
+
 # Hashability tests
 def test_node_is_hashable():
     node = MrkleNode.leaf("test")
     hash_value = hash(node)
     assert isinstance(hash_value, int)
+
+
+def test_equal_nodes_hash_equal():
+    nodes = {MrkleNode.leaf(b"a"), MrkleNode.leaf(b"a"), MrkleNode.leaf(b"b")}
+    assert len(nodes) == 2
+    assert hash(MrkleNode.leaf(b"a")) == hash(MrkleNode.leaf(b"a"))
+
+
+def test_node_hash_is_cached():
+    node = MrkleNode.leaf(b"a")
+    assert hash(node) == hash(node._inner)
+    assert node._hash == hash(node)
+    with pytest.raises(AttributeError):
+        node._hash = 0
+
+
+def test_nodes_from_separate_trees_compare_by_digest():
+    from mrkle.tree import MrkleTree
+
+    first = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    second = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    assert set(first.leaves()) == set(second.leaves())
+    assert first[0] == second[0]
+    assert first[0] != MrkleTree.from_leaves([b"a", b"b"], name="sha256")[0]
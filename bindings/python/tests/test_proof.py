@@ -2,7 +2,7 @@ from mrkle.errors import ProofError
 import pytest
 
 import mrkle
-from mrkle.tree import MrkleTree
+from mrkle.tree import MrkleProof, MrkleTree
 
 
 def test_empty_tree_proof():
@@ -41,3 +41,78 @@ def test_from_non_leaf():
         node = tree[3]
         proof = tree.generate_proof(node)
         assert proof.verify(node)
+
+
+@pytest.mark.parametrize("name", ["sha1", "sha256", "blake3"])
+def test_proof_reports_tree_digest(name):
+    tree = MrkleTree.from_leaves(["a", "b", "c"], name=name)
+    proof = tree.generate_proof(0)
+    assert proof.dtype() == tree.dtype()
+    assert str(proof).endswith(f"dtype={name})")
+    assert str(proof).startswith(f"MrkleProof(expected={tree.root()[:2].hex()},")
+
+
+def test_generate_multiproof_matches_single_proofs():
+    tree = MrkleTree.from_leaves(["a", "b", "c", "d", "e"])
+    leaves = [0, 3, 4, 0, tree[1]]
+    proofs = tree.generate_multiproof(leaves)
+
+    assert len(proofs) == len(leaves)
+    for leaf, proof in zip(leaves, proofs):
+        node = tree[leaf] if isinstance(leaf, int) else leaf
+        single = tree.generate_proof(leaf)
+        assert proof.expected() == single.expected()
+        assert proof._inner.get_path(0) == single._inner.get_path(0)
+        assert proof.verify(node)
+
+    with pytest.raises(ProofError):
+        tree.generate_multiproof([0, len(tree) - 1])
+
+
+def test_generate_many_matches_generate():
+    tree = MrkleTree.from_leaves(["a", "b", "c", "d", "e"])
+    leaf_sets = [[0, 1], 3, [tree[2], 4], tree[1]]
+    proofs = MrkleProof.generate_many(tree, leaf_sets)
+
+    assert len(proofs) == len(leaf_sets)
+    for leaves, proof in zip(leaf_sets, proofs):
+        single = MrkleProof.generate(tree, leaves)
+        assert proof.expected() == single.expected()
+        assert len(proof) == len(single)
+        for index in range(len(single)):
+            assert proof._inner.get_path(index) == single._inner.get_path(index)
+
+    with pytest.raises(ValueError):
+        MrkleProof.generate_many(tree, [[0], []])
+
+
+@pytest.mark.parametrize("leaves", [range(5), range(0, 5, 2), range(4, 0, -3)])
+def test_generate_from_range_matches_list(leaves):
+    tree = MrkleTree.from_leaves(["a", "b", "c", "d", "e"])
+    proof = MrkleProof.generate(tree, leaves)
+    expected = MrkleProof.generate(tree, list(leaves))
+    assert len(proof) == len(expected)
+    for index in range(len(expected)):
+        assert proof._inner.get_path(index) == expected._inner.get_path(index)
+
+    with pytest.raises(ValueError):
+        MrkleProof.generate(tree, range(0))
+
+
+def test_proof_expected_is_cached():
+    tree = MrkleTree.from_leaves(["a", "b", "c"], name="sha256")
+    proof = tree.generate_proof(0)
+    assert proof.expected() == tree.root()
+    assert proof.expected() is proof.expected()
+    assert proof.expected_hexdigest() == proof._inner.expected_hexdigest()
+    assert not hasattr(proof, "__dict__")
+
+
+def test_verify_batch_matches_verify():
+    tree = MrkleTree.from_leaves(["a", "b", "c", "d"])
+    proof = tree.generate_proof(1)
+    candidates = [tree[0], tree[1], tree[1].digest(), tree[1].hexdigest(), tree[2]]
+    assert proof.verify_batch(candidates) == [proof.verify(c) for c in candidates]
+    assert proof.verify_batch([]) == []
+    with pytest.raises(ProofError):
+        proof.verify_batch([[tree[0], tree[1]]])
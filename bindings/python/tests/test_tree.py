@@ -1,12 +1,22 @@
+import hashlib
+import json
+import sys
 import pytest
+import mrkle
+from array import array
+from mrkle.node import MrkleNode
 from mrkle.tree import MrkleTree
 from mrkle.crypto import Sha1
+from mrkle.utils import unflatten
 
 
 def test_empty_tree():
     tree = MrkleTree.from_leaves([])
     assert tree.is_empty()
     assert len(tree) == 0
+    assert tree.root() is None
+    with pytest.raises(mrkle.TreeError):
+        tree.try_root()
 
 
 def test_empty_dict():
@@ -56,6 +66,33 @@ def test_from_dict_flattened():
     assert len(tree) == 4
 
 
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"a.a": b"let", "a.b": b"a", "a.c.b": b"=", "a.c.a": b"1"},
+        {"a.b": b"x", "a.b.c": b"y", "a.d": b"z"},
+        {"a/b": b"x", "a/c/d": b"y", "a/c/e": b"z"},
+        {f"a.{i % 20}.{i}": str(i).encode() for i in range(60)},
+        {**{f"a.{i}": b"x" for i in range(40)}, "a.3.b": b"y", "a.30.b": b"z"},
+        {"a.b.x": b"1", "a.b.y": b"2", "a.c.x": b"3", "a.b.z": b"4"},
+        {"a.b": b"x", "a.b.c": b"y", "a.b.d": b"z", "a.e": b"w"},
+    ],
+)
+def test_from_dict_flattened_matches_unflatten(data):
+    sep = "/" if any("/" in key for key in data) else "."
+    flat = MrkleTree.from_dict(data, format="flatten", sep=sep)
+    nested = MrkleTree.from_dict(unflatten(data, sep=sep))
+    assert flat.root() == nested.root()
+    assert len(flat) == len(nested)
+
+
+def test_unflatten_replaces_leaves_on_the_path():
+    data = {"a.b": b"1", "a.c": b"2", "a": b"3", "a.d": b"4", "e": b"5"}
+    assert unflatten(data) == {"a": {"d": b"4"}, "e": b"5"}
+    data = {"a.b.c": b"1", "a.b": b"2", "a.b.d": b"3", "a.e": b"4"}
+    assert unflatten(data) == {"a": {"b": {"d": b"3"}, "e": b"4"}}
+
+
 def test_from_dict_deep_nesting():
     tree = MrkleTree.from_dict({"root": {"level1": {"level2": {"leaf": "deep"}}}})
     assert len(tree) == 4
@@ -103,6 +140,61 @@ def test_leaves_are_leaf_nodes():
         assert leaf.value() is not None
 
 
+def test_leaves_view_indexing():
+    tree = MrkleTree.from_leaves(["a", "b", "c"])
+    leaves = tree.leaves()
+    assert leaves[0].value() == b"a"
+    assert leaves[-1].value() == b"c"
+    assert [leaf.value() for leaf in leaves[1:]] == [b"b", b"c"]
+    assert list(leaves) == [node for node in tree if node.is_leaf()]
+    assert list(leaves) == [leaves[i] for i in range(len(leaves))]
+    assert leaves == tuple(leaves)
+    assert leaves != list(leaves)[::-1]
+    assert leaves != list(leaves)[:2]
+    with pytest.raises(IndexError):
+        leaves[3]
+
+
+def test_leaf_views_compare_across_trees():
+    leaves = MrkleTree.from_leaves(["a", "b", "c"]).leaves()
+    assert leaves == leaves
+    assert leaves == MrkleTree.from_leaves(["a", "b", "c"]).leaves()
+    assert leaves != MrkleTree.from_leaves(["a", "b", "c"], name="sha256").leaves()
+
+
+def test_leaves_wrapped_in_backend():
+    tree = MrkleTree.from_leaves([b"a", b"b", b"c"], name="sha256")
+    wrapped = tree._inner.leaves_wrapped()
+    assert all(type(node) is MrkleNode for node in wrapped)
+    assert [node.value() for node in wrapped] == [b"a", b"b", b"c"]
+
+
+def test_slice_index_follows_list_slicing():
+    tree = MrkleTree.from_leaves([b"a", b"b", b"c", b"d", b"e"])
+    nodes = [tree[i] for i in range(len(tree))]
+    for key in (
+        slice(None, None, -1),
+        slice(1, None, 3),
+        slice(-2, 0, -2),
+        slice(5, 2),
+    ):
+        assert tree[key] == nodes[key]
+
+
+def test_integer_index_returns_single_node():
+    tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    assert type(tree[0]) is MrkleNode
+    assert tree[-1] == tree[len(tree) - 1]
+    assert tree[-1].digest() == tree.root()
+    assert tree[0:2] == [tree[0], tree[1]]
+    assert tree[[0, -1]] == tree[(0, -1)] == [tree[0], tree[-1]]
+    assert tree[range(2)] == tree[0:2]
+    with pytest.raises(IndexError):
+        tree[len(tree)]
+    with pytest.raises(TypeError):
+        tree["0"]
+
+
 def test_empty_tree_no_leaves():
     tree = MrkleTree.from_leaves([])
     assert tree.leaves() == []
@@ -113,6 +205,80 @@ def test_iteration_over_tree():
     tree = MrkleTree.from_leaves(["a", "b", "c"])
     nodes = list(iter(tree))
     assert len(nodes) == len(tree)
+    assert all(type(node) is MrkleNode for node in nodes)
+    assert nodes[0].digest() == tree.root()
+
+
+def test_iteration_spans_drain_chunks():
+    tree = MrkleTree.from_leaves([f"leaf{i}" for i in range(5000)])
+    nodes = list(iter(tree))
+    assert len(nodes) == len(tree)
+    assert nodes[0].digest() == tree.root()
+    assert sum(node.is_leaf() for node in nodes) == 5000
+
+
+def test_iter_digests_after_partial_traversal():
+    tree = MrkleTree.from_leaves([f"leaf{i}" for i in range(300)])
+    expected = [node.digest() for node in tree]
+    nodes = iter(tree)
+    head = [next(nodes).digest() for _ in range(100)]
+    assert head == expected[:100]
+    assert nodes.digests() == b"".join(expected[100:])
+
+
+def test_iter_digests_matches_nodes():
+    tree = MrkleTree.from_leaves(["a", "b", "c", "d", "e"])
+    nodes = iter(tree)
+    first = next(nodes)
+    rest = nodes.digests()
+    assert first.digest() + rest == b"".join(node.digest() for node in tree)
+    assert list(nodes) == []
+    assert iter(tree).digests() == first.digest() + rest
+
+
+def test_iterators_over_one_tree_are_independent():
+    tree = MrkleTree.from_leaves([f"leaf{i}" for i in range(7)])
+    expected = [node.digest() for node in tree]
+    first, second = iter(tree), iter(tree)
+    assert next(first).digest() == expected[0]
+    assert [node.digest() for node in second] == expected
+    assert first.digests() == b"".join(expected[1:])
+    assert [node.digest() for node in tree] == expected
+
+
+def test_override_leaves_dunders_unwrapped():
+    # typing_extensions.override only tags the function; the hot dunders
+    # must stay the plain functions defined on the classes.
+    for cls in (MrkleTree, MrkleNode):
+        for name in ("__eq__", "__hash__", "__repr__"):
+            method = cls.__dict__[name]
+            assert method.__qualname__ == f"{cls.__name__}.{name}"
+            assert not hasattr(method, "__wrapped__")
+
+
+def test_iterator_has_no_instance_dict():
+    tree = MrkleTree.from_leaves(["a", "b"])
+    assert not hasattr(tree, "__dict__")
+    assert not hasattr(iter(tree), "__dict__")
+    assert not hasattr(next(iter(tree)), "__dict__")
+
+
+def test_as_arrays():
+    tree = MrkleTree.from_leaves(["a", "b", "c"])
+    digests, parents = tree.as_arrays()
+    size = tree.dtype().output_size()
+    assert len(digests) == len(tree) * size
+    assert len(parents) == len(tree)
+    for index in range(len(tree)):
+        node = tree[index]
+        assert digests[index * size : (index + 1) * size] == node.digest()
+        assert parents[index] == (-1 if node.parent() is None else node.parent())
+
+
+def test_leaf_digests():
+    tree = MrkleTree.from_leaves(["a", "b", "c"], name="sha256")
+    assert tree.leaf_digests() == b"".join(leaf.digest() for leaf in tree.leaves())
+    assert MrkleTree.from_leaves([]).leaf_digests() == b""
 
 
 def test_filter_leaf_nodes():
@@ -240,6 +406,32 @@ def test_from_iter_leaves():
     assert isinstance(tree, MrkleTree)
 
 
+def test_from_leaves_accepts_any_sequence_kind():
+    leaves = [b"a", "b", bytearray(b"c"), memoryview(b"d")]
+    expected = MrkleTree.from_leaves(leaves)
+    assert MrkleTree.from_leaves(tuple(leaves)) == expected
+    assert MrkleTree.from_leaves(iter(leaves)) == expected
+    assert MrkleTree.from_leaves(x for x in leaves) == expected
+
+
+def test_from_leaves_ignores_overstated_length_hint():
+    class Overstated:
+        def __init__(self, leaves):
+            self._leaves = iter(leaves)
+
+        def __iter__(self):
+            return self
+
+        def __next__(self):
+            return next(self._leaves)
+
+        def __length_hint__(self):
+            return sys.maxsize
+
+    leaves = [b"a", b"b", b"c"]
+    assert MrkleTree.from_leaves(Overstated(leaves)) == MrkleTree.from_leaves(leaves)
+
+
 def test_tree_branch():
     leaves = iter([b"a", b"b", b"c"])
     tree = MrkleTree.from_leaves(leaves)
@@ -268,3 +460,383 @@ def test_tree_branch_root():
     # to iter is the root node.
     for node in branch:
         assert tree[-1] == node
+
+
+@pytest.mark.parametrize("count", [2, 3, 5, 8, 13])
+def test_from_leaves_workers_matches_default(count):
+    leaves = [f"leaf_{i}".encode() for i in range(count)]
+    tree = MrkleTree.from_leaves(leaves)
+    assert MrkleTree.from_leaves(leaves, workers=2) == tree
+
+
+def test_from_leaves_mixed_inputs_match_leaf_digests():
+    leaves = ["a", b"b", bytearray(b"c"), memoryview(b"d")]
+    tree = MrkleTree.from_leaves(leaves, name="SHA256")
+    expected = [MrkleNode.leaf(leaf, name="sha256").digest() for leaf in leaves]
+    assert [leaf.digest() for leaf in tree.leaves()] == expected
+    assert MrkleTree.from_leaves(tuple(leaves), name="sha256") == tree
+
+
+def test_from_leaves_odd_carry_root():
+    tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    lhs = Sha1()
+    lhs.update(Sha1.digest(b"a"))
+    lhs.update(Sha1.digest(b"b"))
+    root = Sha1()
+    root.update(Sha1.digest(b"c"))
+    root.update(lhs.finalize())
+    assert tree.root() == root.finalize()
+
+
+@pytest.mark.parametrize("count", [3, 5, 6, 7, 9, 1000])
+def test_from_leaves_adds_no_padding_nodes(count):
+    tree = MrkleTree.from_leaves([f"{i}" for i in range(count)])
+    assert len(tree) == 2 * count - 1
+    assert len(tree.leaves()) == count
+
+
+def test_from_leaves_from_several_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    batches = [[f"{i}-{j}" for j in range(2048)] for i in range(8)]
+    expected = [MrkleTree.from_leaves(batch, name="sha256") for batch in batches]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        trees = list(
+            pool.map(lambda batch: MrkleTree.from_leaves(batch, name="sha256"), batches)
+        )
+    assert trees == expected
+
+
+def test_from_dict_workers_matches_default():
+    data = {"root": {"branch1": {"a": "1", "b": "2"}, "branch2": {"c": "3", "d": "4"}}}
+    assert MrkleTree.from_dict(data, workers=2) == MrkleTree.from_dict(data)
+
+
+def test_from_dict_invalid_workers():
+    with pytest.raises(ValueError):
+        _ = MrkleTree.from_dict({"a": {"b": b"1"}}, workers=0)
+
+
+def test_digest_names_resolve_case_insensitively():
+    data = {"root": {"a": b"1", "b": b"2"}}
+    expected = MrkleTree.from_dict(data, name="blake2b512")
+    assert MrkleTree.from_dict(data, name="BLAKE2B") == expected
+    assert MrkleTree.loads(expected.dumps(), name="Blake2b") == expected
+    with pytest.raises(ValueError):
+        MrkleTree.from_dict(data, name="md5")
+
+
+@pytest.mark.parametrize("name", ["sha1", "sha256", "keccak512", "blake3"])
+def test_loads_detects_digest_from_payload(name):
+    expected = MrkleTree.from_leaves(["a", "b", "c"], name=name)
+    assert MrkleTree.loads(expected.dumps()) == expected
+    assert MrkleTree.loads(expected.dumps(encoding="bytes")) == expected
+    with pytest.raises(ValueError, match="hash_type"):
+        MrkleTree.loads('{"hash": "00", "value": "a"}')
+
+
+def test_loads_detects_digest_in_any_key_order():
+    expected = MrkleTree.from_leaves(["a", "b", "c"], name="sha256")
+    payload = json.loads(expected.dumps())
+    assert MrkleTree.loads(expected.dumps(indent=2)) == expected
+    hash_type = payload.pop("hash_type")
+    assert MrkleTree.loads(json.dumps({**payload, "hash_type": hash_type})) == expected
+
+
+def test_loads_tells_leaves_from_parents_by_their_fields():
+    expected = MrkleTree.from_leaves(["a", "b", "c"], name="sha256")
+    payload = json.loads(expected.dumps())
+    payload["comment"] = "ignored"
+    assert MrkleTree.loads(json.dumps(payload)) == expected
+    del payload["children"]
+    with pytest.raises(mrkle.SerdeError):
+        MrkleTree.loads(json.dumps(payload))
+
+
+def test_loads_from_several_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    trees = [MrkleTree.from_leaves([f"{i}-{j}" for j in range(64)]) for i in range(8)]
+    payloads = [tree.dumps(encoding="bytes") for tree in trees]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert list(pool.map(MrkleTree.loads, payloads)) == trees
+
+
+def test_loads_checks_format_before_decoding():
+    tree = MrkleTree.from_leaves(["a", "b"], name="sha256")
+    data = tree.dumps()
+    assert MrkleTree.loads(data, name="sha256", format="json") == tree
+    with pytest.raises(ValueError, match="serialization format"):
+        MrkleTree.loads(data, format="cbor")
+    with pytest.raises(ValueError, match="serialization format"):
+        MrkleTree.loads(data, name="sha256", format="cbor")
+
+
+@pytest.mark.parametrize("count", [2, 3, 4, 6, 7, 9, 33])
+def test_sha256_internal_nodes_match_hashlib(count):
+    leaves = [f"leaf{i}".encode() for i in range(count)]
+    level = [hashlib.sha256(leaf).digest() for leaf in leaves]
+    while len(level) > 1:
+        carry = [level.pop()] if len(level) % 2 else []
+        pairs = zip(level[0::2], level[1::2])
+        level = carry + [hashlib.sha256(a + b).digest() for a, b in pairs]
+    tree = MrkleTree.from_leaves(leaves, name="sha256")
+    assert tree.root() == level[0]
+
+
+@pytest.mark.parametrize("name", ["sha224", "sha384", "sha512"])
+@pytest.mark.parametrize("count", [2, 3, 9])
+def test_sha2_internal_nodes_match_hashlib(name, count):
+    new = getattr(hashlib, name)
+    leaves = [f"leaf{i}".encode() for i in range(count)]
+    level = [new(leaf).digest() for leaf in leaves]
+    while len(level) > 1:
+        carry = [level.pop()] if len(level) % 2 else []
+        pairs = zip(level[0::2], level[1::2])
+        level = carry + [new(a + b).digest() for a, b in pairs]
+    tree = MrkleTree.from_leaves(leaves, name=name)
+    assert tree.root() == level[0]
+
+
+@pytest.mark.parametrize("length", [0, 1, 55, 56, 63, 64, 100])
+def test_sha256_leaves_match_hashlib_around_block_boundary(length):
+    leaves = [bytes([i]) * length for i in range(7)]
+    tree = MrkleTree.from_leaves(leaves, name="sha256")
+    assert [leaf.digest() for leaf in tree.leaves()] == [
+        hashlib.sha256(leaf).digest() for leaf in leaves
+    ]
+
+
+@pytest.mark.parametrize("count", [1, 4, 5, 8, 9, 17, 40])
+@pytest.mark.parametrize("mixed", [False, True])
+def test_blake2b_tree_matches_hashlib(count, mixed):
+    leaves = [bytes([i]) * (i % 3 * 70 if mixed else 200) for i in range(count)]
+    level = [hashlib.blake2b(leaf).digest() for leaf in leaves]
+    while len(level) > 1:
+        carry = [level.pop()] if len(level) % 2 else []
+        pairs = zip(level[0::2], level[1::2])
+        level = carry + [hashlib.blake2b(a + b).digest() for a, b in pairs]
+    tree = MrkleTree.from_leaves(leaves, name="blake2b")
+    assert tree.root() == level[0]
+
+
+def test_constructors_resolve_backends_without_building_digests(monkeypatch):
+    import mrkle.tree
+
+    def fail(*args, **kwargs):
+        raise AssertionError("constructors must not build a digest")
+
+    monkeypatch.setattr(mrkle.tree, "new", fail)
+    tree = MrkleTree.from_leaves([b"a", b"b"], name="SHA256")
+    assert MrkleTree.from_dict({"root": {"a": b"a"}}, name="sha256").root()
+    assert MrkleTree.loads(tree.dumps()) == tree
+    assert tree.generate_proof(0).verify(tree[0])
+
+
+def test_dtype_names_are_interned_map_keys():
+    from mrkle._tree import _TREE_MAP_RAW
+
+    for name in ("sha1", "sha256", "blake3"):
+        dtype_name = MrkleTree.from_leaves([b"a"], name=name)._dtype_name
+        assert dtype_name is sys.intern(dtype_name)
+        assert any(key is dtype_name for key in _TREE_MAP_RAW)
+
+
+def test_dtype_name_formatting_and_equality():
+    tree = MrkleTree.from_leaves([b"a", b"b"], name="sha256")
+    assert repr(tree) == f"<sha256 mrkle.tree.MrkleTree object at {hex(id(tree))}>"
+    assert str(tree).endswith("dtype=sha256)")
+    assert str(tree).startswith(f"MrkleTree(root={tree.root()[:2].hex()}, length=3,")
+    assert (
+        str(MrkleTree.from_leaves([])) == "MrkleTree(root=None, length=0, dtype=sha1)"
+    )
+    assert tree != MrkleTree.from_leaves([b"a", b"b"], name="sha224")
+    digest = tree.dtype()
+    digest.update(b"a")
+    assert tree.dtype().finalize() == hashlib.sha256(b"").digest()
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 5])
+def test_from_packed_matches_from_leaves(count):
+    leaves = [f"leaf{i}".encode() * i for i in range(count)]
+    offsets = [0]
+    for leaf in leaves:
+        offsets.append(offsets[-1] + len(leaf))
+    data = b"".join(leaves)
+    expected = MrkleTree.from_leaves(leaves, name="sha256")
+    assert MrkleTree.from_packed(data, offsets, name="sha256") == expected
+    assert MrkleTree.from_packed(data, array("Q", offsets), "sha256") == expected
+    packed = MrkleTree.from_packed(bytearray(data), array("q", offsets), "sha256")
+    assert packed == expected
+
+
+def test_from_packed_fixed_width_rows():
+    leaves = [hashlib.sha256(bytes([i])).digest() for i in range(7)]
+    data = b"".join(leaves)
+    expected = MrkleTree.from_leaves(leaves, name="sha256")
+    assert MrkleTree.from_packed(data, name="sha256", width=32) == expected
+    rows = memoryview(bytearray(data)).cast("B", (7, 32))
+    assert MrkleTree.from_packed(rows, name="sha256") == expected
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(data, width=31)
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(data, [0, 32], width=32)
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(data)
+
+
+def test_from_leaf_digests_matches_from_leaves():
+    tree = MrkleTree.from_leaves([f"leaf{i}" for i in range(5)], name="sha256")
+    digests = tree.leaf_digests()
+    assert MrkleTree.from_leaf_digests(digests, "sha256") == tree
+    assert MrkleTree.from_leaf_digests(memoryview(digests), "sha256") == tree
+    assert MrkleTree.from_leaf_digests(array("B", digests), "sha256") == tree
+    rows_view = memoryview(bytearray(digests)).cast("B", (5, 32))
+    assert MrkleTree.from_leaf_digests(rows_view, "sha256") == tree
+    assert MrkleTree.from_leaf_digests(array("Q", digests), "sha256") == tree
+    rows = [leaf.digest() for leaf in tree.leaves()]
+    rebuilt = MrkleTree.from_leaf_digests(rows, "sha256")
+    assert rebuilt == tree
+    assert [leaf.value() for leaf in rebuilt.leaves()] == rows
+    assert rebuilt.generate_proof(0).verify(rows[0])
+    with pytest.raises(ValueError):
+        MrkleTree.from_leaf_digests(digests[:-1], "sha256")
+    with pytest.raises(ValueError):
+        MrkleTree.from_leaf_digests([rows[0], rows[1][:-1]], "sha256")
+
+
+def test_from_packed_rejects_bad_offsets():
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", [0, 2, 1])
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", [0, 4])
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", array("q", [0, -1]))
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", [0, -1, 3])
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", array("q", [0, -1, 3]))
+
+
+def test_from_packed_rejects_uncovered_data():
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", [1, 2, 3])
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", array("Q", [0, 1, 2]))
+    with pytest.raises(ValueError):
+        MrkleTree.from_packed(b"abc", [])
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 8])
+def test_replace_leaves_matches_rebuild(count):
+    leaves = [f"leaf{i}".encode() for i in range(count)]
+    tree = MrkleTree.from_leaves(leaves, name="sha256")
+    updated = list(leaves)
+    updated[count // 2] = b"changed"
+    expected = MrkleTree.from_leaves(updated, name="sha256")
+    assert tree.replace_leaves({count // 2: b"changed"}) == expected
+    assert tree == MrkleTree.from_leaves(leaves, name="sha256")
+
+
+def test_replace_leaves_errors():
+    tree = MrkleTree.from_leaves([b"a", b"b"])
+    with pytest.raises(IndexError):
+        tree.replace_leaves({2: b"c"})
+
+
+def test_replace_leaves_keeps_dict_shape():
+    nested = MrkleTree.from_dict({"root": {"a": {"b": "1", "c": "2"}, "d": "3"}})
+    original = nested.leaves()[0].value()
+    replaced = nested.replace_leaves({0: b"x"})
+    assert replaced.leaves()[0].value() == b"x"
+    assert replaced.root() != nested.root()
+    assert replaced.replace_leaves({0: original}) == nested
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 64])
+def test_update_matches_rebuild(count):
+    leaves = [f"leaf{i}".encode() for i in range(count)]
+    tree = MrkleTree.from_leaves(leaves, name="sha256")
+    updated = list(leaves)
+    updated[0] = b"changed"
+    expected = MrkleTree.from_leaves(updated, name="sha256")
+    assert MrkleTree.update(tree, updated) == expected
+    assert MrkleTree.update(tree, leaves) == tree
+    with pytest.raises(ValueError):
+        MrkleTree.update(tree, leaves + [b"extra"])
+
+
+def test_from_leaves_string_inputs_match_encoded():
+    leaves = [f"path/{i}/ü" for i in range(50)]
+    expected = MrkleTree.from_leaves([leaf.encode() for leaf in leaves])
+    assert MrkleTree.from_leaves(leaves) == expected
+    assert MrkleTree.from_leaves(tuple(leaves)) == expected
+    assert MrkleTree.from_leaves(leaf for leaf in leaves) == expected
+
+
+def test_tree_init_accepts_only_backend_trees():
+    tree = MrkleTree.from_leaves([b"a", b"b"])
+    assert MrkleTree(tree._inner) == tree
+    with pytest.raises(TypeError):
+        MrkleTree(tree[0]._inner)
+    with pytest.raises(TypeError):
+        MrkleTree(object())
+
+
+def test_tree_hash_and_equality():
+    first = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    second = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    assert hash(first) == hash(second)
+    assert len({first, second, MrkleTree.from_leaves([b"a"])}) == 2
+    assert hash(MrkleTree.from_leaves([])) == hash(MrkleTree.from_leaves([]))
+    assert hash(first) == hash(first) == hash(first._inner)
+
+
+@pytest.mark.parametrize("name", ["sha1", "sha256", "blake2b512"])
+def test_tree_hash_is_the_root_prefix(name):
+    tree = MrkleTree.from_leaves([b"a", b"b", b"c"], name=name)
+    # The leading digest bytes are used as they are, with no further mixing.
+    for digest, value in ((tree.root(), hash(tree)), (tree[0].digest(), hash(tree[0]))):
+        assert value % 2**64 == int.from_bytes(digest[:8], sys.byteorder)
+
+
+def test_tree_root_is_cached():
+    tree = MrkleTree.from_leaves([b"a", b"b", b"c"])
+    assert tree.root() is tree.root()
+    assert tree.root() is tree.try_root()
+    assert MrkleTree.from_leaves([]).root() is None
+
+
+def test_equal_roots_with_different_shapes_are_unequal():
+    leaves = [b"a", b"b", b"c", b"d"]
+    digests = [hashlib.sha1(leaf).digest() for leaf in leaves]
+    tree = MrkleTree.from_leaves(leaves)
+    # Leaves holding the concatenated child digests reproduce the root.
+    lifted = MrkleTree.from_leaves([digests[0] + digests[1], digests[2] + digests[3]])
+    assert tree.root() == lifted.root()
+    assert tree != lifted
+
+
+def test_equal_trees_with_different_storage_order():
+    tree = MrkleTree.from_leaves([f"leaf-{i}" for i in range(9)], name="sha256")
+    # Decoding rebuilds the tree depth-first, so its nodes sit in a
+    # different order than the level-by-level build stores them in.
+    decoded = MrkleTree.loads(tree.dumps())
+    assert [node.digest() for node in decoded] == [node.digest() for node in tree]
+    assert decoded == tree and tree == decoded
+    assert tree == MrkleTree.from_leaves([f"leaf-{i}" for i in range(9)], name="sha256")
+
+
+def test_print_to_streams_the_pretty_print():
+    import io
+
+    tree = MrkleTree.from_leaves([f"leaf-{i}" for i in range(33)], name="sha256")
+    buffer = io.StringIO()
+    tree.print_to(buffer)
+    assert buffer.getvalue() == tree.to_string() + "\n"
+
+    chunks = []
+    tree._inner.write_string(chunks.append, chunk_size=64)
+    assert "".join(chunks) == tree.to_string()
+    with pytest.raises(mrkle.TreeError):
+        MrkleTree.from_leaves([]).print_to(buffer)
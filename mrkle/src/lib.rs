@@ -277,6 +277,35 @@ where
             children: Vec::with_capacity(0),
         }
     }
+
+    /// Creates a new leaf node with a pre-computed hash, without verifying it.
+    ///
+    /// Unlike [`MrkleNode::leaf_with_hash`], the payload is **not** re-hashed, so
+    /// the caller is responsible for guaranteeing that `hash` is the digest of
+    /// `payload`. This is intended for batch construction paths where every
+    /// leaf digest has already been computed in a single pass.
+    ///
+    /// # Examples
+    ///
+    /// ```rust
+    /// use mrkle::{MrkleNode, Node};
+    /// use sha2::{Sha256, Digest};
+    ///
+    /// let data = b"Hello, world!";
+    /// let hash = Sha256::digest(data);
+    /// let leaf = MrkleNode::<_, Sha256>::leaf_with_hash_unchecked(*data, hash);
+    /// assert!(leaf.is_leaf());
+    /// ```
+    #[inline]
+    pub fn leaf_with_hash_unchecked(payload: T, hash: GenericArray<D>) -> Self {
+        let payload = Payload::Leaf(payload);
+        Self {
+            payload,
+            hash,
+            parent: None,
+            children: Vec::with_capacity(0),
+        }
+    }
 }
 
 impl<T, D: Digest, Ix: IndexType> MrkleNode<T, D, Ix> {
@@ -585,9 +614,12 @@ impl<T, D: Digest, Ix: IndexType> core::fmt::Debug for MrkleNode<T, D, Ix> {
 // Display implementation - user-friendly representation
 impl<T, D: Digest, Ix: IndexType> Display for MrkleNode<T, D, Ix> {
     fn fmt(&self, f: &mut core::fmt::Formatter<'_>) -> core::fmt::Result {
+        // Written straight to the formatter: a tree's pretty print formats
+        // every node, so an intermediate string each would add up.
         let hash_bytes = self.hash.as_slice();
-        let hash_preview = if hash_bytes.len() >= 4 {
-            format!(
+        if hash_bytes.len() >= 4 {
+            write!(
+                f,
                 "{:02x}{:02x}...{:02x}{:02x}",
                 hash_bytes[0],
                 hash_bytes[1],
@@ -595,10 +627,8 @@ impl<T, D: Digest, Ix: IndexType> Display for MrkleNode<T, D, Ix> {
                 hash_bytes[hash_bytes.len() - 1]
             )
         } else {
-            format!("{:02x?}", hash_bytes)
-        };
-
-        write!(f, "{}", hash_preview)
+            write!(f, "{:02x?}", hash_bytes)
+        }
     }
 }
 